@@ -0,0 +1,71 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Multi-GPU Sampling Scaling Benchmark
+Tick latency of NVIDIAMonitor for 1/2/4/8 simulated GPUs, devices queried
+one after another vs concurrently. The mock pynvml sleeps per call - like
+the real library, it releases the GIL while the driver works. One process
+uses every GPU, so psutil enrichment per tick shows the pid dedup.
+
+Usage: python benchmarks/bench_gpu_concurrency.py [ticks] [latency_us]
+"""
+
+import os
+import sys
+import time
+from threading import Lock
+from types import SimpleNamespace
+
+from bench_nvml_sampling import MB, MockNVML, make_monitor
+
+GPU_COUNTS = (1, 2, 4, 8)
+
+
+class SleepingNVML(MockNVML):
+    """MockNVML whose calls sleep (GIL released) and report one job spanning all GPUs"""
+
+    def __init__(self, gpu_count: int, latency: float):
+        super().__init__(gpu_count, latency)
+        self._lock = Lock()
+
+    def _call(self, name: str):
+        with self._lock:
+            self.calls[name] += 1
+        time.sleep(self.latency)
+
+    def nvmlDeviceGetComputeRunningProcesses(self, handle):
+        self._call('nvmlDeviceGetComputeRunningProcesses')
+        return [SimpleNamespace(pid=os.getpid(), usedGpuMemory=20000 * MB)]
+
+
+def measure(monitor, ticks: int):
+    monitor.get_gpu_metrics()  # First tick learns which fields are unsupported
+    pool = monitor._process_pool
+    reads_before = pool.read_count
+    started = time.perf_counter()
+    for _ in range(ticks):
+        metrics = monitor.get_gpu_metrics()
+    elapsed = (time.perf_counter() - started) / ticks
+    assert all(gpu.processes for gpu in metrics)
+    return elapsed, (pool.read_count - reads_before) / ticks
+
+
+def main():
+    ticks = int(sys.argv[1]) if len(sys.argv) > 1 else 20
+    latency_us = float(sys.argv[2]) if len(sys.argv) > 2 else 500.0
+
+    print(f"🏗️ Mock NVML: {latency_us:.0f}µs per call (sleeping), {ticks} ticks")
+    print(f"   {'GPUs':>4} {'serial ms':>10} {'concurrent ms':>14} {'speed-up':>9} {'psutil reads/tick':>18}")
+    for gpu_count in GPU_COUNTS:
+        serial = make_monitor(SleepingNVML(gpu_count, latency_us / 1_000_000))
+        serial.concurrent_devices = False
+        serial_seconds, _ = measure(serial, ticks)
+
+        concurrent = make_monitor(SleepingNVML(gpu_count, latency_us / 1_000_000))
+        concurrent_seconds, reads = measure(concurrent, ticks)
+
+        print(f"📊 {gpu_count:>4} {serial_seconds * 1000:10.2f} {concurrent_seconds * 1000:14.2f} "
+              f"{serial_seconds / concurrent_seconds:8.1f}x {reads:18.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,201 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - NVML Sampling Benchmark
+One call per metric per tick (the pre-cache NVIDIAMonitor pattern, plus
+clocks/throttle/PCIe) vs cached handles + batched field values, against a
+mock pynvml that counts calls and sleeps a fixed latency per call.
+
+Usage: python benchmarks/bench_nvml_sampling.py [gpu_count] [ticks] [latency_us]
+"""
+
+import os
+import sys
+import time
+from collections import Counter
+from types import SimpleNamespace
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'backend'))
+
+from monitoring.gpu_monitor import NVIDIAMonitor
+
+MB = 1024 * 1024
+
+
+class MockNVMLError(Exception):
+    def __init__(self, value):
+        super().__init__(f"NVML error {value}")
+        self.value = value
+
+
+class MockNVML:
+    """pynvml stand-in for passively cooled datacenter GPUs (no fan reading)"""
+    NVMLError = MockNVMLError
+    NVML_TEMPERATURE_GPU = 0
+    NVML_CLOCK_GRAPHICS, NVML_CLOCK_SM, NVML_CLOCK_MEM = 0, 1, 2
+    NVML_PCIE_UTIL_TX_BYTES, NVML_PCIE_UTIL_RX_BYTES = 0, 1
+    NVML_ERROR_UNINITIALIZED = 1
+    NVML_ERROR_INVALID_ARGUMENT = 2
+    NVML_ERROR_NOT_SUPPORTED = 3
+    NVML_ERROR_NOT_FOUND = 6
+    NVML_ERROR_FUNCTION_NOT_FOUND = 13
+    NVML_ERROR_GPU_IS_LOST = 15
+    NVML_FI_DEV_MEMORY_TEMP = 82
+    NVML_FI_DEV_POWER_INSTANT = 186
+
+    def __init__(self, gpu_count: int, latency: float):
+        self.gpu_count = gpu_count
+        self.latency = latency
+        self.calls = Counter()
+
+    def _call(self, name: str):
+        self.calls[name] += 1
+        deadline = time.perf_counter() + self.latency
+        while time.perf_counter() < deadline:
+            pass
+
+    def nvmlInit(self):
+        self._call('nvmlInit')
+
+    def nvmlDeviceGetCount(self):
+        self._call('nvmlDeviceGetCount')
+        return self.gpu_count
+
+    def nvmlDeviceGetHandleByIndex(self, index):
+        self._call('nvmlDeviceGetHandleByIndex')
+        return index
+
+    def nvmlDeviceGetName(self, handle):
+        self._call('nvmlDeviceGetName')
+        return "NVIDIA A100-SXM4-80GB"
+
+    def nvmlDeviceGetUUID(self, handle):
+        self._call('nvmlDeviceGetUUID')
+        return f"GPU-{handle:08d}"
+
+    def nvmlDeviceGetPciInfo(self, handle):
+        self._call('nvmlDeviceGetPciInfo')
+        return SimpleNamespace(busId=f"00000000:{handle + 1:02x}:00.0")
+
+    def nvmlSystemGetDriverVersion(self):
+        self._call('nvmlSystemGetDriverVersion')
+        return "550.54.14"
+
+    def nvmlDeviceGetPowerManagementLimitConstraints(self, handle):
+        self._call('nvmlDeviceGetPowerManagementLimitConstraints')
+        return (100000, 400000)
+
+    def nvmlDeviceGetFieldValues(self, handle, field_ids):
+        self._call('nvmlDeviceGetFieldValues')
+        values = {self.NVML_FI_DEV_POWER_INSTANT: 250000, self.NVML_FI_DEV_MEMORY_TEMP: 58}
+        return [SimpleNamespace(nvmlReturn=0, valueType=1, value=SimpleNamespace(uiVal=values[field_id]))
+                for field_id in field_ids]
+
+    def nvmlDeviceGetMemoryInfo(self, handle):
+        self._call('nvmlDeviceGetMemoryInfo')
+        return SimpleNamespace(used=30000 * MB, total=80000 * MB)
+
+    def nvmlDeviceGetUtilizationRates(self, handle):
+        self._call('nvmlDeviceGetUtilizationRates')
+        return SimpleNamespace(gpu=95, memory=60)
+
+    def nvmlDeviceGetTemperature(self, handle, sensor):
+        self._call('nvmlDeviceGetTemperature')
+        return 64
+
+    def nvmlDeviceGetFanSpeed(self, handle):
+        self._call('nvmlDeviceGetFanSpeed')
+        raise MockNVMLError(self.NVML_ERROR_NOT_SUPPORTED)
+
+    def nvmlDeviceGetPowerUsage(self, handle):
+        self._call('nvmlDeviceGetPowerUsage')
+        return 250000
+
+    def nvmlDeviceGetClockInfo(self, handle, clock):
+        self._call('nvmlDeviceGetClockInfo')
+        return 1410
+
+    def nvmlDeviceGetCurrentClocksThrottleReasons(self, handle):
+        self._call('nvmlDeviceGetCurrentClocksThrottleReasons')
+        return 0x1
+
+    def nvmlDeviceGetPcieThroughput(self, handle, counter):
+        self._call('nvmlDeviceGetPcieThroughput')
+        return 1200
+
+    def nvmlDeviceGetComputeRunningProcesses(self, handle):
+        self._call('nvmlDeviceGetComputeRunningProcesses')
+        return []
+
+
+def legacy_tick(nvml: MockNVML):
+    """Every attribute, static or not, fetched with its own call on every tick"""
+    metrics = []
+    for index in range(nvml.nvmlDeviceGetCount()):
+        handle = nvml.nvmlDeviceGetHandleByIndex(index)
+        gpu = {'name': nvml.nvmlDeviceGetName(handle)}
+        gpu['memory'] = nvml.nvmlDeviceGetMemoryInfo(handle)
+        gpu['utilization'] = nvml.nvmlDeviceGetUtilizationRates(handle)
+        for key, read in (
+            ('temperature_c', lambda: nvml.nvmlDeviceGetTemperature(handle, nvml.NVML_TEMPERATURE_GPU)),
+            ('fan_speed_percent', lambda: nvml.nvmlDeviceGetFanSpeed(handle)),
+            ('power_draw_watts', lambda: nvml.nvmlDeviceGetPowerUsage(handle) / 1000.0),
+            ('power_limit_watts', lambda: nvml.nvmlDeviceGetPowerManagementLimitConstraints(handle)[1] / 1000.0),
+            ('clock_graphics_mhz', lambda: nvml.nvmlDeviceGetClockInfo(handle, nvml.NVML_CLOCK_GRAPHICS)),
+            ('clock_sm_mhz', lambda: nvml.nvmlDeviceGetClockInfo(handle, nvml.NVML_CLOCK_SM)),
+            ('clock_memory_mhz', lambda: nvml.nvmlDeviceGetClockInfo(handle, nvml.NVML_CLOCK_MEM)),
+            ('throttle_reasons', lambda: nvml.nvmlDeviceGetCurrentClocksThrottleReasons(handle)),
+            ('pcie_tx_kbps', lambda: nvml.nvmlDeviceGetPcieThroughput(handle, nvml.NVML_PCIE_UTIL_TX_BYTES)),
+            ('pcie_rx_kbps', lambda: nvml.nvmlDeviceGetPcieThroughput(handle, nvml.NVML_PCIE_UTIL_RX_BYTES)),
+        ):
+            try:
+                gpu[key] = read()
+            except MockNVMLError:
+                gpu[key] = None
+        gpu['processes'] = nvml.nvmlDeviceGetComputeRunningProcesses(handle)
+        gpu['driver_version'] = nvml.nvmlSystemGetDriverVersion()
+        metrics.append(gpu)
+    return metrics
+
+
+def make_monitor(nvml: MockNVML) -> NVIDIAMonitor:
+    real = sys.modules.get('pynvml')
+    sys.modules['pynvml'] = nvml
+    try:
+        return NVIDIAMonitor()
+    finally:
+        if real is not None:
+            sys.modules['pynvml'] = real
+        else:
+            del sys.modules['pynvml']
+
+
+def run(label: str, tick, nvml: MockNVML, ticks: int):
+    nvml.calls.clear()
+    started = time.perf_counter()
+    for _ in range(ticks):
+        metrics = tick()
+    elapsed = (time.perf_counter() - started) / ticks
+    assert len(metrics) == nvml.gpu_count, f"{label} returned {len(metrics)} GPUs"
+    calls = sum(nvml.calls.values()) / ticks
+    print(f"📊 {label:<28} {elapsed * 1000:8.2f} ms/tick {calls:7.1f} NVML calls/tick")
+    return elapsed, calls
+
+
+def main():
+    gpu_count = int(sys.argv[1]) if len(sys.argv) > 1 else 8
+    ticks = int(sys.argv[2]) if len(sys.argv) > 2 else 50
+    latency_us = float(sys.argv[3]) if len(sys.argv) > 3 else 100.0
+
+    print(f"🏗️ Mock NVML: {gpu_count} GPUs, {latency_us:.0f}µs per call, {ticks} ticks")
+    legacy_nvml = MockNVML(gpu_count, latency_us / 1_000_000)
+    legacy_seconds, legacy_calls = run("per-call (legacy)", lambda: legacy_tick(legacy_nvml), legacy_nvml, ticks)
+
+    nvml = MockNVML(gpu_count, latency_us / 1_000_000)
+    monitor = make_monitor(nvml)
+    monitor.get_gpu_metrics()  # First tick learns which fields are unsupported
+    batched_seconds, batched_calls = run("cached + field values", monitor.get_gpu_metrics, nvml, ticks)
+
+    print(f"🚀 {legacy_calls / batched_calls:.1f}x fewer calls, {legacy_seconds / batched_seconds:.1f}x faster")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,104 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Process Scan Benchmark
+Direct /proc scanner vs psutil.process_iter on a synthetic 10k-pid /proc tree
+
+Usage: python benchmarks/bench_process_scan.py [pid_count] [rounds]
+"""
+
+import os
+import sys
+import shutil
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', 'src', 'backend'))
+
+import psutil
+
+from monitoring.process_scanner import ProcProcessScanner
+
+PSUTIL_ATTRS = ['pid', 'name', 'cpu_percent', 'memory_info', 'memory_percent', 'status',
+                'username', 'cmdline', 'exe', 'create_time']
+
+
+def build_fake_proc(root: str, pid_count: int):
+    """Write a minimal Linux /proc tree that both readers understand"""
+    uid = os.getuid()
+    with open(os.path.join(root, 'stat'), 'w') as f:
+        f.write("cpu  100 0 100 1000 0 0 0 0 0 0\ncpu0 100 0 100 1000 0 0 0 0 0 0\n"
+                f"btime {int(time.time()) - 86400}\n")
+    with open(os.path.join(root, 'meminfo'), 'w') as f:
+        f.write("MemTotal:       16384000 kB\nMemFree:         8192000 kB\n"
+                "MemAvailable:   10240000 kB\nBuffers:          512000 kB\n"
+                "Cached:          2048000 kB\nShmem:             64000 kB\n"
+                "Active:          4096000 kB\nInactive:        2048000 kB\n")
+    with open(os.path.join(root, 'uptime'), 'w') as f:
+        f.write("86400.00 80000.00\n")
+    os.makedirs(os.path.join(root, 'self'), exist_ok=True)
+    shutil.copy(os.path.join(root, 'stat'), os.path.join(root, 'self', 'stat'))
+
+    for pid in range(1, pid_count + 1):
+        pid_dir = os.path.join(root, str(pid))
+        os.mkdir(pid_dir)
+        name = f"worker-{pid % 97}"
+        utime, stime = pid * 3, pid
+        with open(os.path.join(pid_dir, 'stat'), 'w') as f:
+            f.write(f"{pid} ({name}) S 1 {pid} {pid} 0 -1 4194560 100 0 0 0 "
+                    f"{utime} {stime} 0 0 20 0 1 0 {pid * 10} 10485760 {pid % 500 + 100} "
+                    "18446744073709551615 1 1 0 0 0 0 0 0 0 0 0 0 17 0 0 0 0 0 0\n")
+        with open(os.path.join(pid_dir, 'statm'), 'w') as f:
+            f.write(f"2560 {pid % 500 + 100} 50 10 0 200 0\n")
+        with open(os.path.join(pid_dir, 'status'), 'w') as f:
+            f.write(f"Name:\t{name}\nState:\tS (sleeping)\nUid:\t{uid}\t{uid}\t{uid}\t{uid}\n"
+                    f"Gid:\t0\t0\t0\t0\n")
+        with open(os.path.join(pid_dir, 'cmdline'), 'wb') as f:
+            f.write(f"/usr/bin/{name}\0--serve\0--port={pid}\0".encode())
+
+
+def bench_proc_scanner(root: str, rounds: int) -> float:
+    scanner = ProcProcessScanner(proc_root=root)
+    scanner.scan()
+    started = time.perf_counter()
+    for _ in range(rounds):
+        samples = scanner.scan()
+    elapsed = (time.perf_counter() - started) / rounds
+    assert samples, "scanner found no processes"
+    return elapsed
+
+
+def bench_psutil(root: str, rounds: int) -> float:
+    original = psutil.PROCFS_PATH
+    psutil.PROCFS_PATH = root
+    try:
+        list(psutil.process_iter(PSUTIL_ATTRS))
+        started = time.perf_counter()
+        for _ in range(rounds):
+            infos = [proc.info for proc in psutil.process_iter(PSUTIL_ATTRS)]
+        elapsed = (time.perf_counter() - started) / rounds
+        assert infos, "psutil found no processes"
+        return elapsed
+    finally:
+        psutil.PROCFS_PATH = original
+
+
+def main():
+    pid_count = int(sys.argv[1]) if len(sys.argv) > 1 else 10000
+    rounds = int(sys.argv[2]) if len(sys.argv) > 2 else 3
+
+    root = tempfile.mkdtemp(prefix='hoof-hearted-proc-')
+    try:
+        print(f"🏗️ Building synthetic /proc with {pid_count} pids in {root}")
+        build_fake_proc(root, pid_count)
+
+        proc_seconds = bench_proc_scanner(root, rounds)
+        psutil_seconds = bench_psutil(root, rounds)
+
+        print(f"📊 ProcProcessScanner.scan(): {proc_seconds * 1000:8.1f} ms/tick")
+        print(f"📊 psutil.process_iter():     {psutil_seconds * 1000:8.1f} ms/tick")
+        print(f"🚀 Speedup: {psutil_seconds / proc_seconds:.1f}x")
+    finally:
+        shutil.rmtree(root, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
@@ -15,6 +15,7 @@ import time
 from monitoring import GPUMonitoringService
 from monitoring.system_monitor import system_monitor
 from monitoring.real_time_monitor import RealTimeMonitor
+from monitoring.snapshot_store import MetricsSampler, SnapshotStore
 
 # Setup logging
 logging.basicConfig(level=logging.INFO)
@@ -38,12 +39,31 @@ def create_app():
     socketio = SocketIO(app, cors_allowed_origins="*")
     
     # Initialize monitoring services
-    gpu_service = GPUMonitoringService(update_interval=2.0)
+    # GPU driver calls run in a watched child process so a hung driver can't freeze the API
+    gpu_service = GPUMonitoringService(
+        update_interval=2.0,
+        out_of_process=os.getenv('GPU_SAMPLER_PROCESS', 'true').lower() == 'true',
+        sampler_deadline=float(os.getenv('GPU_SAMPLER_DEADLINE', 15.0))
+    )
     app.gpu_service = gpu_service
     app.system_monitor = system_monitor
     
+    # Single background sampler - every endpoint reads its latest snapshot
+    snapshot_store = SnapshotStore()
+    sampler = MetricsSampler(system_monitor, gpu_service, snapshot_store)
+    sampler.start()
+    app.snapshot_store = snapshot_store
+    app.sampler = sampler
+    
+    def current_snapshot():
+        """Latest metrics snapshot (waits briefly only right after startup)"""
+        snapshot = snapshot_store.latest(timeout=10.0)
+        if snapshot is None:
+            raise RuntimeError("No metrics snapshot available yet")
+        return snapshot
+    
     # Initialize real-time monitoring system (Sophie's approved architecture)
-    real_time_monitor = RealTimeMonitor(socketio, gpu_service, system_monitor)
+    real_time_monitor = RealTimeMonitor(socketio, sampler)
     app.real_time_monitor = real_time_monitor
     
     @app.route('/health')
@@ -59,7 +79,9 @@ def create_app():
     @app.route('/api/health')
     def api_health_check():
         """API health check endpoint for frontend"""
-        gpu_status = "available" if gpu_service.is_available() else "unavailable"
+        snapshot = snapshot_store.latest()
+        gpu_available = snapshot.gpu_available if snapshot else gpu_service.is_available()
+        gpu_status = "available" if gpu_available else "unavailable"
         return jsonify({
             'status': 'healthy',
             'service': 'hoof-hearted-backend',
@@ -74,8 +96,9 @@ def create_app():
         """API status endpoint with system information"""
         try:
             # Get basic system info
-            system_summary = system_monitor.get_summary()
-            gpu_summary = gpu_service.get_summary()
+            snapshot = current_snapshot()
+            system_summary = snapshot.system_summary
+            gpu_summary = snapshot.gpu_summary
             
             return jsonify({
                 'api_version': '1.0.0',
@@ -116,7 +139,7 @@ def create_app():
     def gpu_summary():
         """GPU monitoring summary for dashboard"""
         try:
-            summary = gpu_service.get_summary()
+            summary = current_snapshot().gpu_summary
             return jsonify(summary)
         except Exception as e:
             logger.error(f"Failed to get GPU summary: {e}")
@@ -130,7 +153,8 @@ def create_app():
     def gpu_metrics():
         """Detailed GPU metrics with process attribution"""
         try:
-            metrics = gpu_service.get_gpu_metrics()
+            snapshot = current_snapshot()
+            metrics = snapshot.gpus
             
             # Convert to JSON-serializable format
             result = []
@@ -145,8 +169,16 @@ def create_app():
                     'memory_percent': gpu.memory_percent,
                     'temperature_c': gpu.temperature_c,
                     'fan_speed_percent': gpu.fan_speed_percent,
+                    'fan_speed_rpm': gpu.fan_speed_rpm,
                     'power_draw_watts': gpu.power_draw_watts,
                     'power_limit_watts': gpu.power_limit_watts,
+                    'memory_temperature_c': gpu.memory_temperature_c,
+                    'clock_graphics_mhz': gpu.clock_graphics_mhz,
+                    'clock_sm_mhz': gpu.clock_sm_mhz,
+                    'clock_memory_mhz': gpu.clock_memory_mhz,
+                    'throttle_reasons': gpu.throttle_reasons,
+                    'pcie_tx_kbps': gpu.pcie_tx_kbps,
+                    'pcie_rx_kbps': gpu.pcie_rx_kbps,
                     'driver_version': gpu.driver_version,
                     'timestamp': gpu.timestamp,
                     'processes': [
@@ -155,6 +187,9 @@ def create_app():
                             'name': proc.name,
                             'gpu_memory_mb': proc.gpu_memory_mb,
                             'gpu_utilization': proc.gpu_utilization,
+                            'gpu_memory_utilization': proc.gpu_memory_utilization,
+                            'encoder_utilization': proc.encoder_utilization,
+                            'decoder_utilization': proc.decoder_utilization,
                             'command_line': proc.command_line,
                             
                             # Enhanced process identification
@@ -164,6 +199,10 @@ def create_app():
                             'memory_mb': proc.memory_mb,
                             'runtime_seconds': proc.runtime_seconds,
                             'executable_path': proc.executable_path,
+                            'container_id': proc.container_id,
+                            'container_name': proc.container_name,
+                            'compose_project': proc.compose_project,
+                            'systemd_unit': proc.systemd_unit,
                             
                             # Process classification flags
                             'is_suspected_miner': proc.is_suspected_miner,
@@ -178,7 +217,7 @@ def create_app():
             
             return jsonify({
                 'gpus': result,
-                'timestamp': time.time(),
+                'timestamp': snapshot.timestamp,
                 'count': len(result)
             })
         
@@ -193,7 +232,8 @@ def create_app():
     def gpu_processes():
         """Detailed process analysis - answers 'Why is my GPU fan running?'"""
         try:
-            metrics = gpu_service.get_gpu_metrics()
+            snapshot = current_snapshot()
+            metrics = snapshot.gpus
             
             all_processes = []
             insights = {
@@ -217,12 +257,19 @@ def create_app():
                         'name': proc.name,
                         'process_type': proc.process_type,
                         'gpu_memory_mb': proc.gpu_memory_mb,
+                        'gpu_utilization': proc.gpu_utilization,
+                        'encoder_utilization': proc.encoder_utilization,
+                        'decoder_utilization': proc.decoder_utilization,
                         'cpu_percent': proc.cpu_percent,
                         'memory_mb': proc.memory_mb,
                         'runtime_seconds': proc.runtime_seconds,
                         'username': proc.username,
                         'command_line': proc.command_line,
                         'executable_path': proc.executable_path,
+                        'container_id': proc.container_id,
+                        'container_name': proc.container_name,
+                        'compose_project': proc.compose_project,
+                        'systemd_unit': proc.systemd_unit,
                         
                         # Classification flags
                         'is_suspected_miner': proc.is_suspected_miner,
@@ -274,7 +321,7 @@ def create_app():
                 'summary': summary,
                 'processes': all_processes,
                 'insights': insights,
-                'timestamp': time.time()
+                'timestamp': snapshot.timestamp
             })
         
         except Exception as e:
@@ -292,7 +339,7 @@ def create_app():
     def system_overview():
         """Complete system overview with process attribution"""
         try:
-            summary = system_monitor.get_summary()
+            summary = current_snapshot().system_summary
             return jsonify(summary)
         except Exception as e:
             logger.error(f"Failed to get system overview: {e}")
@@ -305,7 +352,8 @@ def create_app():
     def system_cpu():
         """Detailed CPU metrics and top CPU processes"""
         try:
-            metrics = system_monitor.get_system_metrics()
+            snapshot = current_snapshot()
+            metrics = snapshot.system
             
             # Get top CPU processes
             cpu_processes = sorted(
@@ -317,6 +365,7 @@ def create_app():
                 'cpu': {
                     'usage_percent': metrics.cpu.usage_percent,
                     'per_core_usage': metrics.cpu.per_core_usage,
+                    'per_state_percent': metrics.cpu.per_state_percent,
                     'frequency_mhz': metrics.cpu.frequency_mhz,
                     'frequency_max_mhz': metrics.cpu.frequency_max_mhz,
                     'temperature_celsius': metrics.cpu.temperature_celsius,
@@ -337,11 +386,15 @@ def create_app():
                         'command_line': proc.command_line,
                         'process_type': proc.process_type,
                         'is_system_intensive': proc.is_system_intensive,
-                        'runtime_seconds': proc.runtime_seconds
+                        'runtime_seconds': proc.runtime_seconds,
+                        'container_id': proc.container_id,
+                        'container_name': proc.container_name,
+                        'compose_project': proc.compose_project,
+                        'systemd_unit': proc.systemd_unit
                     }
                     for proc in cpu_processes
                 ],
-                'timestamp': time.time()
+                'timestamp': snapshot.timestamp
             })
         except Exception as e:
             logger.error(f"Failed to get CPU metrics: {e}")
@@ -353,13 +406,11 @@ def create_app():
     def system_memory():
         """Memory usage with top memory consumers"""
         try:
-            metrics = system_monitor.get_system_metrics()
+            snapshot = current_snapshot()
+            metrics = snapshot.system
             
-            # Get top memory processes
-            memory_processes = sorted(
-                [p for p in metrics.top_processes if p.memory_percent > 1.0],
-                key=lambda x: x.memory_percent, reverse=True
-            )[:10]
+            # Top memory processes (already ranked by resident memory during the scan)
+            memory_processes = [p for p in metrics.top_processes_by_memory if p.memory_percent > 1.0]
             
             return jsonify({
                 'memory': {
@@ -390,11 +441,15 @@ def create_app():
                         'command_line': proc.command_line,
                         'process_type': proc.process_type,
                         'is_system_intensive': proc.is_system_intensive,
-                        'runtime_seconds': proc.runtime_seconds
+                        'runtime_seconds': proc.runtime_seconds,
+                        'container_id': proc.container_id,
+                        'container_name': proc.container_name,
+                        'compose_project': proc.compose_project,
+                        'systemd_unit': proc.systemd_unit
                     }
                     for proc in memory_processes
                 ],
-                'timestamp': time.time()
+                'timestamp': snapshot.timestamp
             })
         except Exception as e:
             logger.error(f"Failed to get memory metrics: {e}")
@@ -406,7 +461,8 @@ def create_app():
     def system_disk():
         """Disk usage and I/O statistics"""
         try:
-            metrics = system_monitor.get_system_metrics()
+            snapshot = current_snapshot()
+            metrics = snapshot.system
             
             return jsonify({
                 'disks': [
@@ -432,7 +488,46 @@ def create_app():
                     'total_used_mb': sum(d.used_mb for d in metrics.disks),
                     'total_free_mb': sum(d.free_mb for d in metrics.disks)
                 },
-                'timestamp': time.time()
+                'block_devices': [
+                    {
+                        'name': device.name,
+                        'display_name': device.display_name,
+                        'device_id': device.device_id,
+                        'kind': device.kind,
+                        'parent': device.parent,
+                        'slaves': device.slaves,
+                        'backing_file': device.backing_file,
+                        'read_bytes_per_sec': device.read_bytes_per_sec,
+                        'write_bytes_per_sec': device.write_bytes_per_sec,
+                        'read_iops': device.read_iops,
+                        'write_iops': device.write_iops,
+                        'await_ms': device.await_ms,
+                        'utilization_percent': device.utilization_percent,
+                        'in_flight': device.in_flight,
+                        'timestamp': device.timestamp
+                    }
+                    for device in metrics.block_devices
+                ],
+                'top_processes': [
+                    {
+                        'pid': proc.pid,
+                        'name': proc.name,
+                        'io_read_bytes_per_sec': proc.io_read_bytes_per_sec,
+                        'io_write_bytes_per_sec': proc.io_write_bytes_per_sec,
+                        'cpu_percent': proc.cpu_percent,
+                        'memory_mb': proc.memory_mb,
+                        'username': proc.username,
+                        'command_line': proc.command_line,
+                        'process_type': proc.process_type,
+                        'is_system_intensive': proc.is_system_intensive,
+                        'container_id': proc.container_id,
+                        'container_name': proc.container_name,
+                        'compose_project': proc.compose_project,
+                        'systemd_unit': proc.systemd_unit
+                    }
+                    for proc in metrics.top_processes_by_io
+                ],
+                'timestamp': snapshot.timestamp
             })
         except Exception as e:
             logger.error(f"Failed to get disk metrics: {e}")
@@ -444,7 +539,9 @@ def create_app():
     def system_network():
         """Network interface status and bandwidth"""
         try:
-            metrics = system_monitor.get_system_metrics()
+            snapshot = current_snapshot()
+            metrics = snapshot.system
+            connections = metrics.network.connection_stats
             
             return jsonify({
                 'interfaces': {
@@ -458,6 +555,8 @@ def create_app():
                         'bytes_recv_per_sec': interface.bytes_recv_per_sec,
                         'is_up': interface.is_up,
                         'addresses': interface.addresses,
+                        'mtu': interface.mtu,
+                        'speed_mbps': interface.speed_mbps,
                         'timestamp': interface.timestamp
                     }
                     for name, interface in metrics.network.interfaces.items()
@@ -470,7 +569,19 @@ def create_app():
                     'active_connections': metrics.network.active_connections,
                     'active_interfaces': len([i for i in metrics.network.interfaces.values() if i.is_up])
                 },
-                'timestamp': time.time()
+                'connections': {
+                    'tcp_in_use': connections.tcp_in_use,
+                    'udp_in_use': connections.udp_in_use,
+                    'tcp_time_wait': connections.tcp_time_wait,
+                    'tcp_orphaned': connections.tcp_orphaned,
+                    'tcp_established': connections.tcp_established,
+                    'tcp_active_opens': connections.tcp_active_opens,
+                    'tcp_passive_opens': connections.tcp_passive_opens,
+                    'tcp_retransmitted_segments': connections.tcp_retransmitted_segments,
+                    'tcp_states': connections.tcp_states,
+                    'timestamp': connections.timestamp
+                } if connections else None,
+                'timestamp': snapshot.timestamp
             })
         except Exception as e:
             logger.error(f"Failed to get network metrics: {e}")
@@ -478,6 +589,70 @@ def create_app():
                 'error': 'Failed to get network information'
             }), 500
     
+    @app.route('/api/system/containers')
+    def system_containers():
+        """Resource usage per container and slice - which container that "python" belongs to"""
+        try:
+            snapshot = current_snapshot()
+            rollup = {usage.container_id: usage for usage in snapshot.containers}
+            
+            def cgroup_entry(cgroup):
+                usage = rollup.get(cgroup.container_id)
+                return {
+                    'path': cgroup.path,
+                    'kind': cgroup.kind,
+                    'name': cgroup.name,
+                    'container_id': cgroup.container_id,
+                    'compose_project': cgroup.compose_project,
+                    'cpu_percent': cgroup.cpu_percent,
+                    'cpu_throttled_percent': cgroup.cpu_throttled_percent,
+                    'memory_current_bytes': cgroup.memory_current_bytes,
+                    'memory_max_bytes': cgroup.memory_max_bytes,
+                    'memory_anon_bytes': cgroup.memory_anon_bytes,
+                    'memory_file_bytes': cgroup.memory_file_bytes,
+                    'io_read_bytes_per_sec': cgroup.io_read_bytes_per_sec,
+                    'io_write_bytes_per_sec': cgroup.io_write_bytes_per_sec,
+                    'pressure': {
+                        'cpu_some': cgroup.cpu_pressure_some,
+                        'memory_some': cgroup.memory_pressure_some,
+                        'memory_full': cgroup.memory_pressure_full,
+                        'io_some': cgroup.io_pressure_some,
+                        'io_full': cgroup.io_pressure_full
+                    },
+                    # From process attribution - GPU memory isn't accounted in cgroups
+                    'process_count': usage.process_count if usage else None,
+                    'gpu_memory_mb': usage.gpu_memory_mb if usage else None,
+                    'timestamp': cgroup.timestamp
+                }
+            
+            return jsonify({
+                'containers': [cgroup_entry(cgroup) for cgroup in snapshot.system.cgroups if cgroup.kind == 'container'],
+                'slices': [cgroup_entry(cgroup) for cgroup in snapshot.system.cgroups if cgroup.kind == 'slice'],
+                # Summed from processes - also available without cgroup v2
+                'process_rollup': [
+                    {
+                        'container_id': usage.container_id,
+                        'name': usage.name,
+                        'compose_project': usage.compose_project,
+                        'compose_service': usage.compose_service,
+                        'runtime': usage.runtime,
+                        'process_count': usage.process_count,
+                        'cpu_percent': usage.cpu_percent,
+                        'memory_mb': usage.memory_mb,
+                        'gpu_memory_mb': usage.gpu_memory_mb,
+                        'timestamp': usage.timestamp
+                    }
+                    for usage in snapshot.containers
+                ],
+                'cgroup_available': system_monitor.cgroup_available,
+                'timestamp': snapshot.timestamp
+            })
+        except Exception as e:
+            logger.error(f"Failed to get container metrics: {e}")
+            return jsonify({
+                'error': 'Failed to get container information'
+            }), 500
+    
     @socketio.on('connect')
     def handle_connect():
         """Handle WebSocket connection"""
@@ -489,13 +664,12 @@ def create_app():
         
         # Send initial status
         try:
-            gpu_summary = gpu_service.get_summary()
-            system_summary = system_monitor.get_summary()
+            snapshot = current_snapshot()
             
             emit('system:initial_status', {
-                'gpu': gpu_summary,
-                'system': system_summary,
-                'timestamp': time.time()
+                'gpu': snapshot.gpu_summary,
+                'system': snapshot.system_summary,
+                'timestamp': snapshot.timestamp
             })
             
             # Start monitoring if this is the first client
@@ -0,0 +1,179 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - AMD GPU sysfs Reader
+SpicyRiceCakes - amdgpu metrics without a vendor library
+
+The amdgpu driver exports everything the dashboard needs under
+/sys/class/drm/card*/device/: gpu_busy_percent, mem_info_vram_used/total
+and an hwmon directory with temperatures, fan and power. Each attribute
+is opened once when the card is discovered and re-read with pread at
+offset 0 - sysfs regenerates the value on every read - so a sample costs
+one syscall per attribute and nothing else.
+"""
+
+import logging
+import os
+import re
+from typing import Dict, List, Optional
+
+logger = logging.getLogger(__name__)
+
+AMD_VENDOR_ID = 0x1002
+
+# card0, card1 - not the connector entries (card0-DP-1, card0-HDMI-A-1)
+_CARD_PATTERN = re.compile(r'^card(\d+)$')
+
+# hwmon temperature labels -> field key
+_TEMPERATURE_LABELS = {'edge': 'temperature_c', 'junction': 'junction_temperature_c', 'mem': 'memory_temperature_c'}
+
+
+def _read_text(path: str) -> Optional[str]:
+    try:
+        with open(path) as f:
+            return f.read().strip()
+    except OSError:
+        return None
+
+
+def _read_int(path: str, base: int = 10) -> Optional[int]:
+    text = _read_text(path)
+    try:
+        return int(text, base) if text is not None else None
+    except ValueError:
+        return None
+
+
+class AMDGPUDevice:
+    """One amdgpu card: static attributes plus open fds of the volatile ones"""
+
+    def __init__(self, index: int, card: str, device_dir: str):
+        self.index = index
+        self.card = card
+        self.device_dir = device_dir
+        self.pci_slot = os.path.basename(os.path.realpath(device_dir))
+        self.name = (_read_text(os.path.join(device_dir, 'product_name'))
+                     or f"AMD GPU [{self._pci_id()}]")
+        self.memory_total_bytes = _read_int(os.path.join(device_dir, 'mem_info_vram_total')) or 0
+        self.hwmon_dir = self._find_hwmon()
+        self.power_cap_watts = None
+        self.pwm_max = 255
+        if self.hwmon_dir:
+            power_cap = _read_int(os.path.join(self.hwmon_dir, 'power1_cap'))
+            self.power_cap_watts = power_cap / 1_000_000 if power_cap else None  # µW to W
+            self.pwm_max = _read_int(os.path.join(self.hwmon_dir, 'pwm1_max')) or 255
+
+        # field key -> open fd
+        self._fds: Dict[str, int] = {}
+        self._open('utilization_percent', os.path.join(device_dir, 'gpu_busy_percent'))
+        self._open('memory_busy_percent', os.path.join(device_dir, 'mem_busy_percent'))
+        self._open('memory_used_bytes', os.path.join(device_dir, 'mem_info_vram_used'))
+        if self.hwmon_dir:
+            for key, path in self._hwmon_attributes():
+                self._open(key, path)
+
+    def _pci_id(self) -> str:
+        for line in (_read_text(os.path.join(self.device_dir, 'uevent')) or '').splitlines():
+            if line.startswith('PCI_ID='):
+                return line[len('PCI_ID='):].lower()
+        return self.pci_slot
+
+    def _find_hwmon(self) -> Optional[str]:
+        hwmon_root = os.path.join(self.device_dir, 'hwmon')
+        try:
+            names = sorted(os.listdir(hwmon_root))
+        except OSError:
+            return None
+        return os.path.join(hwmon_root, names[0]) if names else None
+
+    def _hwmon_attributes(self):
+        """(key, path) of the hwmon inputs this card has"""
+        for entry in sorted(os.listdir(self.hwmon_dir)):
+            match = re.match(r'^temp(\d+)_input$', entry)
+            if match:
+                label = _read_text(os.path.join(self.hwmon_dir, f"temp{match.group(1)}_label"))
+                key = _TEMPERATURE_LABELS.get(label) or ('temperature_c' if match.group(1) == '1' else None)
+                if key:
+                    yield key, os.path.join(self.hwmon_dir, entry)
+        yield 'fan_speed_rpm', os.path.join(self.hwmon_dir, 'fan1_input')
+        yield 'fan_pwm', os.path.join(self.hwmon_dir, 'pwm1')
+        # power1_average on most kernels, power1_input on newer APUs/RDNA3
+        for name in ('power1_average', 'power1_input'):
+            if os.path.exists(os.path.join(self.hwmon_dir, name)):
+                yield 'power_draw_uw', os.path.join(self.hwmon_dir, name)
+                break
+
+    def _open(self, key: str, path: str):
+        if key in self._fds:
+            return
+        try:
+            self._fds[key] = os.open(path, os.O_RDONLY)
+        except OSError:
+            pass  # Not exported by this card/driver version
+
+    def read(self) -> Dict[str, int]:
+        """Current value of every open attribute; raises OSError when the card went away"""
+        values = {}
+        for key, fd in self._fds.items():
+            data = os.pread(fd, 32, 0)
+            try:
+                values[key] = int(data)
+            except ValueError:
+                continue
+        return values
+
+    def close(self):
+        for fd in self._fds.values():
+            os.close(fd)
+        self._fds.clear()
+
+
+class AMDSysfsReader:
+    """Discovers amdgpu cards under /sys/class/drm and samples them with pread"""
+
+    def __init__(self, sys_root: str = '/sys'):
+        self.sys_root = sys_root
+        self.drm_root = os.path.join(sys_root, 'class', 'drm')
+        self.devices: List[AMDGPUDevice] = []
+
+        # Performance tracking
+        self.discovery_count = 0
+
+        self.discover()
+
+    @staticmethod
+    def is_supported(sys_root: str = '/sys') -> bool:
+        return os.path.isdir(os.path.join(sys_root, 'class', 'drm'))
+
+    def discover(self) -> List[AMDGPUDevice]:
+        """(Re)open every AMD card - at start and after a card disappeared"""
+        self.close()
+        cards = []
+        try:
+            entries = os.listdir(self.drm_root)
+        except OSError:
+            entries = []
+        for entry in entries:
+            match = _CARD_PATTERN.match(entry)
+            if not match:
+                continue
+            device_dir = os.path.join(self.drm_root, entry, 'device')
+            if _read_int(os.path.join(device_dir, 'vendor'), 16) != AMD_VENDOR_ID:
+                continue
+            cards.append((int(match.group(1)), entry, device_dir))
+
+        self.devices = [AMDGPUDevice(index, card, device_dir)
+                        for index, (_, card, device_dir) in enumerate(sorted(cards))]
+        self.discovery_count += 1
+        if self.devices:
+            logger.info(f"🔴 AMD GPUs found: {', '.join(f'{device.card} ({device.name})' for device in self.devices)}")
+        return self.devices
+
+    def driver_version(self) -> Optional[str]:
+        # Out-of-tree (DKMS) amdgpu has a version; the in-kernel driver goes by the kernel release
+        return (_read_text(os.path.join(self.sys_root, 'module', 'amdgpu', 'version'))
+                or f"amdgpu {os.uname().release}")
+
+    def close(self):
+        for device in self.devices:
+            device.close()
+        self.devices = []
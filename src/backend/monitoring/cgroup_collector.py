@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Cgroup Collector
+SpicyRiceCakes - Container usage straight from cgroup v2
+
+Per-container and per-slice CPU, memory, IO and pressure read from the
+cgroup v2 interface files (cpu.stat, memory.current, memory.stat,
+io.stat, *.pressure). That is a handful of small reads per container
+instead of a full process scan, it includes children that have already
+exited, and it works when /proc/[pid] of other users is off limits.
+The list of cgroups is rediscovered on a slow timer (or when a tracked
+cgroup disappears); rates come from each cgroup's own previous sample.
+"""
+
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+from .container_index import DockerResolver, origin_from_cgroup
+
+logger = logging.getLogger(__name__)
+
+# Container cgroups sit a few levels down (system.slice/docker-<id>.scope,
+# kubepods.slice/.../cri-containerd-<id>.scope); don't descend further
+MAX_DISCOVERY_DEPTH = 4
+
+
+@dataclass
+class CgroupStats:
+    """Resource usage of one container or slice"""
+    path: str  # Relative to the cgroup root, e.g. 'system.slice/docker-<id>.scope'
+    kind: str  # 'container' or 'slice'
+    name: str  # Container name when resolved, else the cgroup's directory name
+    container_id: Optional[str] = None
+    compose_project: Optional[str] = None
+    cpu_percent: Optional[float] = None  # 100 = one full CPU
+    cpu_throttled_percent: Optional[float] = None  # Share of wall time spent throttled by cpu.max
+    memory_current_bytes: int = 0
+    memory_max_bytes: Optional[int] = None  # None when unlimited
+    memory_anon_bytes: Optional[int] = None
+    memory_file_bytes: Optional[int] = None  # Page cache
+    io_read_bytes_per_sec: Optional[float] = None
+    io_write_bytes_per_sec: Optional[float] = None
+    cpu_pressure_some: Optional[float] = None  # avg10 from cpu.pressure (% of time stalled)
+    memory_pressure_some: Optional[float] = None
+    memory_pressure_full: Optional[float] = None
+    io_pressure_some: Optional[float] = None
+    io_pressure_full: Optional[float] = None
+    timestamp: float = None
+
+    def __post_init__(self):
+        if self.timestamp is None:
+            self.timestamp = time.time()
+
+
+def _read_file(path: str) -> Optional[bytes]:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return os.read(fd, 65536)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+def _parse_flat_keyed(data: Optional[bytes]) -> Dict[str, int]:
+    """'usage_usec 123\\nuser_usec 100\\n' -> {'usage_usec': 123, 'user_usec': 100}"""
+    values = {}
+    for line in (data or b'').splitlines():
+        key, _, value = line.partition(b' ')
+        try:
+            values[key.decode()] = int(value)
+        except ValueError:
+            continue
+    return values
+
+
+def _parse_io_stat(data: Optional[bytes]) -> Tuple[int, int]:
+    """Total (rbytes, wbytes) over all devices of io.stat"""
+    read_bytes = write_bytes = 0
+    for line in (data or b'').splitlines():
+        for field in line.split()[1:]:
+            key, _, value = field.partition(b'=')
+            if key == b'rbytes':
+                read_bytes += int(value)
+            elif key == b'wbytes':
+                write_bytes += int(value)
+    return read_bytes, write_bytes
+
+
+def _parse_pressure(data: Optional[bytes]) -> Dict[str, float]:
+    """'some avg10=1.50 avg60=...\\nfull avg10=0.20 ...' -> {'some': 1.5, 'full': 0.2}"""
+    pressure = {}
+    for line in (data or b'').splitlines():
+        fields = line.split()
+        if len(fields) > 1 and fields[1].startswith(b'avg10='):
+            pressure[fields[0].decode()] = float(fields[1][6:])
+    return pressure
+
+
+class CgroupCollector:
+    """cgroup v2 usage for containers and top-level slices"""
+
+    def __init__(self, sys_root: str = '/sys', resolver: Optional[DockerResolver] = None,
+                 discovery_interval: float = 10.0):
+        self.root = self.find_root(sys_root)
+        self.resolver = resolver
+        self.discovery_interval = discovery_interval
+
+        # relative path -> kind
+        self._targets: Dict[str, str] = {}
+        self._last_discovery = None
+        # relative path -> (usage_usec, throttled_usec, rbytes, wbytes, monotonic timestamp)
+        self._last_counters: Dict[str, Tuple[int, int, int, int, float]] = {}
+
+        # Performance tracking
+        self.discovery_count = 0
+
+    @staticmethod
+    def find_root(sys_root: str = '/sys') -> Optional[str]:
+        """The cgroup v2 mount: unified hierarchy, or the hybrid layout's 'unified' mount"""
+        base = os.path.join(sys_root, 'fs', 'cgroup')
+        for root in (base, os.path.join(base, 'unified')):
+            if os.path.exists(os.path.join(root, 'cgroup.controllers')):
+                return root
+        return None
+
+    @classmethod
+    def is_supported(cls, sys_root: str = '/sys') -> bool:
+        return cls.find_root(sys_root) is not None
+
+    def _discover(self):
+        """Top-level slices plus every container cgroup a few levels down"""
+        targets = {}
+        pending = [('', 0)]
+        while pending:
+            relative, depth = pending.pop()
+            try:
+                entries = list(os.scandir(os.path.join(self.root, relative)))
+            except OSError:
+                continue
+            for entry in entries:
+                if not entry.is_dir(follow_symlinks=False):
+                    continue
+                child = os.path.join(relative, entry.name) if relative else entry.name
+                if origin_from_cgroup('/' + child).container_id is not None:
+                    # Containers may nest their own cgroups - the container's is enough
+                    targets[child] = 'container'
+                    continue
+                if depth == 0 and entry.name.endswith('.slice'):
+                    targets[child] = 'slice'
+                if depth + 1 < MAX_DISCOVERY_DEPTH:
+                    pending.append((child, depth + 1))
+
+        self._targets = targets
+        self._last_discovery = time.monotonic()
+        self._last_counters = {path: counters for path, counters in self._last_counters.items()
+                               if path in targets}
+        self.discovery_count += 1
+        logger.debug(f"📦 Cgroups discovered: {len(targets)} containers/slices")
+
+    def _read_cgroup(self, relative: str, kind: str, now: float) -> Optional[CgroupStats]:
+        directory = os.path.join(self.root, relative)
+        cpu = _parse_flat_keyed(_read_file(os.path.join(directory, 'cpu.stat')))
+        if 'usage_usec' not in cpu:
+            return None  # Removed since discovery
+
+        stats = CgroupStats(path=relative, kind=kind, name=os.path.basename(relative))
+
+        memory_current = _read_file(os.path.join(directory, 'memory.current'))
+        stats.memory_current_bytes = int(memory_current) if memory_current else 0
+        memory_max = (_read_file(os.path.join(directory, 'memory.max')) or b'max').strip()
+        stats.memory_max_bytes = int(memory_max) if memory_max != b'max' else None
+        memory_stat = _parse_flat_keyed(_read_file(os.path.join(directory, 'memory.stat')))
+        stats.memory_anon_bytes = memory_stat.get('anon')
+        stats.memory_file_bytes = memory_stat.get('file')
+
+        read_bytes, write_bytes = _parse_io_stat(_read_file(os.path.join(directory, 'io.stat')))
+
+        cpu_pressure = _parse_pressure(_read_file(os.path.join(directory, 'cpu.pressure')))
+        memory_pressure = _parse_pressure(_read_file(os.path.join(directory, 'memory.pressure')))
+        io_pressure = _parse_pressure(_read_file(os.path.join(directory, 'io.pressure')))
+        stats.cpu_pressure_some = cpu_pressure.get('some')
+        stats.memory_pressure_some = memory_pressure.get('some')
+        stats.memory_pressure_full = memory_pressure.get('full')
+        stats.io_pressure_some = io_pressure.get('some')
+        stats.io_pressure_full = io_pressure.get('full')
+
+        counters = (cpu['usage_usec'], cpu.get('throttled_usec', 0), read_bytes, write_bytes, now)
+        previous = self._last_counters.get(relative)
+        self._last_counters[relative] = counters
+        if previous is not None and now > previous[4]:
+            deltas = [current - last for current, last in zip(counters[:4], previous[:4])]
+            # Negative deltas: the cgroup was re-created (container restart) - new baseline
+            if min(deltas) >= 0:
+                elapsed_usec = (now - previous[4]) * 1_000_000
+                stats.cpu_percent = deltas[0] / elapsed_usec * 100
+                stats.cpu_throttled_percent = min(deltas[1] / elapsed_usec * 100, 100.0)
+                stats.io_read_bytes_per_sec = deltas[2] * 1_000_000 / elapsed_usec
+                stats.io_write_bytes_per_sec = deltas[3] * 1_000_000 / elapsed_usec
+
+        if kind == 'container':
+            origin = origin_from_cgroup('/' + relative)
+            stats.container_id = origin.container_id
+            info = self.resolver.resolve(origin.container_id) if self.resolver else None
+            stats.name = info.name if info else origin.container_id[:12]
+            stats.compose_project = info.compose_project if info else None
+
+        return stats
+
+    def collect(self) -> List[CgroupStats]:
+        """Usage of every container and slice, busiest first"""
+        if self._last_discovery is None or time.monotonic() - self._last_discovery >= self.discovery_interval:
+            self._discover()
+
+        now = time.monotonic()
+        results = []
+        vanished = False
+        for relative, kind in self._targets.items():
+            stats = self._read_cgroup(relative, kind, now)
+            if stats is None:
+                vanished = True
+                continue
+            results.append(stats)
+
+        if vanished:
+            # A container stopped - pick up starts/stops on the next tick, not in 10s
+            self._last_discovery = None
+        return sorted(results, key=lambda stats: (stats.kind != 'container', -(stats.cpu_percent or 0.0)))
@@ -0,0 +1,204 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Collector Scheduler
+SpicyRiceCakes - Collect each metric only as often as it deserves
+
+Every collector (cpu, memory, gpu, processes, disk, network, sensors,
+containers) has its own urgency tier and its own deadline on the monotonic
+clock. A collector is escalated to a faster tier only when its own latest
+value calls for it, and drops back to its base tier once that signal clears.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Iterable, List, Optional
+
+logger = logging.getLogger(__name__)
+
+# Tiered collection/update frequencies (seconds)
+UPDATE_FREQUENCIES = {
+    'critical': 1,      # CPU >90%, GPU temp >80°C, suspected miners
+    'important': 2,     # GPU/CPU usage, process changes
+    'standard': 5,      # Memory, basic system metrics
+    'background': 10    # Network stats, disk I/O
+}
+
+
+def _cpu_tier(cpu) -> Optional[str]:
+    if cpu is not None and cpu.usage_percent > 90:
+        return 'critical'
+    return None
+
+
+def _sensors_tier(temperature_celsius) -> Optional[str]:
+    if temperature_celsius is not None:
+        if temperature_celsius > 80:
+            return 'critical'
+        if temperature_celsius > 70:
+            return 'important'
+    return None
+
+
+def _memory_tier(memory) -> Optional[str]:
+    if memory is not None:
+        if memory.used_percent > 90:
+            return 'critical'
+        if memory.used_percent > 80:
+            return 'important'
+    return None
+
+
+def _processes_tier(rankings) -> Optional[str]:
+    if rankings and any(proc.process_type == 'mining' for proc in rankings.get('cpu', [])):
+        return 'critical'
+    return None
+
+
+def _disk_tier(storage) -> Optional[str]:
+    if storage and (any(disk.used_percent > 90 for disk in storage.get('disks', []))
+                    or any((device.utilization_percent or 0) > 90 for device in storage.get('block_devices', []))):
+        return 'standard'
+    return None
+
+
+def _containers_tier(cgroups) -> Optional[str]:
+    # A container close to its memory limit or stalling on memory is about to be OOM-killed
+    for cgroup in cgroups or []:
+        if ((cgroup.memory_max_bytes and cgroup.memory_current_bytes > 0.9 * cgroup.memory_max_bytes)
+                or (cgroup.memory_pressure_full or 0) > 10):
+            return 'important'
+    return None
+
+
+def _gpu_tier(gpus) -> Optional[str]:
+    for gpu in gpus or []:
+        if ((gpu.temperature_c or 0) > 80
+                or any(proc.is_suspected_miner for proc in gpu.processes)):
+            return 'critical'
+    return None
+
+
+@dataclass
+class ScheduledCollector:
+    """One collector's cadence state"""
+    name: str
+    base_tier: str
+    escalate: Optional[Callable[[Any], Optional[str]]] = None  # Latest value -> faster tier, or None
+    tier: str = None
+    deadline: float = 0.0
+    run_count: int = 0
+    last_run: Optional[float] = None
+
+    def __post_init__(self):
+        if self.tier is None:
+            self.tier = self.base_tier
+
+    @property
+    def interval(self) -> float:
+        return UPDATE_FREQUENCIES[self.tier]
+
+
+def default_collectors() -> List[ScheduledCollector]:
+    """Base tiers and escalation signals for every built-in collector"""
+    return [
+        ScheduledCollector('cpu', 'important', _cpu_tier),
+        ScheduledCollector('sensors', 'standard', _sensors_tier),
+        ScheduledCollector('memory', 'standard', _memory_tier),
+        ScheduledCollector('processes', 'important', _processes_tier),
+        ScheduledCollector('gpu', 'important', _gpu_tier),
+        ScheduledCollector('disk', 'background', _disk_tier),
+        ScheduledCollector('network', 'background'),
+        ScheduledCollector('containers', 'standard', _containers_tier),
+    ]
+
+
+class CollectorScheduler:
+    """Decides which collectors are due, on drift-free monotonic deadlines"""
+
+    def __init__(self, collectors: Iterable[ScheduledCollector] = None,
+                 clock: Callable[[], float] = time.monotonic):
+        self.clock = clock
+        self._collectors: Dict[str, ScheduledCollector] = {
+            collector.name: collector for collector in (collectors or default_collectors())
+        }
+
+        # Everything is due on the first tick
+        now = self.clock()
+        for collector in self._collectors.values():
+            collector.deadline = now
+
+    @property
+    def names(self) -> List[str]:
+        return list(self._collectors)
+
+    def tier(self, name: str) -> str:
+        return self._collectors[name].tier
+
+    def due(self, now: float = None) -> List[str]:
+        """Collectors whose deadline has passed"""
+        now = self.clock() if now is None else now
+        return [name for name, collector in self._collectors.items() if collector.deadline <= now]
+
+    def seconds_until_next(self, now: float = None) -> float:
+        """How long the sampler can sleep before something is due"""
+        now = self.clock() if now is None else now
+        return max(min(collector.deadline for collector in self._collectors.values()) - now, 0.0)
+
+    def complete(self, name: str, value: Any = None, now: float = None) -> str:
+        """Record a collection, re-tier the collector from its value and schedule the next run"""
+        collector = self._collectors[name]
+        now = self.clock() if now is None else now
+
+        tier = collector.base_tier
+        if collector.escalate is not None:
+            try:
+                escalated = collector.escalate(value)
+            except Exception as e:
+                logger.debug(f"Escalation check failed for {name}: {e}")
+                escalated = None
+            # Escalation only ever makes a collector faster than its base tier
+            if escalated is not None and UPDATE_FREQUENCIES[escalated] < UPDATE_FREQUENCIES[tier]:
+                tier = escalated
+
+        if tier != collector.tier:
+            logger.debug(f"⏱️ {name} collector moved from {collector.tier} to {tier}")
+            collector.tier = tier
+
+        collector.run_count += 1
+        collector.last_run = now
+        self._advance(collector, now)
+        return tier
+
+    def defer(self, name: str, now: float = None):
+        """Skip to the next slot without recording a collection (e.g. after a failure)"""
+        self._advance(self._collectors[name], self.clock() if now is None else now)
+
+    @staticmethod
+    def _advance(collector: ScheduledCollector, now: float):
+        # Step from the previous deadline, not from now, so slow ticks don't drift
+        interval = collector.interval
+        deadline = collector.deadline + interval
+        if deadline <= now:
+            # Fell behind - skip the missed slots instead of bursting to catch up
+            deadline += (int((now - deadline) // interval) + 1) * interval
+        collector.deadline = deadline
+
+    def request_all(self):
+        """Make every collector due immediately (manual refresh)"""
+        now = self.clock()
+        for collector in self._collectors.values():
+            collector.deadline = now
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        now = self.clock()
+        return {
+            name: {
+                'tier': collector.tier,
+                'base_tier': collector.base_tier,
+                'interval_seconds': collector.interval,
+                'run_count': collector.run_count,
+                'seconds_until_due': max(collector.deadline - now, 0.0)
+            }
+            for name, collector in self._collectors.items()
+        }
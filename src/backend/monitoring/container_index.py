@@ -0,0 +1,280 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Container Attribution Index
+SpicyRiceCakes - Which container is that "python" in?
+
+Maps processes to the container, compose project or systemd unit they run
+in. /proc/[pid]/cgroup is parsed once per process lifetime (keyed by pid
+and start time, like the identity cache), so a tick only pays a dict
+lookup per process no matter how many containers are running. Container
+names and compose labels come from one /containers/json call on the
+mounted docker.sock, cached with a TTL.
+"""
+
+import http.client
+import json
+import logging
+import os
+import re
+import socket
+import time
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+DOCKER_SOCKET = '/var/run/docker.sock'
+
+# Container scopes/directories as the common runtimes name them, under either
+# cgroup driver: docker-<id>.scope, /docker/<id>, cri-containerd-<id>.scope,
+# libpod-<id>.scope, crio-<id>.scope, /kubepods/.../<id>
+_CONTAINER_PATTERN = re.compile(
+    r'(?:^|/)(?:(docker|cri-containerd|libpod|crio)-|(docker|kubepods)/(?:.*/)?)([0-9a-f]{64})(?:\.scope)?(?:/|$)'
+)
+_RUNTIMES = {'cri-containerd': 'containerd', 'libpod': 'podman', 'kubepods': 'kubernetes'}
+
+
+@dataclass(frozen=True)
+class ProcessOrigin:
+    """Where a process runs, derived from its cgroup path"""
+    cgroup: str
+    container_id: Optional[str] = None
+    runtime: Optional[str] = None  # 'docker', 'containerd', 'podman', 'crio', 'kubernetes'
+    systemd_unit: Optional[str] = None  # Innermost .service/.scope, e.g. 'nginx.service'
+
+
+@dataclass(frozen=True)
+class ContainerInfo:
+    """Container metadata from the Docker API"""
+    container_id: str
+    name: str
+    image: Optional[str] = None
+    compose_project: Optional[str] = None
+    compose_service: Optional[str] = None
+
+
+@dataclass
+class ContainerUsage:
+    """Resources used by all processes of one container"""
+    container_id: str
+    name: Optional[str] = None
+    compose_project: Optional[str] = None
+    compose_service: Optional[str] = None
+    runtime: Optional[str] = None
+    process_count: int = 0
+    cpu_percent: float = 0.0
+    memory_mb: int = 0  # Sum of process RSS
+    gpu_memory_mb: int = 0
+    timestamp: float = None
+
+    def __post_init__(self):
+        if self.timestamp is None:
+            self.timestamp = time.time()
+
+
+def parse_cgroup(data: bytes) -> str:
+    """Cgroup path from /proc/[pid]/cgroup - the v2 entry, else v1's systemd or cpu hierarchy"""
+    fallback = ""
+    for line in data.decode('utf-8', 'replace').splitlines():
+        hierarchy, _, rest = line.partition(':')
+        controllers, _, path = rest.partition(':')
+        if hierarchy == '0' and not controllers:
+            return path
+        if controllers == 'name=systemd' or 'cpu' in controllers.split(','):
+            fallback = fallback or path
+    return fallback
+
+
+def origin_from_cgroup(path: str) -> ProcessOrigin:
+    """Container and systemd unit of a cgroup path (also works for '/../..'-relative paths)"""
+    container_id = None
+    runtime = None
+    match = _CONTAINER_PATTERN.search(path)
+    if match:
+        prefix = match.group(1) or match.group(2)
+        container_id = match.group(3)
+        runtime = _RUNTIMES.get(prefix, prefix)
+
+    systemd_unit = None
+    for component in reversed(path.split('/')):
+        if component.endswith(('.service', '.scope')):
+            systemd_unit = component
+            break
+
+    return ProcessOrigin(cgroup=path, container_id=container_id, runtime=runtime, systemd_unit=systemd_unit)
+
+
+class _UnixHTTPConnection(http.client.HTTPConnection):
+    """HTTP over a Unix socket (the Docker Engine API)"""
+
+    def __init__(self, socket_path: str, timeout: float):
+        super().__init__('localhost', timeout=timeout)
+        self.socket_path = socket_path
+
+    def connect(self):
+        sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        sock.settimeout(self.timeout)
+        sock.connect(self.socket_path)
+        self.sock = sock
+
+
+class DockerResolver:
+    """Container id -> name/compose labels, from one list call per TTL"""
+
+    def __init__(self, socket_path: str = DOCKER_SOCKET, ttl: float = 30.0,
+                 min_refresh_interval: float = 5.0, timeout: float = 1.0):
+        self.socket_path = socket_path
+        self.ttl = ttl
+        self.min_refresh_interval = min_refresh_interval
+        self.timeout = timeout
+
+        self._containers: Dict[str, ContainerInfo] = {}
+        self._last_refresh = None
+
+        # Performance tracking
+        self.refresh_count = 0
+        self.error_count = 0
+
+    @staticmethod
+    def is_supported(socket_path: str = DOCKER_SOCKET) -> bool:
+        return hasattr(socket, 'AF_UNIX') and os.path.exists(socket_path)
+
+    def _list_containers(self) -> List[Dict[str, Any]]:
+        connection = _UnixHTTPConnection(self.socket_path, self.timeout)
+        try:
+            connection.request('GET', '/containers/json')
+            response = connection.getresponse()
+            body = response.read()
+            if response.status != 200:
+                raise OSError(f"Docker API returned HTTP {response.status}")
+            return json.loads(body)
+        finally:
+            connection.close()
+
+    def _refresh(self):
+        self._last_refresh = time.monotonic()
+        try:
+            containers = self._list_containers()
+        except (OSError, ValueError, http.client.HTTPException) as e:
+            # Keep the previous names; try again after min_refresh_interval
+            self.error_count += 1
+            logger.debug(f"Docker container list unavailable: {e}")
+            return
+
+        resolved = {}
+        for container in containers:
+            labels = container.get('Labels') or {}
+            names = container.get('Names') or []
+            resolved[container['Id']] = ContainerInfo(
+                container_id=container['Id'],
+                name=names[0].lstrip('/') if names else container['Id'][:12],
+                image=container.get('Image'),
+                compose_project=labels.get('com.docker.compose.project'),
+                compose_service=labels.get('com.docker.compose.service')
+            )
+        self._containers = resolved
+        self.refresh_count += 1
+
+    def resolve(self, container_id: str) -> Optional[ContainerInfo]:
+        """Metadata for a running container, refreshing the list when stale or on a new id"""
+        since_refresh = time.monotonic() - self._last_refresh if self._last_refresh is not None else None
+        if (since_refresh is None or since_refresh >= self.ttl
+                or (container_id not in self._containers and since_refresh >= self.min_refresh_interval)):
+            self._refresh()
+        return self._containers.get(container_id)
+
+
+class ContainerIndex:
+    """Incremental pid -> ProcessOrigin index, parsed once per process lifetime"""
+
+    def __init__(self, proc_root: str = '/proc', resolver: Optional[DockerResolver] = None):
+        self.proc_root = proc_root
+        self.resolver = resolver
+
+        self._origins: Dict[Tuple[int, Any], ProcessOrigin] = {}
+        self._keys_by_pid: Dict[int, Tuple[int, Any]] = {}
+
+        # Performance tracking
+        self.parse_count = 0
+
+    def _read_origin(self, pid: int) -> ProcessOrigin:
+        try:
+            with open(os.path.join(self.proc_root, str(pid), 'cgroup'), 'rb') as cgroup_file:
+                data = cgroup_file.read()
+        except OSError:
+            return ProcessOrigin(cgroup="")
+        self.parse_count += 1
+        return origin_from_cgroup(parse_cgroup(data))
+
+    def origin(self, pid: int, identity_key: Tuple[int, Any]) -> ProcessOrigin:
+        """Origin of a process instance; /proc/[pid]/cgroup is only read the first time"""
+        origin = self._origins.get(identity_key)
+        if origin is None:
+            origin = self._origins[identity_key] = self._read_origin(pid)
+            self._keys_by_pid[pid] = identity_key
+        return origin
+
+    def origin_for_pid(self, pid: int) -> ProcessOrigin:
+        """Origin by pid alone (GPU processes) - reuses the scan's entry when there is one"""
+        identity_key = self._keys_by_pid.get(pid)
+        origin = self._origins.get(identity_key) if identity_key is not None else None
+        return origin if origin is not None else self._read_origin(pid)
+
+    def retain(self, identity_keys: Iterable[Tuple[int, Any]]):
+        """Forget processes that are gone (exited or pid reused)"""
+        live = set(identity_keys)
+        self._origins = {key: origin for key, origin in self._origins.items() if key in live}
+        self._keys_by_pid = {key[0]: key for key in self._origins}
+
+    def container_info(self, origin: ProcessOrigin) -> Optional[ContainerInfo]:
+        if origin.container_id is None or self.resolver is None:
+            return None
+        return self.resolver.resolve(origin.container_id)
+
+    def tags(self, origin: ProcessOrigin) -> Dict[str, Optional[str]]:
+        """Container/compose/unit fields shared by SystemProcess and GPUProcess"""
+        info = self.container_info(origin)
+        return {
+            'container_id': origin.container_id,
+            'container_name': info.name if info else (origin.container_id[:12] if origin.container_id else None),
+            'compose_project': info.compose_project if info else None,
+            'systemd_unit': origin.systemd_unit
+        }
+
+    def new_usage(self, origin: ProcessOrigin) -> ContainerUsage:
+        """Empty rollup entry for the container of ``origin``"""
+        info = self.container_info(origin)
+        return ContainerUsage(
+            container_id=origin.container_id,
+            name=info.name if info else origin.container_id[:12],
+            compose_project=info.compose_project if info else None,
+            compose_service=info.compose_service if info else None,
+            runtime=origin.runtime
+        )
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'tracked_processes': len(self._origins),
+            'parse_count': self.parse_count,
+            'docker_refresh_count': self.resolver.refresh_count if self.resolver else 0,
+            'docker_error_count': self.resolver.error_count if self.resolver else 0
+        }
+
+
+def merge_gpu_usage(containers: Iterable[ContainerUsage], gpu_metrics) -> List[ContainerUsage]:
+    """Add GPU memory of tagged GPU processes to a CPU/RSS rollup (returns new objects)"""
+    merged = {usage.container_id: replace(usage, gpu_memory_mb=0) for usage in containers}
+    for gpu in gpu_metrics:
+        for process in gpu.processes:
+            if not process.container_id:
+                continue
+            usage = merged.get(process.container_id)
+            if usage is None:
+                # GPU-only container - its processes didn't show up in the scan yet
+                usage = merged[process.container_id] = ContainerUsage(
+                    container_id=process.container_id,
+                    name=process.container_name,
+                    compose_project=process.compose_project
+                )
+            usage.gpu_memory_mb += process.gpu_memory_mb or 0
+    return sorted(merged.values(), key=lambda usage: (usage.cpu_percent, usage.memory_mb), reverse=True)
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Non-Blocking CPU Sampler
+SpicyRiceCakes - CPU utilisation from /proc/stat deltas
+
+Reads /proc/stat once per tick and computes total, per-core and per-state
+utilisation against the previous tick. Nothing ever sleeps, and every
+number in one sample comes from the same window.
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Column order of the cpu lines in /proc/stat (see proc(5))
+CPU_STATES = ('user', 'nice', 'system', 'idle', 'iowait', 'irq', 'softirq', 'steal')
+
+# guest/guest_nice are already included in user/nice, so they are ignored
+_STATE_COUNT = len(CPU_STATES)
+_IDLE_INDEX = CPU_STATES.index('idle')
+_IOWAIT_INDEX = CPU_STATES.index('iowait')
+
+
+@dataclass
+class CPUUtilization:
+    """CPU utilisation over the window between two /proc/stat reads"""
+    usage_percent: float
+    per_core_usage: List[float]
+    per_state_percent: Dict[str, float]
+    window_seconds: float
+
+
+class ProcStatCPUSampler:
+    """Delta-based CPU utilisation sampler backed by /proc/stat"""
+
+    def __init__(self, proc_root: str = '/proc'):
+        self.stat_path = os.path.join(proc_root, 'stat')
+        self._clock_ticks = os.sysconf('SC_CLK_TCK') if hasattr(os, 'sysconf') else 100
+        self._previous: Optional[Tuple[Tuple[int, ...], Dict[str, Tuple[int, ...]]]] = None
+        self._last_result: Optional[CPUUtilization] = None
+
+        # Prime the sampler so the first real tick already has a baseline
+        self.sample()
+
+    @staticmethod
+    def is_supported(proc_root: str = '/proc') -> bool:
+        """Check whether /proc/stat is readable on this host"""
+        return os.access(os.path.join(proc_root, 'stat'), os.R_OK)
+
+    def _read_counters(self) -> Tuple[Tuple[int, ...], Dict[str, Tuple[int, ...]]]:
+        """Read aggregate and per-core jiffy counters in a single read"""
+        with open(self.stat_path, 'rb') as stat_file:
+            data = stat_file.read()
+
+        total = None
+        per_core = {}
+        for line in data.splitlines():
+            if not line.startswith(b'cpu'):
+                # cpu lines come first; everything after them is irrelevant
+                if total is not None:
+                    break
+                continue
+
+            fields = line.split()
+            counters = tuple(int(value) for value in fields[1:_STATE_COUNT + 1])
+            if len(counters) < _STATE_COUNT:
+                counters += (0,) * (_STATE_COUNT - len(counters))
+
+            if fields[0] == b'cpu':
+                total = counters
+            else:
+                per_core[fields[0].decode()] = counters
+
+        if total is None:
+            raise ValueError(f"No aggregate cpu line in {self.stat_path}")
+        return total, per_core
+
+    @staticmethod
+    def _busy_percent(previous: Tuple[int, ...], current: Tuple[int, ...]) -> Optional[float]:
+        deltas = [max(curr - prev, 0) for prev, curr in zip(previous, current)]
+        elapsed = sum(deltas)
+        if elapsed <= 0:
+            return None
+        idle = deltas[_IDLE_INDEX] + deltas[_IOWAIT_INDEX]
+        return round((elapsed - idle) / elapsed * 100, 1)
+
+    def sample(self) -> Optional[CPUUtilization]:
+        """
+        Read /proc/stat and return utilisation since the previous call.
+
+        Returns the previous result when no jiffies elapsed in between
+        (two calls within the same clock tick), and None before a
+        baseline exists.
+        """
+        total, per_core = self._read_counters()
+        previous = self._previous
+        self._previous = (total, per_core)
+
+        if previous is None:
+            return None
+
+        previous_total, previous_per_core = previous
+        deltas = [max(curr - prev, 0) for prev, curr in zip(previous_total, total)]
+        elapsed = sum(deltas)
+        if elapsed <= 0:
+            return self._last_result
+
+        per_state_percent = {
+            state: round(delta / elapsed * 100, 1)
+            for state, delta in zip(CPU_STATES, deltas)
+        }
+
+        # Indexed by core number, so a core going offline can't shift the others;
+        # cores that went offline/online between ticks have no usable delta and read 0
+        core_count = max((int(name[3:]) + 1 for name in list(per_core) + list(previous_per_core)), default=0)
+        per_core_usage = [0.0] * core_count
+        for core, counters in per_core.items():
+            if core in previous_per_core:
+                usage = self._busy_percent(previous_per_core[core], counters)
+                per_core_usage[int(core[3:])] = usage if usage is not None else 0.0
+
+        self._last_result = CPUUtilization(
+            usage_percent=self._busy_percent(previous_total, total),
+            per_core_usage=per_core_usage,
+            per_state_percent=per_state_percent,
+            # Aggregate jiffies advance by CLK_TCK per second per core
+            window_seconds=elapsed / self._clock_ticks / max(len(per_core), 1)
+        )
+        return self._last_result
@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Block Device IO Sampler
+SpicyRiceCakes - Per-device IO rates straight from /proc/diskstats
+
+Reads /proc/diskstats once per tick and turns counter deltas into
+bytes/s, IOPS, average await and utilisation for every block device.
+Each device keeps its own previous sample and timestamp. Device topology
+(partition -> disk, dm/md -> underlying devices, device-mapper names, loop
+backing files) comes from /sys/class/block and is only re-read when the
+set of devices changes. Mounts are mapped onto devices by major:minor.
+"""
+
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# /proc/diskstats always counts 512-byte sectors, whatever the device's block size
+SECTOR_SIZE = 512
+
+
+@dataclass
+class BlockDeviceIO:
+    """IO activity of one block device since its previous sample"""
+    name: str  # Kernel name: sda, sda1, dm-0, md0, loop3, nvme0n1p2
+    device_id: str  # "major:minor"
+    kind: str  # 'disk', 'partition', 'dm', 'md', 'loop'
+    display_name: str  # Device-mapper name when it has one (vg0-root, luks-...), else the kernel name
+    parent: Optional[str] = None  # Whole disk of a partition
+    slaves: List[str] = field(default_factory=list)  # Devices underneath a dm/md/loop device
+    backing_file: Optional[str] = None  # Loop devices only
+    read_bytes_per_sec: Optional[float] = None
+    write_bytes_per_sec: Optional[float] = None
+    read_iops: Optional[float] = None
+    write_iops: Optional[float] = None
+    await_ms: Optional[float] = None  # Average time per completed IO, queueing included
+    utilization_percent: Optional[float] = None  # Share of wall time with IO in flight
+    in_flight: int = 0
+    timestamp: float = None
+
+    def __post_init__(self):
+        if self.timestamp is None:
+            self.timestamp = time.time()
+
+
+# (reads, sectors read, ms reading, writes, sectors written, ms writing, in flight, ms doing IO)
+_Counters = Tuple[int, int, int, int, int, int, int, int]
+
+
+def parse_diskstats(data: bytes) -> Dict[str, Tuple[str, _Counters]]:
+    """name -> (major:minor, counters) from /proc/diskstats (see iostats.rst)"""
+    devices = {}
+    for line in data.splitlines():
+        fields = line.split()
+        if len(fields) < 14:
+            continue
+        try:
+            devices[fields[2].decode()] = (
+                f"{int(fields[0])}:{int(fields[1])}",
+                (int(fields[3]), int(fields[5]), int(fields[6]),
+                 int(fields[7]), int(fields[9]), int(fields[10]),
+                 int(fields[11]), int(fields[12]))
+            )
+        except ValueError:
+            logger.debug(f"Skipping unparseable diskstats line: {line!r}")
+    return devices
+
+
+class DiskStatsSampler:
+    """Per-device IO rates from /proc/diskstats deltas"""
+
+    def __init__(self, proc_root: str = '/proc', sys_root: str = '/sys'):
+        self.diskstats_path = os.path.join(proc_root, 'diskstats')
+        self.block_root = os.path.join(sys_root, 'class', 'block')
+
+        # name -> (counters, monotonic timestamp) from the previous sample
+        self._last_counters: Dict[str, Tuple[_Counters, float]] = {}
+        self._topology: Dict[str, dict] = {}
+        self._topology_names = frozenset()
+        self._devices: Dict[str, BlockDeviceIO] = {}
+
+    @staticmethod
+    def is_supported(proc_root: str = '/proc') -> bool:
+        return os.path.exists(os.path.join(proc_root, 'diskstats'))
+
+    def _read_sys(self, *parts: str) -> Optional[str]:
+        try:
+            with open(os.path.join(self.block_root, *parts)) as sys_file:
+                return sys_file.read().strip()
+        except OSError:
+            return None
+
+    def _list_sys(self, *parts: str) -> List[str]:
+        try:
+            return sorted(os.listdir(os.path.join(self.block_root, *parts)))
+        except OSError:
+            return []
+
+    def _describe(self, name: str) -> dict:
+        """Static topology of one device from /sys/class/block"""
+        parent = None
+        display_name = name
+        backing_file = None
+
+        if os.path.exists(os.path.join(self.block_root, name, 'partition')):
+            kind = 'partition'
+            # /sys/class/block/sda1 -> ../../devices/.../block/sda/sda1
+            parent = os.path.basename(os.path.dirname(os.path.realpath(os.path.join(self.block_root, name))))
+        elif name.startswith('dm-'):
+            kind = 'dm'
+            display_name = self._read_sys(name, 'dm', 'name') or name
+        elif os.path.isdir(os.path.join(self.block_root, name, 'md')):
+            kind = 'md'
+        elif name.startswith('loop'):
+            kind = 'loop'
+            backing_file = self._read_sys(name, 'loop', 'backing_file')
+        else:
+            kind = 'disk'
+
+        return {
+            'kind': kind,
+            'parent': parent,
+            'display_name': display_name,
+            'slaves': self._list_sys(name, 'slaves'),
+            'backing_file': backing_file
+        }
+
+    def _refresh_topology(self, names: frozenset):
+        # Devices come and go rarely (hotplug, lvm, loop setup) - only then touch /sys
+        if names == self._topology_names:
+            return
+        self._topology = {name: self._topology.get(name) or self._describe(name) for name in names}
+        self._topology_names = names
+        logger.debug(f"💽 Block device topology refreshed: {len(names)} devices")
+
+    def sample(self) -> Dict[str, BlockDeviceIO]:
+        """Read /proc/diskstats once and compute rates for every device (keyed by major:minor)"""
+        with open(self.diskstats_path, 'rb') as diskstats_file:
+            data = diskstats_file.read()
+        now = time.monotonic()
+        stats = parse_diskstats(data)
+        self._refresh_topology(frozenset(stats))
+
+        devices = {}
+        current_counters = {}
+        for name, (device_id, counters) in stats.items():
+            current_counters[name] = (counters, now)
+            topology = self._topology[name]
+            device = BlockDeviceIO(
+                name=name,
+                device_id=device_id,
+                kind=topology['kind'],
+                display_name=topology['display_name'],
+                parent=topology['parent'],
+                slaves=topology['slaves'],
+                backing_file=topology['backing_file'],
+                in_flight=counters[6]
+            )
+
+            previous = self._last_counters.get(name)
+            if previous is not None and now > previous[1]:
+                self._apply_rates(device, previous[0], counters, now - previous[1])
+            devices[device_id] = device
+
+        self._last_counters = current_counters
+        self._devices = devices
+        return devices
+
+    @staticmethod
+    def _apply_rates(device: BlockDeviceIO, last: _Counters, current: _Counters, elapsed: float):
+        reads = current[0] - last[0]
+        writes = current[3] - last[3]
+        if reads < 0 or writes < 0:
+            # Counters reset (device re-created) - wait for a fresh baseline
+            return
+
+        device.read_bytes_per_sec = (current[1] - last[1]) * SECTOR_SIZE / elapsed
+        device.write_bytes_per_sec = (current[4] - last[4]) * SECTOR_SIZE / elapsed
+        device.read_iops = reads / elapsed
+        device.write_iops = writes / elapsed
+        completed = reads + writes
+        device.await_ms = ((current[2] - last[2]) + (current[5] - last[5])) / completed if completed else 0.0
+        device.utilization_percent = min((current[7] - last[7]) / (elapsed * 1000) * 100, 100.0)
+
+    def device_for(self, device_id: Optional[str] = None, device_path: str = "") -> Optional[BlockDeviceIO]:
+        """Block device behind a mount, by its major:minor or its /dev node"""
+        device = self._devices.get(device_id) if device_id else None
+        if device is None and device_path.startswith('/dev/'):
+            # btrfs and friends report an anonymous major:minor in mountinfo
+            try:
+                rdev = os.stat(device_path).st_rdev
+                device = self._devices.get(f"{os.major(rdev)}:{os.minor(rdev)}")
+            except OSError:
+                pass
+        return device
+
+    def active_devices(self) -> List[BlockDeviceIO]:
+        """Devices from the last sample that have done any IO since boot"""
+        active = []
+        for device in self._devices.values():
+            counters = self._last_counters[device.name][0]
+            if counters[0] or counters[3]:  # Reads or writes completed
+                active.append(device)
+        return active
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - DRM fdinfo Process Accounting
+SpicyRiceCakes - Which process keeps the GPU engines busy, on any vendor
+
+DRM drivers (amdgpu, i915, xe, msm, panfrost, nouveau, ...) report per
+client engine busy time and memory in /proc/[pid]/fdinfo/<fd> for every
+fd open on /dev/dri. Engine counters are cumulative nanoseconds, so a
+process's utilisation is the delta between two ticks over the wall time.
+
+Finding those fds means a readlink per open fd of every process, far too
+much for every tick. Discovery is therefore incremental: each process's fd
+table is listed on a slow timer and only fd numbers not seen before are
+readlink'd. Between discoveries only the fdinfo files of known DRM fds
+are read. Every few discoveries the cached tables are dropped, so an fd
+number (or pid) reused for a GPU client is picked up within a minute.
+"""
+
+import logging
+import os
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+DRI_PREFIX = '/dev/dri/'
+
+# Every Nth discovery readlinks every fd again instead of only new ones
+FULL_RESCAN_EVERY = 6
+
+_UNITS = {'': 1, 'KiB': 1024, 'MiB': 1024 * 1024, 'GiB': 1024 * 1024 * 1024}
+
+
+@dataclass
+class DRMClientInfo:
+    """One DRM client as reported by a fdinfo file"""
+    driver: str
+    client_id: str
+    pdev: str  # PCI slot, e.g. '0000:03:00.0'
+    engines_ns: Dict[str, int] = field(default_factory=dict)
+    engine_capacity: Dict[str, int] = field(default_factory=dict)
+    memory_bytes: Dict[str, Dict[str, int]] = field(default_factory=dict)  # kind -> region -> bytes
+
+    def vram_bytes(self) -> int:
+        """Resident device memory: vram/local regions when the driver has them, else everything"""
+        for kind in ('resident', 'memory', 'total'):
+            regions = self.memory_bytes.get(kind)
+            if regions:
+                device = {region: size for region, size in regions.items()
+                          if region == 'vram' or region.startswith('local')}
+                return sum((device or regions).values())
+        return 0
+
+
+@dataclass
+class DRMProcessUsage:
+    """GPU usage of one process on one device, summed over its DRM clients"""
+    pid: int
+    pdev: str
+    driver: str
+    engines: Dict[str, float] = field(default_factory=dict)  # engine -> busy percent
+    memory_bytes: int = 0
+    client_count: int = 0
+
+    @property
+    def gpu_utilization(self) -> float:
+        """Busiest 3D/compute engine (all engines if the driver names none of those)"""
+        main = [busy for name, busy in self.engines.items() if name in ('gfx', 'compute', 'render', 'ccs')]
+        busy = main or list(self.engines.values())
+        return max(busy) if busy else 0.0
+
+    @property
+    def encoder_utilization(self) -> Optional[float]:
+        busy = [busy for name, busy in self.engines.items() if name.startswith('enc')]
+        return max(busy) if busy else None
+
+    @property
+    def decoder_utilization(self) -> Optional[float]:
+        # i915/xe 'video' engines do both; they count as decode
+        busy = [busy for name, busy in self.engines.items() if name.startswith(('dec', 'video'))]
+        return max(busy) if busy else None
+
+
+def _parse_amount(value: str) -> Optional[int]:
+    number, _, unit = value.strip().partition(' ')
+    try:
+        return int(number) * _UNITS.get(unit.strip(), 1)
+    except ValueError:
+        return None
+
+
+def parse_fdinfo(data: bytes) -> Optional[DRMClientInfo]:
+    """DRM client of a /proc/[pid]/fdinfo/<fd> file, or None for non-DRM fds"""
+    keys = {}
+    for line in data.decode('utf-8', 'replace').splitlines():
+        key, sep, value = line.partition(':')
+        if sep and key.startswith('drm-'):
+            keys[key] = value.strip()
+    if 'drm-driver' not in keys or 'drm-client-id' not in keys:
+        return None
+
+    client = DRMClientInfo(driver=keys['drm-driver'], client_id=keys['drm-client-id'],
+                           pdev=keys.get('drm-pdev', ''))
+    for key, value in keys.items():
+        if key.startswith('drm-engine-capacity-'):
+            client.engine_capacity[key[len('drm-engine-capacity-'):]] = int(value)
+        elif key.startswith('drm-engine-'):
+            amount = _parse_amount(value.replace(' ns', ''))
+            if amount is not None:
+                client.engines_ns[key[len('drm-engine-'):]] = amount
+        else:
+            for kind in ('memory', 'resident', 'total'):
+                prefix = f'drm-{kind}-'
+                if key.startswith(prefix):
+                    amount = _parse_amount(value)
+                    if amount is not None:
+                        client.memory_bytes.setdefault(kind, {})[key[len(prefix):]] = amount
+    return client
+
+
+def _read(path: str) -> Optional[bytes]:
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return None
+    try:
+        return os.read(fd, 8192)
+    except OSError:
+        return None
+    finally:
+        os.close(fd)
+
+
+class DRMFdinfoCollector:
+    """Per-process GPU engine utilisation and memory from DRM fdinfo"""
+
+    def __init__(self, proc_root: str = '/proc', discovery_interval: float = 10.0):
+        self.proc_root = proc_root
+        self.discovery_interval = discovery_interval
+
+        # pid -> {fd number: is a DRM fd}; only new fd numbers are readlink'd
+        self._fd_table: Dict[int, Dict[int, bool]] = {}
+        self._inaccessible: Set[int] = set()
+        self._last_discovery = None
+        # (pdev, client id) -> (engine ns counters, monotonic ns)
+        self._last_engines: Dict[Tuple[str, str], Tuple[Dict[str, int], int]] = {}
+
+        # Performance tracking
+        self.discovery_count = 0
+        self.readlink_count = 0
+        self.fdinfo_reads = 0
+
+    @staticmethod
+    def is_supported(proc_root: str = '/proc') -> bool:
+        return os.path.exists(os.path.join(proc_root, 'self', 'fdinfo'))
+
+    def _scan_fds(self, pid: int, known: Dict[int, bool]) -> Optional[Dict[int, bool]]:
+        fd_dir = os.path.join(self.proc_root, str(pid), 'fd')
+        try:
+            names = os.listdir(fd_dir)
+        except PermissionError:
+            self._inaccessible.add(pid)  # Not ours to inspect - don't retry every discovery
+            return None
+        except OSError:
+            return None  # Exited
+
+        table = {}
+        for name in names:
+            fd = int(name)
+            is_drm = known.get(fd)
+            if is_drm is None:
+                self.readlink_count += 1
+                try:
+                    is_drm = os.readlink(os.path.join(fd_dir, name)).startswith(DRI_PREFIX)
+                except OSError:
+                    continue
+            table[fd] = is_drm
+        return table
+
+    def _discover(self):
+        try:
+            pids = [int(name) for name in os.listdir(self.proc_root) if name.isdigit()]
+        except OSError:
+            pids = []
+
+        live = set(pids)
+        full_rescan = self.discovery_count % FULL_RESCAN_EVERY == 0
+        if full_rescan:
+            self._inaccessible.clear()
+        fd_table = {}
+        for pid in pids:
+            if pid in self._inaccessible:
+                continue
+            table = self._scan_fds(pid, {} if full_rescan else self._fd_table.get(pid, {}))
+            if table is not None:
+                fd_table[pid] = table
+
+        self._fd_table = fd_table
+        self._inaccessible &= live
+        self._last_discovery = time.monotonic()
+        self.discovery_count += 1
+        clients = sum(1 for table in fd_table.values() if any(table.values()))
+        logger.debug(f"🎮 DRM fd discovery: {clients} processes with /dev/dri open")
+
+    def _drm_fds(self) -> List[Tuple[int, int]]:
+        return [(pid, fd) for pid, table in self._fd_table.items() for fd, is_drm in table.items() if is_drm]
+
+    def collect(self) -> List[DRMProcessUsage]:
+        """Usage per (process, device) - engine percentages need two ticks"""
+        if self._last_discovery is None or time.monotonic() - self._last_discovery >= self.discovery_interval:
+            self._discover()
+
+        now = time.monotonic_ns()
+        usage: Dict[Tuple[int, str], DRMProcessUsage] = {}
+        seen_clients: Set[Tuple[str, str]] = set()
+        engines: Dict[Tuple[str, str], Tuple[Dict[str, int], int]] = {}
+        closed = []
+
+        for pid, fd in sorted(self._drm_fds()):
+            data = _read(os.path.join(self.proc_root, str(pid), 'fdinfo', str(fd)))
+            self.fdinfo_reads += 1
+            client = parse_fdinfo(data) if data else None
+            if client is None:
+                closed.append((pid, fd))  # Closed, or the number now belongs to another file
+                continue
+
+            # dup()ed and inherited fds share a client - count it once, for the lowest pid
+            key = (client.pdev, client.client_id)
+            if key in seen_clients:
+                continue
+            seen_clients.add(key)
+
+            process = usage.get((pid, client.pdev))
+            if process is None:
+                process = usage[(pid, client.pdev)] = DRMProcessUsage(pid=pid, pdev=client.pdev, driver=client.driver)
+            process.client_count += 1
+            process.memory_bytes += client.vram_bytes()
+
+            engines[key] = (client.engines_ns, now)
+            previous = self._last_engines.get(key)
+            if previous is None or now <= previous[1]:
+                continue
+            elapsed = now - previous[1]
+            for engine, busy_ns in client.engines_ns.items():
+                delta = busy_ns - previous[0].get(engine, busy_ns)
+                if delta < 0:
+                    continue
+                capacity = client.engine_capacity.get(engine, 1)
+                percent = min(delta / (elapsed * capacity) * 100, 100.0)
+                process.engines[engine] = process.engines.get(engine, 0.0) + percent
+
+        for pid, fd in closed:
+            self._fd_table.get(pid, {}).pop(fd, None)
+        self._last_engines = engines
+        return sorted(usage.values(), key=lambda process: process.gpu_utilization, reverse=True)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'drm_fds': len(self._drm_fds()),
+            'discovery_count': self.discovery_count,
+            'readlink_count': self.readlink_count,
+            'fdinfo_reads': self.fdinfo_reads
+        }
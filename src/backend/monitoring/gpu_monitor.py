@@ -8,13 +8,25 @@ Answers "Why is my GPU fan running?" by identifying GPU usage and processes.
 
 import logging
 import time
-import re
 import os
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import replace
+from threading import Lock
 from abc import ABC, abstractmethod
 from dataclasses import dataclass
-from typing import List, Dict, Optional, Union
+from typing import Any, List, Dict, Optional, Tuple, Union
 from enum import Enum
 
+import psutil
+
+from .amd_sysfs import AMDGPUDevice, AMDSysfsReader
+from .drm_fdinfo import DRMFdinfoCollector, DRMProcessUsage
+from .gpu_process_pool import GPUProcessPool
+from .host_paths import HostPaths
+from .nvidia_smi_stream import NvidiaSmiStream, SMIGPUSample
+from .nvml_sampler import NVMLFieldSampler, ProcessUtilizationSampler, is_topology_error
+from .process_classifier import ClassificationEngine
+
 logger = logging.getLogger(__name__)
 
 
@@ -32,9 +44,14 @@ class GPUProcess:
     pid: int
     name: str
     gpu_memory_mb: int
-    gpu_utilization: float
+    gpu_utilization: float  # SM utilization, percent of the whole GPU
     command_line: Optional[str] = None
     
+    # Engine utilization (NVIDIA per-process samples; None when not reported)
+    gpu_memory_utilization: Optional[float] = None
+    encoder_utilization: Optional[float] = None
+    decoder_utilization: Optional[float] = None
+    
     # Enhanced process identification
     username: Optional[str] = None
     process_type: Optional[str] = None  # 'gaming', 'ml', 'mining', 'video', 'unknown'
@@ -48,6 +65,12 @@ class GPUProcess:
     is_ml_training: bool = False
     is_video_processing: bool = False
     is_game: bool = False
+    
+    # Where the process runs (see container_index)
+    container_id: Optional[str] = None
+    container_name: Optional[str] = None
+    compose_project: Optional[str] = None
+    systemd_unit: Optional[str] = None
 
 
 @dataclass
@@ -66,11 +89,21 @@ class GPUMetrics:
     # Thermal metrics
     temperature_c: Optional[int] = None
     fan_speed_percent: Optional[int] = None
+    fan_speed_rpm: Optional[int] = None
     
     # Power metrics
     power_draw_watts: Optional[float] = None
     power_limit_watts: Optional[float] = None
     
+    # Clocks, throttling and bus traffic (NVIDIA; None when the GPU doesn't report them)
+    memory_temperature_c: Optional[int] = None
+    clock_graphics_mhz: Optional[int] = None
+    clock_sm_mhz: Optional[int] = None
+    clock_memory_mhz: Optional[int] = None
+    throttle_reasons: Optional[List[str]] = None
+    pcie_tx_kbps: Optional[int] = None
+    pcie_rx_kbps: Optional[int] = None
+    
     # Process attribution
     processes: List[GPUProcess] = None
     
@@ -113,10 +146,49 @@ class ProcessClassifier:
         r'.*wow.*', r'.*minecraft.*', r'.*valorant.*', r'.*league.*'
     ]
     
+    # Category order is priority order (miners first due to security concerns)
+    CATEGORY_RESULTS = [
+        {
+            'process_type': 'mining',
+            'is_suspected_miner': True,
+            'confidence': 0.9,
+        },
+        {
+            'process_type': 'ml',
+            'is_ml_training': True,
+            'confidence': 0.8,
+            'reason': 'Machine learning or AI training process'
+        },
+        {
+            'process_type': 'video',
+            'is_video_processing': True,
+            'confidence': 0.8,
+            'reason': 'Video encoding or processing application'
+        },
+        {
+            'process_type': 'gaming',
+            'is_game': True,
+            'confidence': 0.7,
+            'reason': 'Gaming application'
+        },
+    ]
+    
+    _engine = None
+    
+    @classmethod
+    def get_engine(cls) -> ClassificationEngine:
+        """Compiled matcher for all GPU categories (built on first use)"""
+        if cls._engine is None:
+            cls._engine = ClassificationEngine(cls.category_patterns())
+        return cls._engine
+    
+    @classmethod
+    def category_patterns(cls) -> List[List[str]]:
+        return [cls.MINERS, cls.ML_TRAINING, cls.VIDEO_PROCESSING, cls.GAMES]
+    
     @staticmethod
-    def classify_process(process_name: str, command_line: str = "", executable_path: str = "") -> Dict[str, any]:
-        """Classify a process to determine why it's using GPU"""
-        classification = {
+    def unknown_classification() -> Dict[str, any]:
+        return {
             'process_type': 'unknown',
             'is_suspected_miner': False,
             'is_ml_training': False,
@@ -125,55 +197,30 @@ class ProcessClassifier:
             'confidence': 0.0,
             'reason': 'Unknown process type'
         }
+    
+    @staticmethod
+    def result_for_match(category_index: int, pattern: str) -> Dict[str, any]:
+        """Classification dict for a match in one of the GPU categories"""
+        classification = ProcessClassifier.unknown_classification()
+        classification.update(ProcessClassifier.CATEGORY_RESULTS[category_index])
+        if classification['process_type'] == 'mining':
+            classification['reason'] = f'Suspected cryptocurrency miner (pattern: {pattern})'
+        return classification
+    
+    @staticmethod
+    def classify_process(process_name: str, command_line: str = "", executable_path: str = "") -> Dict[str, any]:
+        """Classify a process to determine why it's using GPU"""
+        engine = ProcessClassifier.get_engine()
         
         # Combine all available text for analysis
-        text_to_analyze = f"{process_name} {command_line} {executable_path}".lower()
-        
-        # Check for miners (highest priority due to security concerns)
-        for pattern in ProcessClassifier.MINERS:
-            if re.search(pattern, text_to_analyze, re.IGNORECASE):
-                classification.update({
-                    'process_type': 'mining',
-                    'is_suspected_miner': True,
-                    'confidence': 0.9,
-                    'reason': f'Suspected cryptocurrency miner (pattern: {pattern})'
-                })
-                return classification
-        
-        # Check for ML/AI training
-        for pattern in ProcessClassifier.ML_TRAINING:
-            if re.search(pattern, text_to_analyze, re.IGNORECASE):
-                classification.update({
-                    'process_type': 'ml',
-                    'is_ml_training': True,
-                    'confidence': 0.8,
-                    'reason': 'Machine learning or AI training process'
-                })
-                return classification
-        
-        # Check for video processing
-        for pattern in ProcessClassifier.VIDEO_PROCESSING:
-            if re.search(pattern, text_to_analyze, re.IGNORECASE):
-                classification.update({
-                    'process_type': 'video',
-                    'is_video_processing': True,
-                    'confidence': 0.8,
-                    'reason': 'Video encoding or processing application'
-                })
-                return classification
-        
-        # Check for games
-        for pattern in ProcessClassifier.GAMES:
-            if re.search(pattern, text_to_analyze, re.IGNORECASE):
-                classification.update({
-                    'process_type': 'gaming',
-                    'is_game': True,
-                    'confidence': 0.7,
-                    'reason': 'Gaming application'
-                })
-                return classification
+        text_to_analyze = engine.normalise(process_name, command_line, executable_path)
+        
+        match = engine.search(text_to_analyze)
+        if match is not None:
+            return ProcessClassifier.result_for_match(match[0], engine.pattern(*match))
         
         # High GPU memory usage without clear classification
+        classification = ProcessClassifier.unknown_classification()
         classification['reason'] = 'Unknown GPU-using process'
         return classification
 
@@ -202,11 +249,127 @@ class GPUMonitor(ABC):
         pass
 
 
+@dataclass
+class NVMLDevice:
+    """Static attributes of one NVIDIA GPU - read once per topology, not per tick"""
+    index: int
+    handle: Any
+    name: str
+    uuid: Optional[str] = None
+    pci_bus_id: Optional[str] = None
+    memory_total_mb: int = 0
+    power_limit_watts: Optional[float] = None
+
+
+@dataclass
+class NVMLDeviceReading:
+    """What one tick asked NVML about one GPU - gathered before any psutil work"""
+    values: Dict[str, Any]
+    compute_processes: List[Tuple[int, int]]  # (pid, GPU memory MB)
+
+
+def _nvml_text(value) -> Optional[str]:
+    """NVML strings are bytes in older bindings and str in newer ones"""
+    if isinstance(value, bytes):
+        return value.decode('utf-8', 'replace')
+    return value
+
+
+def pooled_gpu_process(pool: GPUProcessPool, pid: int, gpu_memory_mb: int) -> Optional[GPUProcess]:
+    """GPUProcess for ``pid`` from its pooled psutil handle (None if it already exited)"""
+    try:
+        # Pooled psutil handle: identity read once, counters via one oneshot() per tick
+        entry, reading = pool.read(pid)
+    except psutil.NoSuchProcess:
+        return None  # Exited since the driver listed it
+    except Exception as e:
+        logger.error(f"Error processing GPU process {pid}: {e}")
+        return None
+    
+    identity = entry.identity
+    classification = entry.classification
+    if identity is None:
+        # Not inspectable (other user, no privileges) - report what the driver knows
+        return GPUProcess(
+            pid=pid,
+            name="<unknown>",
+            gpu_memory_mb=gpu_memory_mb,
+            gpu_utilization=0.0,
+            process_type="unknown",
+            cpu_percent=reading.cpu_percent,
+            memory_mb=reading.memory_mb,
+            runtime_seconds=reading.runtime_seconds
+        )
+    
+    # Create enhanced GPU process object
+    gpu_proc = GPUProcess(
+        pid=pid,
+        name=identity.name,
+        gpu_memory_mb=gpu_memory_mb,
+        gpu_utilization=0.0,  # Filled in from per-process utilization samples
+        command_line=identity.command_line,
+        
+        # Enhanced process identification
+        username=identity.username,
+        process_type=classification['process_type'],
+        cpu_percent=reading.cpu_percent,
+        memory_mb=reading.memory_mb,
+        runtime_seconds=reading.runtime_seconds,
+        executable_path=identity.executable_path,
+        
+        # Process classification flags
+        is_suspected_miner=classification['is_suspected_miner'],
+        is_ml_training=classification['is_ml_training'],
+        is_video_processing=classification['is_video_processing'],
+        is_game=classification['is_game']
+    )
+    
+    # Log interesting processes for debugging - once per process, not every tick
+    if reading.first_seen and classification['confidence'] > 0.5:
+        logger.info(
+            f"🎯 Identified GPU process: {identity.name} (PID {pid}) - "
+            f"{classification['reason']} "
+            f"[{gpu_memory_mb}MB GPU memory]"
+        )
+    
+    return gpu_proc
+
+
+def apply_drm_usage(process: GPUProcess, usage: DRMProcessUsage):
+    """Engine utilisation of a process from DRM fdinfo"""
+    process.gpu_utilization = usage.gpu_utilization
+    process.encoder_utilization = usage.encoder_utilization
+    process.decoder_utilization = usage.decoder_utilization
+
+
 class NVIDIAMonitor(GPUMonitor):
     """NVIDIA GPU monitoring using nvidia-ml-py"""
     
-    def __init__(self):
+    # The device count is re-checked on this interval to notice hot-plug / driver reloads
+    TOPOLOGY_CHECK_INTERVAL = 60.0
+    
+    # Upper bound on GPUs queried at the same time
+    MAX_DEVICE_WORKERS = 8
+    
+    def __init__(self, concurrent_devices: bool = True):
         self._nvml_initialized = False
+        
+        # NVML releases the GIL, so several GPUs can be queried at once
+        self.concurrent_devices = concurrent_devices
+        self._device_pool: Optional[ThreadPoolExecutor] = None
+        self._devices: List[NVMLDevice] = []
+        self._driver_version = None
+        self._topology_stale = True
+        self._last_topology_check = 0.0
+        
+        # psutil handles of GPU processes, kept across ticks
+        self._process_pool = GPUProcessPool(ProcessClassifier.classify_process)
+        proc_root = HostPaths.from_env().proc_root
+        self._fdinfo = DRMFdinfoCollector(proc_root) if DRMFdinfoCollector.is_supported(proc_root) else None
+        
+        # Performance tracking
+        self.topology_load_count = 0
+        
         self._initialize_nvml()
     
     def _initialize_nvml(self):
@@ -216,32 +379,80 @@ class NVIDIAMonitor(GPUMonitor):
             pynvml.nvmlInit()
             self._nvml_initialized = True
             self._pynvml = pynvml
+            self._field_sampler = NVMLFieldSampler(pynvml)
+            self._process_utilization = ProcessUtilizationSampler(pynvml)
+            self._load_topology()
             logger.info("🔥 NVIDIA GPU monitoring initialized successfully")
         except ImportError:
             logger.warning("nvidia-ml-py not installed - NVIDIA monitoring unavailable")
         except Exception as e:
             logger.error(f"Failed to initialize NVIDIA monitoring: {e}")
     
+    def _load_topology(self):
+        """Read handles and static attributes of every GPU (start-up and topology changes)"""
+        nvml = self._pynvml
+        devices = []
+        for index in range(nvml.nvmlDeviceGetCount()):
+            handle = nvml.nvmlDeviceGetHandleByIndex(index)
+            device = NVMLDevice(index=index, handle=handle, name=_nvml_text(nvml.nvmlDeviceGetName(handle)))
+            try:
+                device.uuid = _nvml_text(nvml.nvmlDeviceGetUUID(handle))
+            except nvml.NVMLError:
+                pass
+            try:
+                device.pci_bus_id = _nvml_text(nvml.nvmlDeviceGetPciInfo(handle).busId)
+            except nvml.NVMLError:
+                pass
+            try:
+                device.memory_total_mb = nvml.nvmlDeviceGetMemoryInfo(handle).total // (1024 * 1024)
+            except nvml.NVMLError:
+                pass
+            try:
+                device.power_limit_watts = nvml.nvmlDeviceGetPowerManagementLimitConstraints(handle)[1] / 1000.0
+            except nvml.NVMLError:
+                pass
+            devices.append(device)
+        
+        try:
+            self._driver_version = _nvml_text(nvml.nvmlSystemGetDriverVersion())
+        except nvml.NVMLError as e:
+            logger.error(f"Failed to get NVIDIA driver version: {e}")
+            self._driver_version = None
+        
+        self._devices = devices
+        self._field_sampler.reset()
+        self._process_utilization.reset()
+        self._topology_stale = False
+        self._last_topology_check = time.monotonic()
+        self.topology_load_count += 1
+        logger.info(f"🔥 NVIDIA topology: {len(devices)} GPU(s), driver {self._driver_version}")
+    
+    def invalidate_topology(self):
+        """Re-read handles and static attributes on the next tick"""
+        self._topology_stale = True
+    
+    def _ensure_topology(self):
+        """Reload the device table when it was invalidated or the GPU count changed"""
+        now = time.monotonic()
+        if not self._topology_stale and now - self._last_topology_check >= self.TOPOLOGY_CHECK_INTERVAL:
+            self._last_topology_check = now
+            if self._pynvml.nvmlDeviceGetCount() != len(self._devices):
+                self._topology_stale = True
+        if self._topology_stale:
+            self._load_topology()
+    
     def is_available(self) -> bool:
         return self._nvml_initialized
     
     def get_gpu_count(self) -> int:
         if not self.is_available():
             return 0
-        try:
-            return self._pynvml.nvmlDeviceGetCount()
-        except Exception as e:
-            logger.error(f"Failed to get NVIDIA GPU count: {e}")
-            return 0
+        return len(self._devices)
     
     def get_driver_version(self) -> Optional[str]:
         if not self.is_available():
             return None
-        try:
-            return self._pynvml.nvmlSystemGetDriverVersion().decode('utf-8')
-        except Exception as e:
-            logger.error(f"Failed to get NVIDIA driver version: {e}")
-            return None
+        return self._driver_version
     
     def get_gpu_metrics(self, gpu_id: int = None) -> Union[GPUMetrics, List[GPUMetrics]]:
         """Get NVIDIA GPU metrics with full process attribution"""
@@ -249,239 +460,311 @@ class NVIDIAMonitor(GPUMonitor):
             return []
         
         try:
-            gpu_count = self.get_gpu_count()
-            if gpu_count == 0:
+            self._ensure_topology()
+            if not self._devices:
                 return []
             
+            devices = self._devices if gpu_id is None else [self._devices[gpu_id]]
+            readings = self._read_devices(devices)
+            
+            # psutil enrichment runs here, once per pid however many GPUs it uses
+            self._process_pool.begin_tick()
+            drm_usages = self._fdinfo.collect() if self._fdinfo else []
+            enriched = self._enrich_processes(readings)
+            metrics = [self._build_gpu_metrics(device, reading, enriched, drm_usages)
+                       for device, reading in zip(devices, readings)]
             if gpu_id is not None:
-                return self._get_single_gpu_metrics(gpu_id)
-            else:
-                return [self._get_single_gpu_metrics(i) for i in range(gpu_count)]
+                return metrics[0]
+            
+            self._process_pool.evict_unseen()
+            return metrics
         
         except Exception as e:
+            if is_topology_error(self._pynvml, e):
+                logger.warning(f"🔥 NVIDIA GPU topology changed ({e}) - reloading devices")
+                self.invalidate_topology()
             logger.error(f"Failed to get NVIDIA GPU metrics: {e}")
             return []
     
-    def _get_single_gpu_metrics(self, gpu_id: int) -> GPUMetrics:
-        """Get metrics for a single NVIDIA GPU"""
-        handle = self._pynvml.nvmlDeviceGetHandleByIndex(gpu_id)
-        
-        # Basic GPU info
-        name = self._pynvml.nvmlDeviceGetName(handle).decode('utf-8')
+    def _read_devices(self, devices: List[NVMLDevice]) -> List[NVMLDeviceReading]:
+        """NVML reads of every device - concurrently when there is more than one"""
+        if not self.concurrent_devices or len(devices) < 2:
+            return [self._read_device(device) for device in devices]
         
-        # Memory info
-        memory_info = self._pynvml.nvmlDeviceGetMemoryInfo(handle)
-        memory_used_mb = memory_info.used // (1024 * 1024)
-        memory_total_mb = memory_info.total // (1024 * 1024)
-        memory_percent = (memory_info.used / memory_info.total) * 100
+        if self._device_pool is None:
+            self._device_pool = ThreadPoolExecutor(
+                max_workers=self.MAX_DEVICE_WORKERS, thread_name_prefix='hoof-hearted-nvml'
+            )
+        # map() re-raises the first device's error (e.g. GPU lost) here, like the serial path
+        return list(self._device_pool.map(self._read_device, devices))
+    
+    def _read_device(self, device: NVMLDevice) -> NVMLDeviceReading:
+        """Only the fields that change between ticks - may run on a worker thread"""
+        handle = device.handle
         
-        # Utilization
-        utilization = self._pynvml.nvmlDeviceGetUtilizationRates(handle)
-        utilization_percent = utilization.gpu
-        
-        # Temperature
-        try:
-            temperature_c = self._pynvml.nvmlDeviceGetTemperature(handle, self._pynvml.NVML_TEMPERATURE_GPU)
-        except:
-            temperature_c = None
-        
-        # Fan speed
-        try:
-            fan_speed_percent = self._pynvml.nvmlDeviceGetFanSpeed(handle)
-        except:
-            fan_speed_percent = None
-        
-        # Power
+        # One field-values batch plus per-group calls for the rest; unsupported fields are skipped
+        values = self._field_sampler.sample(device.index, handle)
+        self._process_utilization.update(device.index, handle)
+        return NVMLDeviceReading(values=values, compute_processes=self._get_compute_processes(handle))
+    
+    def _get_compute_processes(self, handle) -> List[Tuple[int, int]]:
+        """(pid, GPU memory MB) of the processes NVML lists on this GPU"""
         try:
-            power_draw_watts = self._pynvml.nvmlDeviceGetPowerUsage(handle) / 1000.0  # mW to W
-        except:
-            power_draw_watts = None
+            return [(proc.pid, (proc.usedGpuMemory or 0) // (1024 * 1024))  # Bytes to MB
+                    for proc in self._pynvml.nvmlDeviceGetComputeRunningProcesses(handle)]
+        except Exception as e:
+            logger.error(f"Failed to get GPU processes: {e}")
+            return []
+    
+    def _enrich_processes(self, readings: List[NVMLDeviceReading]) -> Dict[int, GPUProcess]:
+        """One GPUProcess per distinct pid across all GPUs (pids that exited are left out)"""
+        enriched = {}
+        for reading in readings:
+            for pid, gpu_memory_mb in reading.compute_processes:
+                if pid not in enriched:
+                    enriched[pid] = pooled_gpu_process(self._process_pool, pid, gpu_memory_mb)
+        return {pid: process for pid, process in enriched.items() if process is not None}
+    
+    def _build_gpu_metrics(self, device: NVMLDevice, reading: NVMLDeviceReading,
+                           enriched: Dict[int, GPUProcess], drm_usages: List[DRMProcessUsage]) -> GPUMetrics:
+        """GPUMetrics of one GPU from its NVML reading and the shared process enrichment"""
+        values = reading.values
         
-        try:
-            power_limit_watts = self._pynvml.nvmlDeviceGetPowerManagementLimitConstraints(handle)[1] / 1000.0
-        except:
-            power_limit_watts = None
+        memory_used_bytes = values.get('memory_used_bytes', 0)
+        memory_total_bytes = values.get('memory_total_bytes') or device.memory_total_mb * 1024 * 1024
+        memory_total_mb = device.memory_total_mb or memory_total_bytes // (1024 * 1024)
+        memory_percent = (memory_used_bytes / memory_total_bytes) * 100 if memory_total_bytes else 0.0
         
         # Process attribution - THE KEY FEATURE!
-        processes = self._get_gpu_processes(handle)
+        processes = []
+        for pid, gpu_memory_mb in reading.compute_processes:
+            if pid in enriched:
+                # A copy per GPU: memory and utilization are per device
+                gpu_proc = replace(enriched[pid], gpu_memory_mb=gpu_memory_mb)
+                self._apply_process_utilization(device.index, gpu_proc)
+                processes.append(gpu_proc)
+        self._add_drm_clients(device, processes, drm_usages)
         
         return GPUMetrics(
-            gpu_id=gpu_id,
-            name=name,
+            gpu_id=device.index,
+            name=device.name,
             vendor=GPUVendor.NVIDIA,
-            utilization_percent=utilization_percent,
-            memory_used_mb=memory_used_mb,
+            utilization_percent=values.get('utilization_percent', 0.0),
+            memory_used_mb=memory_used_bytes // (1024 * 1024),
             memory_total_mb=memory_total_mb,
             memory_percent=memory_percent,
-            temperature_c=temperature_c,
-            fan_speed_percent=fan_speed_percent,
-            power_draw_watts=power_draw_watts,
-            power_limit_watts=power_limit_watts,
+            temperature_c=values.get('temperature_c'),
+            fan_speed_percent=values.get('fan_speed_percent'),
+            power_draw_watts=values.get('power_draw_watts'),
+            power_limit_watts=device.power_limit_watts,
+            memory_temperature_c=values.get('memory_temperature_c'),
+            clock_graphics_mhz=values.get('clock_graphics_mhz'),
+            clock_sm_mhz=values.get('clock_sm_mhz'),
+            clock_memory_mhz=values.get('clock_memory_mhz'),
+            throttle_reasons=values.get('throttle_reasons'),
+            pcie_tx_kbps=values.get('pcie_tx_kbps'),
+            pcie_rx_kbps=values.get('pcie_rx_kbps'),
             processes=processes,
-            driver_version=self.get_driver_version()
+            driver_version=self._driver_version
         )
     
-    def _get_gpu_processes(self, handle) -> List[GPUProcess]:
-        """Get processes using this GPU - answers 'Why is my GPU fan running?'"""
-        try:
-            processes = []
-            # Get GPU processes using NVIDIA-ML
-            gpu_processes = self._pynvml.nvmlDeviceGetComputeRunningProcesses(handle)
-            
-            for proc in gpu_processes:
-                try:
-                    # Get process info using psutil for additional details
-                    import psutil
-                    ps_proc = psutil.Process(proc.pid)
-                    
-                    # Gather comprehensive process information
-                    process_name = ps_proc.name()
-                    command_line = ' '.join(ps_proc.cmdline()) if ps_proc.cmdline() else ""
-                    executable_path = ps_proc.exe() if hasattr(ps_proc, 'exe') else ""
-                    username = ps_proc.username() if hasattr(ps_proc, 'username') else None
-                    
-                    # Get system resource usage
-                    cpu_percent = ps_proc.cpu_percent()
-                    memory_info = ps_proc.memory_info()
-                    memory_mb = memory_info.rss // (1024 * 1024)  # RSS in MB
-                    runtime_seconds = time.time() - ps_proc.create_time()
-                    
-                    # Classify the process to understand why it's using GPU
-                    classification = ProcessClassifier.classify_process(
-                        process_name, command_line, executable_path
-                    )
-                    
-                    # Create enhanced GPU process object
-                    gpu_proc = GPUProcess(
-                        pid=proc.pid,
-                        name=process_name,
-                        gpu_memory_mb=proc.usedGpuMemory // (1024 * 1024),  # Bytes to MB
-                        gpu_utilization=0.0,  # NVIDIA-ML doesn't provide per-process utilization
-                        command_line=command_line,
-                        
-                        # Enhanced process identification
-                        username=username,
-                        process_type=classification['process_type'],
-                        cpu_percent=cpu_percent,
-                        memory_mb=memory_mb,
-                        runtime_seconds=runtime_seconds,
-                        executable_path=executable_path,
-                        
-                        # Process classification flags
-                        is_suspected_miner=classification['is_suspected_miner'],
-                        is_ml_training=classification['is_ml_training'],
-                        is_video_processing=classification['is_video_processing'],
-                        is_game=classification['is_game']
-                    )
-                    
-                    processes.append(gpu_proc)
-                    
-                    # Log interesting processes for debugging
-                    if classification['confidence'] > 0.5:
-                        logger.info(
-                            f"🎯 Identified GPU process: {process_name} (PID {proc.pid}) - "
-                            f"{classification['reason']} "
-                            f"[{proc.usedGpuMemory // (1024 * 1024)}MB GPU memory]"
-                        )
-                    
-                except (psutil.NoSuchProcess, psutil.AccessDenied) as e:
-                    # Process might have ended or be inaccessible
-                    logger.warning(f"Could not access process {proc.pid}: {e}")
-                    processes.append(GPUProcess(
-                        pid=proc.pid,
-                        name="<unknown>",
-                        gpu_memory_mb=proc.usedGpuMemory // (1024 * 1024),
-                        gpu_utilization=0.0,
-                        process_type="unknown"
-                    ))
-                except Exception as e:
-                    logger.error(f"Error processing GPU process {proc.pid}: {e}")
-            
-            return processes
-        except Exception as e:
-            logger.error(f"Failed to get GPU processes: {e}")
-            return []
+    def _apply_process_utilization(self, index: int, process: GPUProcess):
+        """Which process actually burns SM/encoder time, not just which one holds VRAM"""
+        utilization = self._process_utilization.utilization(index, process.pid)
+        if utilization is None:
+            return
+        process.gpu_utilization = utilization.sm_percent
+        process.gpu_memory_utilization = utilization.memory_percent
+        process.encoder_utilization = utilization.encoder_percent
+        process.decoder_utilization = utilization.decoder_percent
+    
+    def _add_drm_clients(self, device: NVMLDevice, processes: List[GPUProcess], usages: List[DRMProcessUsage]):
+        """Graphics clients NVML's compute list misses, from DRM fdinfo"""
+        pdev = (device.pci_bus_id or '').lower()[-12:]  # NVML pads the PCI domain to 8 digits
+        listed = {process.pid for process in processes}
+        for usage in usages:
+            if usage.pdev != pdev or usage.pid in listed:
+                continue
+            gpu_proc = pooled_gpu_process(self._process_pool, usage.pid, usage.memory_bytes // (1024 * 1024))
+            if gpu_proc is not None:
+                apply_drm_usage(gpu_proc, usage)
+                processes.append(gpu_proc)
 
 
 class AMDMonitor(GPUMonitor):
-    """AMD GPU monitoring using amdsmi (future implementation)"""
-    
-    def __init__(self):
-        # TODO: Implement AMD monitoring with amdsmi
-        logger.info("AMD GPU monitoring not yet implemented")
+    """AMD GPU monitoring straight from amdgpu's sysfs/hwmon files"""
+    
+    def __init__(self, sys_root: Optional[str] = None, proc_root: Optional[str] = None):
+        host_paths = HostPaths.from_env()
+        self.sys_root = sys_root or host_paths.sys_root
+        self.proc_root = proc_root or host_paths.proc_root
+        self._reader = AMDSysfsReader(self.sys_root) if AMDSysfsReader.is_supported(self.sys_root) else None
+        self._driver_version = self._reader.driver_version() if self.is_available() else None
+        
+        # Per-process attribution from DRM fdinfo
+        self._process_pool = GPUProcessPool(ProcessClassifier.classify_process)
+        self._fdinfo = None
+        if self.is_available() and DRMFdinfoCollector.is_supported(self.proc_root):
+            self._fdinfo = DRMFdinfoCollector(self.proc_root)
     
     def is_available(self) -> bool:
-        return False
+        return self._reader is not None and bool(self._reader.devices)
     
     def get_gpu_count(self) -> int:
-        return 0
+        return len(self._reader.devices) if self._reader else 0
     
     def get_gpu_metrics(self, gpu_id: int = None) -> Union[GPUMetrics, List[GPUMetrics]]:
-        return []
+        if not self.is_available():
+            return []
+        
+        try:
+            self._process_pool.begin_tick()
+            drm_usages = self._fdinfo.collect() if self._fdinfo else []
+            if gpu_id is not None:
+                return self._get_single_gpu_metrics(self._reader.devices[gpu_id], drm_usages)
+            
+            metrics = [self._get_single_gpu_metrics(device, drm_usages) for device in self._reader.devices]
+            self._process_pool.evict_unseen()
+            return metrics
+        except OSError as e:
+            # Card removed or driver reloaded - the open fds are dead, rediscover next tick
+            logger.warning(f"🔴 AMD GPU read failed ({e}) - rediscovering cards")
+            self._reader.discover()
+            return []
+        except Exception as e:
+            logger.error(f"Failed to get AMD GPU metrics: {e}")
+            return []
+    
+    def _get_single_gpu_metrics(self, device: AMDGPUDevice, drm_usages: List[DRMProcessUsage]) -> GPUMetrics:
+        values = device.read()
+        
+        processes = []
+        for usage in drm_usages:
+            if usage.pdev != device.pci_slot:
+                continue
+            gpu_proc = pooled_gpu_process(self._process_pool, usage.pid, usage.memory_bytes // (1024 * 1024))
+            if gpu_proc is not None:
+                apply_drm_usage(gpu_proc, usage)
+                processes.append(gpu_proc)
+        
+        memory_used_bytes = values.get('memory_used_bytes', 0)
+        memory_total_bytes = device.memory_total_bytes
+        fan_pwm = values.get('fan_pwm')
+        power_draw_uw = values.get('power_draw_uw')
+        temperatures = {key: values[key] // 1000 for key in ('temperature_c', 'memory_temperature_c')
+                        if key in values}  # Millidegrees
+        
+        return GPUMetrics(
+            gpu_id=device.index,
+            name=device.name,
+            vendor=GPUVendor.AMD,
+            utilization_percent=float(values.get('utilization_percent', 0)),
+            memory_used_mb=memory_used_bytes // (1024 * 1024),
+            memory_total_mb=memory_total_bytes // (1024 * 1024),
+            memory_percent=(memory_used_bytes / memory_total_bytes) * 100 if memory_total_bytes else 0.0,
+            temperature_c=temperatures.get('temperature_c'),
+            fan_speed_percent=round(fan_pwm * 100 / device.pwm_max) if fan_pwm is not None else None,
+            fan_speed_rpm=values.get('fan_speed_rpm'),
+            power_draw_watts=power_draw_uw / 1_000_000 if power_draw_uw is not None else None,  # µW to W
+            power_limit_watts=device.power_cap_watts,
+            memory_temperature_c=temperatures.get('memory_temperature_c'),
+            processes=processes,
+            driver_version=self._driver_version
+        )
     
     def get_driver_version(self) -> Optional[str]:
-        return None
+        return self._driver_version
 
 
 class BasicMonitor(GPUMonitor):
-    """Basic GPU monitoring using system calls (fallback)"""
+    """Basic NVIDIA monitoring from a persistent nvidia-smi stream (fallback without NVML)"""
     
-    def __init__(self):
+    # How long start-up waits for nvidia-smi's first sample
+    FIRST_SAMPLE_TIMEOUT = 3.0
+    
+    def __init__(self, command: str = 'nvidia-smi', interval_ms: int = 1000):
         logger.info("Using basic GPU monitoring (limited functionality)")
+        self._stream = None
+        self._process_pool = GPUProcessPool(ProcessClassifier.classify_process)
+        
+        if NvidiaSmiStream.is_supported(command):
+            # One nvidia-smi for our whole uptime instead of one per call
+            self._stream = NvidiaSmiStream(command, interval_ms)
+            self._stream.start()
+            if not self._stream.wait_for_sample(self.FIRST_SAMPLE_TIMEOUT):
+                logger.warning("⚠️ nvidia-smi has not reported any GPU yet")
     
     def is_available(self) -> bool:
         return True
     
     def get_gpu_count(self) -> int:
-        # Try to detect GPUs using basic methods
-        try:
-            import GPUtil
-            return len(GPUtil.getGPUs())
-        except:
+        if self._stream is None:
             return 0
+        return len(self._stream.gpus())
     
     def get_gpu_metrics(self, gpu_id: int = None) -> Union[GPUMetrics, List[GPUMetrics]]:
-        """Basic GPU metrics using GPUtil (NVIDIA only)"""
+        """Basic GPU metrics from the newest nvidia-smi sample (NVIDIA only)"""
+        if self._stream is None:
+            return []
+        
         try:
-            import GPUtil
-            gpus = GPUtil.getGPUs()
+            gpus = self._stream.gpus()
             
             if not gpus:
                 return []
             
+            self._process_pool.begin_tick()
             if gpu_id is not None:
                 if gpu_id < len(gpus):
-                    return self._gpu_to_metrics(gpus[gpu_id], gpu_id)
+                    return self._sample_to_metrics(gpus[gpu_id])
                 return None
             
-            return [self._gpu_to_metrics(gpu, i) for i, gpu in enumerate(gpus)]
+            metrics = [self._sample_to_metrics(gpu) for gpu in gpus]
+            self._process_pool.evict_unseen()
+            return metrics
         
         except Exception as e:
             logger.error(f"Failed to get basic GPU metrics: {e}")
             return []
     
-    def _gpu_to_metrics(self, gpu, gpu_id: int) -> GPUMetrics:
-        """Convert GPUtil GPU to our metrics format"""
+    def _sample_to_metrics(self, gpu: SMIGPUSample) -> GPUMetrics:
+        """Convert an nvidia-smi row to our metrics format"""
+        memory_used_mb = gpu.memory_used_mb or 0
+        memory_total_mb = gpu.memory_total_mb or 0
+        processes = []
+        for row in self._stream.processes(gpu.uuid):
+            gpu_proc = pooled_gpu_process(self._process_pool, row.pid, row.gpu_memory_mb)
+            if gpu_proc is not None:
+                processes.append(gpu_proc)
+        
         return GPUMetrics(
-            gpu_id=gpu_id,
+            gpu_id=gpu.index,
             name=gpu.name,
-            vendor=GPUVendor.NVIDIA,  # GPUtil only supports NVIDIA
-            utilization_percent=gpu.load * 100,
-            memory_used_mb=gpu.memoryUsed,
-            memory_total_mb=gpu.memoryTotal,
-            memory_percent=(gpu.memoryUsed / gpu.memoryTotal) * 100,
-            temperature_c=int(gpu.temperature) if gpu.temperature else None,
-            driver_version=gpu.driver,
-            processes=[]  # No process attribution in basic mode
+            vendor=GPUVendor.NVIDIA,  # nvidia-smi only knows NVIDIA GPUs
+            utilization_percent=gpu.utilization_percent or 0.0,
+            memory_used_mb=memory_used_mb,
+            memory_total_mb=memory_total_mb,
+            memory_percent=(memory_used_mb / memory_total_mb) * 100 if memory_total_mb else 0.0,
+            temperature_c=gpu.temperature_c,
+            fan_speed_percent=gpu.fan_speed_percent,
+            power_draw_watts=gpu.power_draw_watts,
+            power_limit_watts=gpu.power_limit_watts,
+            clock_graphics_mhz=gpu.clock_graphics_mhz,
+            clock_sm_mhz=gpu.clock_sm_mhz,
+            clock_memory_mhz=gpu.clock_memory_mhz,
+            processes=processes,
+            driver_version=gpu.driver_version,
+            timestamp=gpu.timestamp  # When nvidia-smi printed it, not when we served it
         )
     
     def get_driver_version(self) -> Optional[str]:
-        try:
-            import GPUtil
-            gpus = GPUtil.getGPUs()
-            return gpus[0].driver if gpus else None
-        except:
-            return None
+        gpus = self._stream.gpus() if self._stream else []
+        return gpus[0].driver_version if gpus else None
+    
+    def close(self):
+        """Stop the nvidia-smi children"""
+        if self._stream is not None:
+            self._stream.stop()
 
 
 class GPUMonitorFactory:
@@ -511,34 +794,72 @@ class GPUMonitorFactory:
 class GPUMonitoringService:
     """Main service for GPU monitoring with caching and error handling"""
     
-    def __init__(self, update_interval: float = 2.0):
-        self.monitor = GPUMonitorFactory.create_monitor()
+    def __init__(self, update_interval: float = 2.0, out_of_process: bool = False,
+                 sampler_deadline: float = 15.0, monitor_factory=None):
+        # GPU PIDs are host PIDs - resolve them through the host's proc when it is mounted
+        HostPaths.from_env().configure_psutil()
+        self._sampler = None
+        if out_of_process:
+            # Driver calls run in a watched child process - a hung GPU can't freeze the API
+            from .gpu_sampler_process import ProcessGPUMonitor, create_host_monitor
+            self._sampler = ProcessGPUMonitor(monitor_factory or create_host_monitor,
+                                              interval=update_interval, deadline=sampler_deadline)
+            self._sampler.start()
+            if not self._sampler.wait_for_sample(sampler_deadline):
+                logger.warning("⚠️ GPU sampler has not delivered a first sample")
+            self.monitor = self._sampler
+        else:
+            self.monitor = (monitor_factory or GPUMonitorFactory.create_monitor)()
         self.update_interval = update_interval
         self._last_update = 0
         self._cached_metrics = []
         self._is_monitoring = False
+        
+        # Single-flight refresh: one collection per expiry, everyone else reuses it
+        self._refresh_lock = Lock()
+        self._refresh_generation = 0
+        self.collection_count = 0
     
     def get_gpu_metrics(self, force_update: bool = False) -> List[GPUMetrics]:
         """Get GPU metrics with caching"""
-        current_time = time.time()
+        if not force_update and not self._is_cache_expired():
+            return self._cached_metrics
         
-        if force_update or (current_time - self._last_update) >= self.update_interval:
-            try:
-                metrics = self.monitor.get_gpu_metrics()
-                if isinstance(metrics, GPUMetrics):
-                    metrics = [metrics]
-                
-                self._cached_metrics = metrics
-                self._last_update = current_time
-                
-                # Log interesting findings for debugging
-                self._log_gpu_status(metrics)
-                
-            except Exception as e:
-                logger.error(f"Failed to update GPU metrics: {e}")
+        generation = self._refresh_generation
+        with self._refresh_lock:
+            # Another caller refreshed while we were waiting - reuse its result
+            if self._refresh_generation != generation:
+                return self._cached_metrics
+            if not force_update and not self._is_cache_expired():
+                return self._cached_metrics
+            
+            self._refresh_metrics()
+            self._refresh_generation += 1
         
         return self._cached_metrics
     
+    def _is_cache_expired(self) -> bool:
+        return (time.time() - self._last_update) >= self.update_interval
+    
+    def _refresh_metrics(self):
+        """Collect GPU metrics once - callers must hold ``_refresh_lock``"""
+        current_time = time.time()
+        self.collection_count += 1
+        
+        try:
+            metrics = self.monitor.get_gpu_metrics()
+            if isinstance(metrics, GPUMetrics):
+                metrics = [metrics]
+            
+            self._cached_metrics = metrics
+            self._last_update = current_time
+            
+            # Log interesting findings for debugging
+            self._log_gpu_status(metrics)
+            
+        except Exception as e:
+            logger.error(f"Failed to update GPU metrics: {e}")
+    
     def _log_gpu_status(self, metrics: List[GPUMetrics]):
         """Log GPU status for debugging 'Why is my GPU fan running?'"""
         for gpu in metrics:
@@ -568,20 +889,36 @@ class GPUMonitoringService:
         """Check if GPU monitoring is available"""
         return self.monitor.is_available()
     
-    def get_summary(self) -> Dict:
-        """Get summary information for dashboard"""
-        metrics = self.get_gpu_metrics()
+    def close(self):
+        """Stop the out-of-process sampler, if there is one"""
+        if self._sampler is not None:
+            self._sampler.stop()
+    
+    def get_summary(self, metrics: Optional[List[GPUMetrics]] = None) -> Dict:
+        """Get summary information for dashboard (from ``metrics`` when given, e.g. a sampler snapshot)"""
+        if metrics is None:
+            metrics = self.get_gpu_metrics()
         
         if not metrics:
-            return {
+            summary = {
                 "gpu_count": 0,
                 "monitoring_available": False,
                 "message": "No GPUs detected or monitoring unavailable"
             }
+        else:
+            summary = self._metrics_summary(metrics)
         
+        if self._sampler is not None:
+            summary["sampler"] = self._sampler.get_status()
+            if summary["sampler"]["state"] == "stale":
+                summary["monitoring_available"] = False
+                summary["message"] = "GPU sampler stale - the GPU driver stopped responding"
+        return summary
+    
+    def _metrics_summary(self, metrics: List[GPUMetrics]) -> Dict:
         total_processes = sum(len(gpu.processes) for gpu in metrics)
         max_utilization = max(gpu.utilization_percent for gpu in metrics)
-        max_temperature = max(gpu.temperature_c for gpu in metrics if gpu.temperature_c)
+        max_temperature = max((gpu.temperature_c for gpu in metrics if gpu.temperature_c), default=None)
         
         return {
             "gpu_count": len(metrics),
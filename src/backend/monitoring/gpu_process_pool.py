@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - GPU Process Handle Pool
+SpicyRiceCakes - One psutil.Process per GPU process lifetime
+
+GPU processes are few and long-lived, so their psutil.Process handles are
+kept across ticks instead of being rebuilt every time. That makes
+cpu_percent() meaningful (a fresh handle always reports 0.0), lets the
+immutable attributes (name, command line, executable, owner, classification)
+be read once, and leaves each tick with one oneshot() read of the counters.
+Handles are evicted once their process stops showing up on any GPU.
+"""
+
+import logging
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, Optional, Set, Tuple
+
+import psutil
+
+from .process_cache import ProcessIdentity
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class GPUProcessReading:
+    """Per-tick usage of a pooled process"""
+    cpu_percent: Optional[float]  # None on the first tick - psutil needs a baseline
+    memory_mb: int
+    runtime_seconds: float
+    first_seen: bool = False  # First tick this process was pooled
+
+
+@dataclass
+class PooledProcess:
+    """A live psutil handle plus the attributes that never change while it runs"""
+    process: psutil.Process
+    identity: Optional[ProcessIdentity]  # None when the process can't be inspected
+    create_time: float
+    classification: Dict[str, Any]
+    sampled: bool = False
+
+
+class GPUProcessPool:
+    """pid -> PooledProcess, reused across ticks and evicted when the process is gone"""
+
+    def __init__(self, classify: Callable[[str, str, str], Dict[str, Any]]):
+        self.classify = classify
+
+        self._entries: Dict[int, PooledProcess] = {}
+        # This tick's readings - a process on several GPUs is read once
+        self._readings: Dict[int, Tuple[PooledProcess, GPUProcessReading]] = {}
+        self._seen: Set[int] = set()
+
+        # Performance tracking
+        self.open_count = 0
+        self.read_count = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _open(self, pid: int) -> PooledProcess:
+        process = psutil.Process(pid)
+        self.open_count += 1
+        try:
+            with process.oneshot():
+                name = process.name()
+                command_line = ' '.join(process.cmdline())
+                try:
+                    executable_path = process.exe()
+                except (psutil.AccessDenied, psutil.ZombieProcess):
+                    executable_path = ""
+                try:
+                    username = process.username()
+                except (psutil.AccessDenied, KeyError):
+                    username = None
+        except psutil.AccessDenied as e:
+            # Remembered, so the warning (and the failed reads) happen once per process
+            logger.warning(f"Could not access process {pid}: {e}")
+            return PooledProcess(process=process, identity=None, create_time=process.create_time(),
+                                 classification={'process_type': 'unknown', 'confidence': 0.0})
+
+        classification = self.classify(name, command_line, executable_path)
+        identity = ProcessIdentity(pid=pid, name=name, command_line=command_line,
+                                   executable_path=executable_path, username=username)
+        return PooledProcess(process=process, identity=identity, create_time=process.create_time(),
+                             classification=classification)
+
+    def begin_tick(self):
+        self._readings.clear()
+        self._seen.clear()
+
+    def read(self, pid: int) -> Tuple[PooledProcess, GPUProcessReading]:
+        """Pooled handle and this tick's usage; raises psutil.NoSuchProcess if it exited"""
+        cached = self._readings.get(pid)
+        if cached is not None:
+            return cached
+
+        self._seen.add(pid)
+        entry = self._entries.get(pid)
+        if entry is not None and not entry.process.is_running():
+            # Exited, or the pid now belongs to someone else
+            del self._entries[pid]
+            self.evictions += 1
+            entry = None
+        if entry is None:
+            entry = self._entries[pid] = self._open(pid)
+
+        process = entry.process
+        self.read_count += 1
+        with process.oneshot():
+            cpu_percent = process.cpu_percent()
+            memory_mb = process.memory_info().rss // (1024 * 1024)  # RSS in MB
+
+        reading = GPUProcessReading(
+            cpu_percent=cpu_percent if entry.sampled else None,
+            memory_mb=memory_mb,
+            runtime_seconds=time.time() - entry.create_time,
+            first_seen=not entry.sampled
+        )
+        entry.sampled = True
+        self._readings[pid] = (entry, reading)
+        return entry, reading
+
+    def evict_unseen(self) -> int:
+        """Drop handles of processes no GPU reported this tick"""
+        stale = [pid for pid in self._entries if pid not in self._seen]
+        for pid in stale:
+            del self._entries[pid]
+        self.evictions += len(stale)
+        return len(stale)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'entries': len(self._entries),
+            'open_count': self.open_count,
+            'read_count': self.read_count,
+            'evictions': self.evictions
+        }
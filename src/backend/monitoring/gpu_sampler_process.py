@@ -0,0 +1,269 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Out-of-Process GPU Sampler
+SpicyRiceCakes - A hung GPU driver must not hang the dashboard
+
+NVML and nvidia-smi calls block for seconds - sometimes for good - while
+the driver resets a GPU or handles an Xid error. Run in the web server's
+process, such a call freezes the REST API and every Socket.IO client.
+
+ProcessGPUMonitor therefore keeps the real monitor in a spawned child
+process. The child samples on its own interval and sends each result
+over a pipe; a watchdog thread here receives them. When no sample has
+arrived within the deadline, the child is killed and a new one spawned.
+Meanwhile callers get the last sample back right away, marked stale
+(is_available=False on every GPU) instead of waiting. A child that keeps
+dying is restarted after a growing delay rather than in a tight loop; a
+single failed read inside the child is reported as unavailable GPUs and
+does not count as a death.
+"""
+
+import logging
+import multiprocessing
+import time
+from dataclasses import dataclass, field, replace
+from threading import Condition, Event, Lock, Thread
+from typing import Any, Callable, Dict, List, Optional, Union
+
+from .gpu_monitor import GPUMetrics, GPUMonitor, GPUMonitorFactory
+from .host_paths import HostPaths
+
+logger = logging.getLogger(__name__)
+
+# Sampler states reported to the dashboard
+STATE_STARTING = 'starting'
+STATE_RUNNING = 'running'
+STATE_STALE = 'stale'
+
+# How long a killed child gets to exit before we stop waiting for it
+KILL_TIMEOUT = 2.0
+
+# Restart delays after a child dies or is killed: 1s, 2s, 4s ... capped
+RESTART_DELAY_MIN = 1.0
+RESTART_DELAY_MAX = 30.0
+
+# A child that ran this long was healthy - restart it quickly again
+HEALTHY_RUNTIME = 60.0
+
+
+@dataclass
+class GPUSample:
+    """One round of the child's monitor, as sent over the pipe"""
+    available: bool
+    gpu_count: int
+    driver_version: Optional[str]
+    metrics: List[GPUMetrics] = field(default_factory=list)
+    collection_seconds: float = 0.0
+    timestamp: float = None
+
+    def __post_init__(self):
+        if self.timestamp is None:
+            self.timestamp = time.time()
+
+
+def create_host_monitor() -> GPUMonitor:
+    """Default child monitor: the best available one, reading the host's /proc"""
+    HostPaths.from_env().configure_psutil()
+    return GPUMonitorFactory.create_monitor()
+
+
+def _sampler_main(conn, monitor_factory: Callable[[], GPUMonitor], interval: float):
+    """Child process: sample forever, until the parent goes away"""
+    monitor = monitor_factory()
+    last_good = None
+    failing = False
+    while True:
+        started = time.monotonic()
+        try:
+            available = monitor.is_available()
+            metrics = monitor.get_gpu_metrics() if available else []
+            if isinstance(metrics, GPUMetrics):
+                metrics = [metrics]
+            sample = GPUSample(
+                available=available,
+                gpu_count=monitor.get_gpu_count(),
+                driver_version=monitor.get_driver_version(),
+                metrics=metrics,
+                collection_seconds=time.monotonic() - started
+            )
+            last_good = sample
+            failing = False
+        except Exception as e:
+            # A failed read is not a hang - report the GPUs unavailable and keep sampling
+            if not failing:
+                logger.warning(f"❌ GPU sample failed in the sampler process: {e}")
+            failing = True
+            sample = GPUSample(
+                available=False,
+                gpu_count=last_good.gpu_count if last_good else 0,
+                driver_version=last_good.driver_version if last_good else None,
+                collection_seconds=time.monotonic() - started
+            )
+        try:
+            conn.send(sample)
+        except OSError:
+            return  # Parent closed the pipe
+        time.sleep(max(interval - (time.monotonic() - started), 0.0))
+
+
+class ProcessGPUMonitor(GPUMonitor):
+    """GPUMonitor whose sampling runs in a child process guarded by a watchdog"""
+
+    def __init__(self, monitor_factory: Callable[[], GPUMonitor] = create_host_monitor,
+                 interval: float = 2.0, deadline: float = 15.0):
+        self.monitor_factory = monitor_factory
+        self.interval = interval
+        self.deadline = deadline
+
+        # spawn, not fork: a forked child would inherit our threads' locks and any NVML state
+        self._context = multiprocessing.get_context('spawn')
+        self._process = None
+        self._conn = None
+
+        self._lock = Lock()
+        self._sample_ready = Condition(self._lock)
+        self._stop_event = Event()
+        self._thread: Optional[Thread] = None
+        self._latest: Optional[GPUSample] = None
+        self._state = STATE_STARTING
+        self._last_progress = 0.0  # Monotonic time of the last sample (or spawn)
+        self._spawned_at = 0.0
+        self._restart_delay = RESTART_DELAY_MIN
+
+        # Performance tracking
+        self.sample_count = 0
+        self.spawn_count = 0
+        self.kill_count = 0
+
+    def start(self):
+        """Spawn the sampler child and its watchdog (idempotent)"""
+        if self._thread is not None and self._thread.is_alive():
+            return
+        self._stop_event.clear()
+        self._spawn()
+        self._thread = Thread(target=self._watch, name="hoof-hearted-gpu-watchdog", daemon=True)
+        self._thread.start()
+        logger.info(f"🛡️ GPU sampler running out of process (deadline {self.deadline:g}s)")
+
+    def stop(self, timeout: float = 5.0):
+        self._stop_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        self._kill()
+
+    def _spawn(self):
+        receiver, sender = self._context.Pipe(duplex=False)
+        self._process = self._context.Process(
+            target=_sampler_main, args=(sender, self.monitor_factory, self.interval),
+            name="hoof-hearted-gpu-sampler", daemon=True
+        )
+        self._process.start()
+        sender.close()  # Only the child writes; EOF on our end then means it died
+        self._conn = receiver
+        self._last_progress = self._spawned_at = time.monotonic()
+        self.spawn_count += 1
+
+    def _kill(self):
+        process, conn = self._process, self._conn
+        self._process = self._conn = None
+        if conn is not None:
+            conn.close()
+        if process is not None and process.is_alive():
+            process.kill()
+            process.join(KILL_TIMEOUT)  # A child stuck in the driver may not even die - don't wait on it
+
+    def _respawn(self, reason: str):
+        delay = self._restart_delay
+        if time.monotonic() - self._spawned_at >= HEALTHY_RUNTIME:
+            delay = RESTART_DELAY_MIN
+        logger.warning(f"⚠️ GPU sampler {reason} - restarting it in {delay:.1f}s")
+        with self._lock:
+            self._state = STATE_STALE
+        self._kill()
+        if self._stop_event.wait(delay):
+            return
+        self._restart_delay = min(delay * 2, RESTART_DELAY_MAX)
+        try:
+            self._spawn()
+        except Exception as e:
+            logger.error(f"❌ Could not start the GPU sampler: {e}")
+            self._spawned_at = time.monotonic()
+
+    def _watch(self):
+        """Receive samples; kill and respawn a child that stopped delivering them"""
+        poll_interval = min(self.interval, self.deadline) / 4
+        while not self._stop_event.is_set():
+            if self._conn is None:
+                self._respawn("could not be started")
+                continue
+            try:
+                if self._conn.poll(poll_interval):
+                    sample = self._conn.recv()
+                else:
+                    sample = None
+            except (EOFError, OSError):
+                self._respawn("process exited")
+                continue
+
+            if sample is not None:
+                with self._lock:
+                    self._latest = sample
+                    self._state = STATE_RUNNING
+                    self.sample_count += 1
+                    self._sample_ready.notify_all()
+                self._last_progress = time.monotonic()
+            elif time.monotonic() - self._last_progress > self.deadline:
+                self.kill_count += 1
+                self._respawn(f"sent nothing for {self.deadline:g}s")
+
+    def wait_for_sample(self, timeout: float) -> bool:
+        """Block until the first sample arrived (or timeout)"""
+        with self._lock:
+            return self._sample_ready.wait_for(lambda: self._latest is not None, timeout=timeout)
+
+    @property
+    def state(self) -> str:
+        return self._state
+
+    def _snapshot(self) -> Optional[GPUSample]:
+        with self._lock:
+            return self._latest
+
+    def is_available(self) -> bool:
+        sample = self._snapshot()
+        return sample is not None and sample.available
+
+    def get_gpu_count(self) -> int:
+        sample = self._snapshot()
+        return sample.gpu_count if sample else 0
+
+    def get_driver_version(self) -> Optional[str]:
+        sample = self._snapshot()
+        return sample.driver_version if sample else None
+
+    def get_gpu_metrics(self, gpu_id: int = None) -> Union[GPUMetrics, List[GPUMetrics]]:
+        """The child's latest metrics - marked unavailable while the sampler is stale"""
+        sample = self._snapshot()
+        if sample is None:
+            return [] if gpu_id is None else None
+
+        metrics = sample.metrics
+        if self._state == STATE_STALE:
+            metrics = [replace(gpu, is_available=False) for gpu in metrics]
+        if gpu_id is not None:
+            return next((gpu for gpu in metrics if gpu.gpu_id == gpu_id), None)
+        return metrics
+
+    def get_status(self) -> Dict[str, Any]:
+        """Sampler health for the dashboard"""
+        sample = self._snapshot()
+        return {
+            'state': self._state,
+            'sample_age_seconds': (time.time() - sample.timestamp) if sample else None,
+            'collection_seconds': sample.collection_seconds if sample else None,
+            'deadline_seconds': self.deadline,
+            'sample_count': self.sample_count,
+            'restart_count': self.spawn_count - 1,
+            'kill_count': self.kill_count
+        }
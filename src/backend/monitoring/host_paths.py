@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Host Paths
+SpicyRiceCakes - Watch the server, not the container
+
+The Docker deployments bind-mount the host's /proc and /sys into the
+container (/proc:/host/proc, /sys:/host/sys). Setting HOST_PROC and
+HOST_SYS (HOST_ROOT optionally, for a read-only / mount) points every
+collector - the direct /proc and /sys readers and psutil - at those
+mounts instead of the container's own view.
+
+Host-wide network and mount data is read through PID 1's entries
+(/host/proc/1/net, /host/proc/1/mountinfo): /proc/net and
+/proc/self/mountinfo always resolve to the reading process, which would
+be the container's network and mount namespaces. The host's mount table
+is only used together with HOST_ROOT - without the host's / mounted, its
+mountpoints can't be statvfs'd from in here, so disks fall back to the
+container's own mounts.
+"""
+
+import logging
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_PROC = '/proc'
+DEFAULT_SYS = '/sys'
+
+
+@dataclass(frozen=True)
+class HostPaths:
+    """Where the collectors find proc, sys and (optionally) the host's root filesystem"""
+    proc_root: str = DEFAULT_PROC
+    sys_root: str = DEFAULT_SYS
+    rootfs: Optional[str] = None  # Host / mounted in the container, for statvfs of host mounts
+
+    @classmethod
+    def from_env(cls) -> 'HostPaths':
+        """HOST_PROC / HOST_SYS / HOST_ROOT, defaulting to this process's own view"""
+        return cls(
+            proc_root=os.getenv('HOST_PROC') or DEFAULT_PROC,
+            sys_root=os.getenv('HOST_SYS') or DEFAULT_SYS,
+            rootfs=os.getenv('HOST_ROOT') or None
+        )
+
+    @property
+    def host_mode(self) -> bool:
+        """Reading another namespace's proc rather than our own"""
+        return os.path.normpath(self.proc_root) != DEFAULT_PROC
+
+    @property
+    def net_root(self) -> str:
+        """proc/net of the host's network namespace"""
+        if self.host_mode:
+            return os.path.join(self.proc_root, '1', 'net')
+        return os.path.join(self.proc_root, 'net')
+
+    @property
+    def mountinfo_path(self) -> str:
+        """mountinfo of the host's mount namespace - only when its / is mounted to statvfs through"""
+        if self.host_mode and self.rootfs:
+            return os.path.join(self.proc_root, '1', 'mountinfo')
+        # Without HOST_ROOT the host's mountpoints aren't reachable here: report our own mounts
+        return os.path.join(DEFAULT_PROC, 'self', 'mountinfo')
+
+    @property
+    def filesystems_path(self) -> str:
+        return os.path.join(self.proc_root, 'filesystems')
+
+    @property
+    def sys_class_net(self) -> str:
+        return os.path.join(self.sys_root, 'class', 'net')
+
+    def shares_network_namespace(self) -> bool:
+        """Is the host's network namespace the one getifaddrs() (psutil.net_if_addrs) sees?"""
+        if not self.host_mode:
+            return True
+        try:
+            host_ns = os.stat(os.path.join(self.proc_root, '1', 'ns', 'net'))
+            own_ns = os.stat('/proc/self/ns/net')
+        except OSError:
+            # Namespace links of other users' processes need ptrace access - assume separate
+            return False
+        return (host_ns.st_dev, host_ns.st_ino) == (own_ns.st_dev, own_ns.st_ino)
+
+    def host_path(self, path: str) -> str:
+        """A host path (e.g. a mountpoint from the host's mountinfo) as reachable from here"""
+        if self.rootfs:
+            return os.path.join(self.rootfs, path.lstrip('/'))
+        return path
+
+    def configure_psutil(self):
+        """Point psutil's Linux implementation at the same proc root"""
+        if self.host_mode and hasattr(psutil, 'PROCFS_PATH'):
+            psutil.PROCFS_PATH = self.proc_root
+            logger.info(f"🏠 Host mode: reading {self.proc_root} and {self.sys_root}")
@@ -0,0 +1,176 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Network Interface Collector
+SpicyRiceCakes - One read of /proc/net/dev per tick
+
+Traffic counters for every interface come from a single read of
+/proc/net/dev. Addresses, MTU, link speed and up/down state barely ever
+change, so they are cached and only re-read when the interface list in
+/sys/class/net changes (a veth appears or goes away) or on a slow timer.
+Rates are computed per interface against its own previous sample.
+"""
+
+import logging
+import os
+import socket
+import time
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+import psutil
+
+logger = logging.getLogger(__name__)
+
+# Administratively-up flag in /sys/class/net/<name>/flags (include/uapi/linux/if.h)
+IFF_UP = 0x1
+
+# operstate values (RFC 2863) that mean no carrier - /sys flags never carry IFF_RUNNING
+DOWN_OPERSTATES = {'down', 'lowerlayerdown', 'notpresent', 'dormant'}
+
+
+@dataclass
+class InterfaceInfo:
+    """Slow-changing interface attributes"""
+    addresses: List[str] = field(default_factory=list)
+    mtu: Optional[int] = None
+    speed_mbps: Optional[int] = None
+    is_up: bool = True
+
+
+@dataclass
+class InterfaceSample:
+    """Counters and rates of one interface for this tick"""
+    name: str
+    bytes_sent: int
+    bytes_recv: int
+    packets_sent: int
+    packets_recv: int
+    bytes_sent_per_sec: Optional[float]
+    bytes_recv_per_sec: Optional[float]
+    info: InterfaceInfo
+
+
+def parse_net_dev(data: bytes) -> Dict[str, Tuple[int, int, int, int]]:
+    """name -> (bytes_recv, packets_recv, bytes_sent, packets_sent) from /proc/net/dev"""
+    counters = {}
+    for line in data.splitlines()[2:]:
+        name, _, values = line.partition(b':')
+        fields = values.split()
+        if len(fields) < 10:
+            continue
+        counters[name.strip().decode()] = (int(fields[0]), int(fields[1]), int(fields[8]), int(fields[9]))
+    return counters
+
+
+class InterfaceCollector:
+    """/proc/net/dev counters with a change-driven cache of interface attributes"""
+
+    def __init__(self, net_root: str = '/proc/net', sys_class_net: str = '/sys/class/net',
+                 info_interval: float = 30.0, read_addresses: bool = True):
+        self.net_dev_path = os.path.join(net_root, 'dev')
+        self.sys_class_net = sys_class_net
+        self.info_interval = info_interval
+        self.read_addresses = read_addresses
+
+        self._info: Dict[str, InterfaceInfo] = {}
+        self._info_names = frozenset()
+        self._info_time = 0.0
+        # name -> (bytes_sent, bytes_recv, monotonic timestamp)
+        self._last_counters: Dict[str, Tuple[int, int, float]] = {}
+
+        # Performance tracking
+        self.info_refresh_count = 0
+
+    @staticmethod
+    def is_supported(net_root: str = '/proc/net') -> bool:
+        return os.path.exists(os.path.join(net_root, 'dev'))
+
+    def _read_sys_str(self, name: str, attribute: str) -> Optional[str]:
+        try:
+            with open(os.path.join(self.sys_class_net, name, attribute)) as sys_file:
+                return sys_file.read().strip()
+        except OSError:
+            return None
+
+    def _read_sys_int(self, name: str, attribute: str) -> Optional[int]:
+        try:
+            return int(self._read_sys_str(name, attribute), 0)
+        except (TypeError, ValueError):
+            # 'speed' is EINVAL for virtual and down interfaces
+            return None
+
+    def _refresh_info(self, names: frozenset):
+        if_addrs = {}
+        if self.read_addresses:
+            try:
+                if_addrs = psutil.net_if_addrs()
+            except Exception as e:
+                logger.debug(f"Interface addresses unavailable: {e}")
+
+        info = {}
+        for name in names:
+            flags = self._read_sys_int(name, 'flags')
+            operstate = self._read_sys_str(name, 'operstate')
+            speed = self._read_sys_int(name, 'speed')
+            info[name] = InterfaceInfo(
+                addresses=[addr.address for addr in if_addrs.get(name, [])
+                           if addr.family in (socket.AF_INET, socket.AF_INET6)],
+                mtu=self._read_sys_int(name, 'mtu'),
+                speed_mbps=speed if speed and speed > 0 else None,
+                # Same meaning as psutil's isup: administratively up and with a carrier
+                is_up=(flags is None or bool(flags & IFF_UP)) and operstate not in DOWN_OPERSTATES
+            )
+
+        self._info = info
+        self._info_names = names
+        self._info_time = time.monotonic()
+        self.info_refresh_count += 1
+        logger.debug(f"🌐 Interface attributes refreshed for {len(names)} interfaces")
+
+    def _current_info(self, names: frozenset) -> Dict[str, InterfaceInfo]:
+        try:
+            # One getdents on /sys/class/net catches interfaces coming and going
+            listed = frozenset(os.listdir(self.sys_class_net))
+        except OSError:
+            listed = names
+        if listed != self._info_names or time.monotonic() - self._info_time >= self.info_interval:
+            self._refresh_info(listed)
+        return self._info
+
+    def collect(self) -> Dict[str, InterfaceSample]:
+        """Counters and rates for every interface from one /proc/net/dev read"""
+        with open(self.net_dev_path, 'rb') as net_dev_file:
+            data = net_dev_file.read()
+        now = time.monotonic()
+        counters = parse_net_dev(data)
+        info = self._current_info(frozenset(counters))
+
+        samples = {}
+        last_counters = self._last_counters
+        current_counters = {}
+        for name, (bytes_recv, packets_recv, bytes_sent, packets_sent) in counters.items():
+            current_counters[name] = (bytes_sent, bytes_recv, now)
+
+            bytes_sent_per_sec = None
+            bytes_recv_per_sec = None
+            previous = last_counters.get(name)
+            if previous is not None and now > previous[2]:
+                elapsed = now - previous[2]
+                # Negative deltas mean the interface was re-created - wait for a new baseline
+                if bytes_sent >= previous[0] and bytes_recv >= previous[1]:
+                    bytes_sent_per_sec = (bytes_sent - previous[0]) / elapsed
+                    bytes_recv_per_sec = (bytes_recv - previous[1]) / elapsed
+
+            samples[name] = InterfaceSample(
+                name=name,
+                bytes_sent=bytes_sent,
+                bytes_recv=bytes_recv,
+                packets_sent=packets_sent,
+                packets_recv=packets_recv,
+                bytes_sent_per_sec=bytes_sent_per_sec,
+                bytes_recv_per_sec=bytes_recv_per_sec,
+                info=info.get(name) or InterfaceInfo()
+            )
+
+        self._last_counters = current_counters
+        return samples
@@ -0,0 +1,206 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Mount Registry
+SpicyRiceCakes - Parse the mount table only when it changes
+
+Keeps a pre-filtered list of real filesystems from /proc/self/mountinfo.
+The kernel flags the mountinfo file descriptor (POLLPRI) whenever the
+mount table changes, so the file is only re-parsed after a mount/umount -
+with a slow timer as a safety net. Bind mounts of the same filesystem are
+collapsed by major:minor, and capacity (statvfs) is refreshed on its own,
+slower cadence than disk IO rates.
+"""
+
+import logging
+import os
+import re
+import select
+import time
+from collections import namedtuple
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Same shape and meaning as psutil.disk_usage()
+DiskCapacity = namedtuple('DiskCapacity', ['total', 'used', 'free'])
+
+# Real filesystems that /proc/filesystems lists as 'nodev' (psutil keeps these too)
+EXTRA_PHYSICAL_FILESYSTEMS = {'zfs'}
+
+_OCTAL_ESCAPE = re.compile(r'\\([0-7]{3})')
+
+
+def _unescape(field: str) -> str:
+    """mountinfo escapes space, tab, newline and backslash as \\ooo octal"""
+    if '\\' not in field:
+        return field
+    return _OCTAL_ESCAPE.sub(lambda match: chr(int(match.group(1), 8)), field)
+
+
+@dataclass(frozen=True)
+class MountEntry:
+    """One mounted filesystem (field names match psutil's sdiskpart)"""
+    mount_id: int
+    device_id: str  # "major:minor" of the mounted filesystem
+    root: str  # Path inside the filesystem that is mounted (not '/' for bind mounts)
+    mountpoint: str
+    fstype: str
+    device: str
+    options: str
+
+
+def parse_mountinfo(data: bytes) -> List[MountEntry]:
+    """Parse /proc/[pid]/mountinfo (see proc(5))"""
+    entries = []
+    for line in data.decode('utf-8', 'replace').splitlines():
+        fields = line.split()
+        try:
+            separator = fields.index('-', 6)
+            entries.append(MountEntry(
+                mount_id=int(fields[0]),
+                device_id=fields[2],
+                root=_unescape(fields[3]),
+                mountpoint=_unescape(fields[4]),
+                fstype=fields[separator + 1],
+                device=_unescape(fields[separator + 2]),
+                options=fields[5]
+            ))
+        except (ValueError, IndexError):
+            logger.debug(f"Skipping unparseable mountinfo line: {line!r}")
+    return entries
+
+
+def read_physical_filesystems(path: str = '/proc/filesystems') -> Set[str]:
+    """Filesystem types backed by a block device, plus known device-less real ones"""
+    fstypes = set(EXTRA_PHYSICAL_FILESYSTEMS)
+    with open(path) as filesystems_file:
+        for line in filesystems_file:
+            fields = line.split()
+            if fields and not line.startswith('nodev'):
+                fstypes.add(fields[0])
+    return fstypes
+
+
+class MountRegistry:
+    """Cached, change-driven view of the real filesystems on this host"""
+
+    def __init__(self, mountinfo_path: str = '/proc/self/mountinfo',
+                 filesystems_path: str = '/proc/filesystems',
+                 rescan_interval: float = 300.0, capacity_interval: float = 30.0,
+                 rootfs: Optional[str] = None):
+        self.mountinfo_path = mountinfo_path
+        self.filesystems_path = filesystems_path
+        self.rescan_interval = rescan_interval
+        self.capacity_interval = capacity_interval
+        # Where another namespace's / is mounted, so its mountpoints can be statvfs'd
+        self.rootfs = rootfs
+
+        self._fd: Optional[int] = None
+        self._poller = None
+        self._mounts: List[MountEntry] = []
+        self._last_parse = 0.0
+        self._capacity: Dict[str, Tuple[float, DiskCapacity]] = {}
+
+        # Performance tracking
+        self.generation = 0
+        self.parse_count = 0
+        self.statvfs_count = 0
+
+        self._physical_filesystems = read_physical_filesystems(filesystems_path)
+        self._open()
+        self._parse()
+
+    @staticmethod
+    def is_supported(mountinfo_path: str = '/proc/self/mountinfo') -> bool:
+        return hasattr(os, 'statvfs') and os.path.exists(mountinfo_path)
+
+    def _open(self):
+        self._fd = os.open(self.mountinfo_path, os.O_RDONLY)
+        if hasattr(select, 'poll'):
+            self._poller = select.poll()
+            self._poller.register(self._fd, select.POLLPRI)
+
+    def close(self):
+        if self._fd is not None:
+            os.close(self._fd)
+            self._fd = None
+            self._poller = None
+
+    def _read_all(self) -> bytes:
+        os.lseek(self._fd, 0, os.SEEK_SET)
+        chunks = []
+        while True:
+            chunk = os.read(self._fd, 65536)
+            if not chunk:
+                break
+            chunks.append(chunk)
+        return b''.join(chunks)
+
+    def _changed(self) -> bool:
+        """Has the mount table changed since the last parse?"""
+        if self._poller is not None:
+            # Polling also re-arms the notification, so each change is seen once
+            for _, events in self._poller.poll(0):
+                if events & (select.POLLPRI | select.POLLERR):
+                    return True
+        return time.monotonic() - self._last_parse >= self.rescan_interval
+
+    def _parse(self):
+        entries = parse_mountinfo(self._read_all())
+
+        mounts = []
+        seen_devices = set()
+        for entry in entries:
+            if entry.fstype not in self._physical_filesystems:
+                continue
+            # Bind mounts (and btrfs/zfs re-mounts) share a device - report the first once
+            if entry.device_id in seen_devices:
+                continue
+            seen_devices.add(entry.device_id)
+            mounts.append(entry)
+
+        live_mountpoints = {entry.mountpoint for entry in mounts}
+        self._capacity = {mountpoint: cached for mountpoint, cached in self._capacity.items()
+                          if mountpoint in live_mountpoints}
+
+        self._mounts = mounts
+        self._last_parse = time.monotonic()
+        self.generation += 1
+        self.parse_count += 1
+        logger.debug(f"💽 Mount table parsed: {len(entries)} mounts, {len(mounts)} real filesystems")
+
+    def mounts(self) -> List[MountEntry]:
+        """Real filesystems, re-parsed only when the mount table changed"""
+        if self._changed():
+            try:
+                self._parse()
+            except OSError as e:
+                logger.warning(f"Failed to re-read {self.mountinfo_path}: {e}")
+        return self._mounts
+
+    def capacity(self, mount: MountEntry) -> DiskCapacity:
+        """statvfs-based usage, cached for ``capacity_interval`` seconds"""
+        now = time.monotonic()
+        cached = self._capacity.get(mount.mountpoint)
+        if cached is not None and now - cached[0] < self.capacity_interval:
+            return cached[1]
+
+        path = os.path.join(self.rootfs, mount.mountpoint.lstrip('/')) if self.rootfs else mount.mountpoint
+        stats = os.statvfs(path)
+        self.statvfs_count += 1
+        capacity = DiskCapacity(
+            total=stats.f_blocks * stats.f_frsize,
+            used=(stats.f_blocks - stats.f_bfree) * stats.f_frsize,
+            free=stats.f_bavail * stats.f_frsize
+        )
+        self._capacity[mount.mountpoint] = (now, capacity)
+        return capacity
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'filesystems': len(self._mounts),
+            'generation': self.generation,
+            'parse_count': self.parse_count,
+            'statvfs_count': self.statvfs_count
+        }
@@ -0,0 +1,279 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - nvidia-smi Streaming Reader
+SpicyRiceCakes - One nvidia-smi for the whole uptime, not one per request
+
+Without NVML bindings the only way to read an NVIDIA GPU is nvidia-smi,
+and starting it costs more than the query itself (driver handshake, CUDA
+init). Instead of one subprocess per call, nvidia-smi runs for as long as
+we do in loop mode (-lms N): one child streams --query-gpu rows, a second
+one --query-compute-apps rows. Reader threads parse every line as it
+arrives and keep the newest sample in memory, so callers never wait on a
+subprocess.
+
+A child that exits (driver reload, GPU reset, killed by hand) is started
+again after a short, growing delay. If we die, nvidia-smi gets SIGPIPE on
+its next write and exits too.
+"""
+
+import csv
+import logging
+import shutil
+import subprocess
+import time
+from dataclasses import dataclass
+from threading import Condition, Event, Lock, Thread
+from typing import Callable, Dict, List, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+GPU_FIELDS = (
+    'index', 'uuid', 'name', 'pci.bus_id', 'driver_version',
+    'utilization.gpu', 'memory.used', 'memory.total',
+    'temperature.gpu', 'fan.speed', 'power.draw', 'power.limit',
+    'clocks.gr', 'clocks.sm', 'clocks.mem'
+)
+PROCESS_FIELDS = ('gpu_uuid', 'pid', 'process_name', 'used_memory')
+
+# Restart delays after a child exits: 1s, 2s, 4s ... capped
+RESTART_DELAY_MIN = 1.0
+RESTART_DELAY_MAX = 30.0
+
+# A child that ran this long before exiting was healthy - restart it quickly again
+HEALTHY_RUNTIME = 60.0
+
+
+@dataclass
+class SMIGPUSample:
+    """One --query-gpu row"""
+    index: int
+    uuid: str
+    name: str
+    pci_bus_id: str
+    driver_version: Optional[str]
+    utilization_percent: Optional[float]
+    memory_used_mb: Optional[int]
+    memory_total_mb: Optional[int]
+    temperature_c: Optional[int]
+    fan_speed_percent: Optional[int]
+    power_draw_watts: Optional[float]
+    power_limit_watts: Optional[float]
+    clock_graphics_mhz: Optional[int]
+    clock_sm_mhz: Optional[int]
+    clock_memory_mhz: Optional[int]
+    timestamp: float = None
+
+    def __post_init__(self):
+        if self.timestamp is None:
+            self.timestamp = time.time()
+
+
+@dataclass
+class SMIProcessSample:
+    """One --query-compute-apps row"""
+    gpu_uuid: str
+    pid: int
+    name: str
+    gpu_memory_mb: int
+
+
+def _number(value: str, kind: Callable = float):
+    """nvidia-smi prints '[N/A]' / '[Not Supported]' for missing values"""
+    try:
+        return kind(float(value))
+    except ValueError:
+        return None
+
+
+def _split(line: str) -> List[str]:
+    return [value.strip() for value in next(csv.reader([line]), [])]
+
+
+def parse_gpu_line(line: str) -> Optional[SMIGPUSample]:
+    """A --query-gpu row in GPU_FIELDS order, or None for anything else (headers, errors)"""
+    values = _split(line)
+    if len(values) != len(GPU_FIELDS) or not values[0].isdigit():
+        return None
+    return SMIGPUSample(
+        index=int(values[0]),
+        uuid=values[1],
+        name=values[2],
+        pci_bus_id=values[3],
+        driver_version=values[4] if not values[4].startswith('[') else None,
+        utilization_percent=_number(values[5]),
+        memory_used_mb=_number(values[6], int),
+        memory_total_mb=_number(values[7], int),
+        temperature_c=_number(values[8], int),
+        fan_speed_percent=_number(values[9], int),
+        power_draw_watts=_number(values[10]),
+        power_limit_watts=_number(values[11]),
+        clock_graphics_mhz=_number(values[12], int),
+        clock_sm_mhz=_number(values[13], int),
+        clock_memory_mhz=_number(values[14], int)
+    )
+
+
+def parse_process_line(line: str) -> Optional[SMIProcessSample]:
+    """A --query-compute-apps row in PROCESS_FIELDS order"""
+    values = _split(line)
+    if len(values) != len(PROCESS_FIELDS) or not values[1].isdigit():
+        return None
+    return SMIProcessSample(gpu_uuid=values[0], pid=int(values[1]), name=values[2],
+                            gpu_memory_mb=_number(values[3], int) or 0)
+
+
+class _StreamChild:
+    """One long-running nvidia-smi query, restarted whenever it exits"""
+
+    def __init__(self, name: str, command: List[str], on_line: Callable[[str], None], stop_event: Event):
+        self.name = name
+        self.command = command
+        self.on_line = on_line
+        self._stop_event = stop_event
+        self._process: Optional[subprocess.Popen] = None
+        self._thread: Optional[Thread] = None
+
+        # Performance tracking
+        self.spawn_count = 0
+        self.line_count = 0
+
+    @property
+    def restart_count(self) -> int:
+        return max(self.spawn_count - 1, 0)
+
+    def start(self):
+        self._thread = Thread(target=self._run, name=f"hoof-hearted-{self.name}", daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float):
+        process = self._process
+        if process is not None and process.poll() is None:
+            process.terminate()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self):
+        delay = RESTART_DELAY_MIN
+        while not self._stop_event.is_set():
+            started = time.monotonic()
+            try:
+                self._process = subprocess.Popen(
+                    self.command, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL,
+                    stdin=subprocess.DEVNULL, text=True, bufsize=1
+                )
+            except OSError as e:
+                logger.error(f"❌ Could not start {self.name}: {e}")
+            else:
+                self.spawn_count += 1
+                for line in self._process.stdout:
+                    self.line_count += 1
+                    self.on_line(line)
+                self._process.stdout.close()
+                returncode = self._process.wait()
+                if self._stop_event.is_set():
+                    return
+                logger.warning(f"⚠️ {self.name} exited with status {returncode} - restarting in {delay:.1f}s")
+
+            if time.monotonic() - started >= HEALTHY_RUNTIME:
+                delay = RESTART_DELAY_MIN
+            if self._stop_event.wait(delay):
+                return
+            delay = min(delay * 2, RESTART_DELAY_MAX)
+
+
+class NvidiaSmiStream:
+    """Latest GPU and compute-process samples from persistent nvidia-smi children"""
+
+    def __init__(self, command: str = 'nvidia-smi', interval_ms: int = 1000):
+        self.command = command
+        self.interval_ms = interval_ms
+
+        self._lock = Lock()
+        self._sample_ready = Condition(self._lock)
+        self._stop_event = Event()
+
+        # Rows of the sample being streamed in, and the last complete one
+        self._pending: Dict[int, SMIGPUSample] = {}
+        self._gpus: List[SMIGPUSample] = []
+        # (gpu uuid, pid) -> (row, monotonic time it was last printed)
+        self._processes: Dict[Tuple[str, int], Tuple[SMIProcessSample, float]] = {}
+
+        interval = ['-lms', str(interval_ms)]
+        self._children = [
+            _StreamChild('nvidia-smi-gpu', [command, f"--query-gpu={','.join(GPU_FIELDS)}",
+                                            '--format=csv,noheader,nounits'] + interval,
+                         self._on_gpu_line, self._stop_event),
+            _StreamChild('nvidia-smi-apps', [command, f"--query-compute-apps={','.join(PROCESS_FIELDS)}",
+                                             '--format=csv,noheader,nounits'] + interval,
+                         self._on_process_line, self._stop_event)
+        ]
+
+        # Performance tracking
+        self.sample_count = 0
+
+    @staticmethod
+    def is_supported(command: str = 'nvidia-smi') -> bool:
+        return shutil.which(command) is not None
+
+    def start(self):
+        self._stop_event.clear()
+        for child in self._children:
+            child.start()
+        logger.info(f"📡 Streaming nvidia-smi every {self.interval_ms}ms")
+
+    def stop(self, timeout: float = 5.0):
+        self._stop_event.set()
+        for child in self._children:
+            child.stop(timeout)
+
+    def _on_gpu_line(self, line: str):
+        sample = parse_gpu_line(line)
+        if sample is None:
+            return
+        with self._lock:
+            # An index we already have means the previous loop iteration is complete
+            if sample.index in self._pending:
+                self._publish()
+            self._pending[sample.index] = sample
+            if len(self._pending) == len(self._gpus):
+                self._publish()
+
+    def _publish(self):
+        """Make the pending rows the current sample - callers must hold ``_lock``"""
+        self._gpus = sorted(self._pending.values(), key=lambda gpu: gpu.index)
+        self._pending = {}
+        self.sample_count += 1
+        self._sample_ready.notify_all()
+
+    def _on_process_line(self, line: str):
+        process = parse_process_line(line)
+        if process is not None:
+            with self._lock:
+                self._processes[(process.gpu_uuid, process.pid)] = (process, time.monotonic())
+
+    def wait_for_sample(self, timeout: float) -> bool:
+        """Block until the first complete GPU sample arrived (or timeout)"""
+        with self._lock:
+            return self._sample_ready.wait_for(lambda: self.sample_count > 0, timeout=timeout)
+
+    def gpus(self) -> List[SMIGPUSample]:
+        """The newest complete --query-gpu sample"""
+        with self._lock:
+            return list(self._gpus)
+
+    def processes(self, gpu_uuid: str) -> List[SMIProcessSample]:
+        """Compute processes nvidia-smi printed for this GPU within the last two intervals"""
+        # nvidia-smi prints nothing for a GPU without processes, so exits show up as silence
+        cutoff = time.monotonic() - 2 * self.interval_ms / 1000 - 0.5  # Plus scheduling slack
+        with self._lock:
+            for key in [key for key, (_, seen) in self._processes.items() if seen < cutoff]:
+                del self._processes[key]
+            return [process for (uuid, _), (process, _) in self._processes.items() if uuid == gpu_uuid]
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'sample_count': self.sample_count,
+            'restart_count': sum(child.restart_count for child in self._children),
+            'line_count': sum(child.line_count for child in self._children)
+        }
@@ -0,0 +1,297 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Batched NVML Sampling
+SpicyRiceCakes - Fewer NVML round-trips per GPU per tick
+
+The volatile fields of a GPU are fetched with one nvmlDeviceGetFieldValues
+call where NVML exposes a field id for them, and with one call per field
+group (utilization, memory, clocks, ...) otherwise. A field or group the
+device answers with NOT_SUPPORTED - no fan on a passively cooled card, no
+memory sensor on GDDR boards, an API the driver is too old for - is
+remembered per device and never asked for again.
+
+Per-process utilization comes from nvmlDeviceGetProcessUtilization with a
+per-GPU lastSeenTimeStamp cursor, so each tick only transfers the samples
+NVML took since the previous one; they land in a small ring per pid.
+"""
+
+import logging
+from collections import deque
+from dataclasses import dataclass
+from typing import Any, Callable, Deque, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+NVML_SUCCESS = 0
+
+# Field key -> (NVML_FI_* constant, divisor) served by nvmlDeviceGetFieldValues.
+# Constants missing from the installed bindings are simply left out of the batch.
+BATCHED_FIELDS: Dict[str, Tuple[str, float]] = {
+    'power_draw_watts': ('NVML_FI_DEV_POWER_INSTANT', 1000.0),  # mW to W
+    'memory_temperature_c': ('NVML_FI_DEV_MEMORY_TEMP', 1),
+}
+
+# nvmlValue_t member for each NVML_VALUE_TYPE_* (double, uint, ulong, ulonglong, slonglong, sint)
+_VALUE_MEMBERS = ('dVal', 'uiVal', 'ulVal', 'ullVal', 'sllVal', 'siVal')
+
+# Bits of nvmlDeviceGetCurrentClocksThrottleReasons
+THROTTLE_REASONS = [
+    (0x1, 'gpu_idle'),
+    (0x2, 'applications_clocks'),
+    (0x4, 'sw_power_cap'),
+    (0x8, 'hw_slowdown'),
+    (0x10, 'sync_boost'),
+    (0x20, 'sw_thermal'),
+    (0x40, 'hw_thermal'),
+    (0x80, 'hw_power_brake'),
+    (0x100, 'display_clocks'),
+]
+
+
+def _read_utilization(nvml, handle) -> Dict[str, Any]:
+    utilization = nvml.nvmlDeviceGetUtilizationRates(handle)
+    return {'utilization_percent': utilization.gpu, 'memory_utilization_percent': utilization.memory}
+
+
+def _read_memory(nvml, handle) -> Dict[str, Any]:
+    memory_info = nvml.nvmlDeviceGetMemoryInfo(handle)
+    return {'memory_used_bytes': memory_info.used, 'memory_total_bytes': memory_info.total}
+
+
+def _read_temperature(nvml, handle) -> Dict[str, Any]:
+    return {'temperature_c': nvml.nvmlDeviceGetTemperature(handle, nvml.NVML_TEMPERATURE_GPU)}
+
+
+def _read_fan(nvml, handle) -> Dict[str, Any]:
+    return {'fan_speed_percent': nvml.nvmlDeviceGetFanSpeed(handle)}
+
+
+def _read_power(nvml, handle) -> Dict[str, Any]:
+    return {'power_draw_watts': nvml.nvmlDeviceGetPowerUsage(handle) / 1000.0}  # mW to W
+
+
+def _read_clocks(nvml, handle) -> Dict[str, Any]:
+    return {
+        'clock_graphics_mhz': nvml.nvmlDeviceGetClockInfo(handle, nvml.NVML_CLOCK_GRAPHICS),
+        'clock_sm_mhz': nvml.nvmlDeviceGetClockInfo(handle, nvml.NVML_CLOCK_SM),
+        'clock_memory_mhz': nvml.nvmlDeviceGetClockInfo(handle, nvml.NVML_CLOCK_MEM)
+    }
+
+
+def _read_throttle(nvml, handle) -> Dict[str, Any]:
+    reasons = nvml.nvmlDeviceGetCurrentClocksThrottleReasons(handle)
+    return {'throttle_reasons': [name for bit, name in THROTTLE_REASONS if reasons & bit]}
+
+
+def _read_pcie(nvml, handle) -> Dict[str, Any]:
+    return {
+        'pcie_tx_kbps': nvml.nvmlDeviceGetPcieThroughput(handle, nvml.NVML_PCIE_UTIL_TX_BYTES),
+        'pcie_rx_kbps': nvml.nvmlDeviceGetPcieThroughput(handle, nvml.NVML_PCIE_UTIL_RX_BYTES)
+    }
+
+
+# Per-call reads for everything the batch did not deliver: group -> (keys, reader)
+FALLBACK_GROUPS: Dict[str, Tuple[Tuple[str, ...], Callable[[Any, Any], Dict[str, Any]]]] = {
+    'utilization': (('utilization_percent', 'memory_utilization_percent'), _read_utilization),
+    'memory': (('memory_used_bytes', 'memory_total_bytes'), _read_memory),
+    'temperature': (('temperature_c',), _read_temperature),
+    'fan': (('fan_speed_percent',), _read_fan),
+    'power': (('power_draw_watts',), _read_power),
+    'clocks': (('clock_graphics_mhz', 'clock_sm_mhz', 'clock_memory_mhz'), _read_clocks),
+    'throttle': (('throttle_reasons',), _read_throttle),
+    'pcie': (('pcie_tx_kbps', 'pcie_rx_kbps'), _read_pcie),
+}
+
+
+def is_topology_error(nvml, error: Exception) -> bool:
+    """NVML errors meaning a cached handle no longer points at the same GPU"""
+    codes = {nvml.NVML_ERROR_GPU_IS_LOST, nvml.NVML_ERROR_NOT_FOUND,
+             nvml.NVML_ERROR_UNINITIALIZED, nvml.NVML_ERROR_INVALID_ARGUMENT}
+    return isinstance(error, nvml.NVMLError) and getattr(error, 'value', None) in codes
+
+
+def _is_unsupported(nvml, error: Exception) -> bool:
+    # AttributeError: the installed bindings predate the call
+    if isinstance(error, AttributeError):
+        return True
+    return getattr(error, 'value', None) in (nvml.NVML_ERROR_NOT_SUPPORTED, nvml.NVML_ERROR_FUNCTION_NOT_FOUND)
+
+
+class NVMLFieldSampler:
+    """Volatile fields of NVIDIA GPUs: one field-values batch plus per-group fallbacks"""
+
+    def __init__(self, nvml):
+        self.nvml = nvml
+        self._batched = {key: (getattr(nvml, name), divisor)
+                         for key, (name, divisor) in BATCHED_FIELDS.items() if hasattr(nvml, name)}
+
+        # device index -> fallback groups (or 'field_values') the device doesn't support
+        self._unsupported: Dict[int, Set[str]] = {}
+        # device index -> keys the field-values API rejected, read through their group instead
+        self._unbatched: Dict[int, Set[str]] = {}
+
+        # Performance tracking
+        self.batch_calls = 0
+        self.fallback_calls = 0
+
+    def reset(self):
+        """Forget per-device support (new topology - indexes may point at other GPUs)"""
+        self._unsupported.clear()
+        self._unbatched.clear()
+
+    def unsupported(self, index: int) -> List[str]:
+        return sorted(self._unsupported.get(index, ()))
+
+    def _field_value(self, field) -> float:
+        return getattr(field.value, _VALUE_MEMBERS[field.valueType])
+
+    def _sample_batch(self, index: int, handle, values: Dict[str, Any]):
+        unbatched = self._unbatched.setdefault(index, set())
+        batch = [(key, field_id, divisor) for key, (field_id, divisor) in self._batched.items()
+                 if key not in unbatched]
+        if not batch:
+            return
+
+        self.batch_calls += 1
+        try:
+            fields = self.nvml.nvmlDeviceGetFieldValues(handle, [field_id for _, field_id, _ in batch])
+        except (self.nvml.NVMLError, AttributeError) as e:
+            if is_topology_error(self.nvml, e):
+                raise
+            if _is_unsupported(self.nvml, e):
+                self._unsupported[index].add('field_values')
+                logger.info(f"🔥 GPU {index}: nvmlDeviceGetFieldValues unsupported - using per-field calls")
+            return
+
+        for (key, _, divisor), field in zip(batch, fields):
+            if field.nvmlReturn == NVML_SUCCESS:
+                value = self._field_value(field)
+                values[key] = value / divisor if divisor != 1 else value
+            elif field.nvmlReturn in (self.nvml.NVML_ERROR_NOT_SUPPORTED, self.nvml.NVML_ERROR_FUNCTION_NOT_FOUND):
+                unbatched.add(key)
+
+    def sample(self, index: int, handle) -> Dict[str, Any]:
+        """Volatile fields of one GPU; keys of unsupported fields are absent"""
+        unsupported = self._unsupported.setdefault(index, set())
+        values: Dict[str, Any] = {}
+        if 'field_values' not in unsupported:
+            self._sample_batch(index, handle, values)
+
+        for group, (keys, read) in FALLBACK_GROUPS.items():
+            if group in unsupported or all(key in values for key in keys):
+                continue
+            self.fallback_calls += 1
+            try:
+                for key, value in read(self.nvml, handle).items():
+                    values.setdefault(key, value)
+            except (self.nvml.NVMLError, AttributeError) as e:
+                if is_topology_error(self.nvml, e):
+                    raise
+                if _is_unsupported(self.nvml, e):
+                    unsupported.add(group)
+                    logger.info(f"🔥 GPU {index}: {group} not supported - no longer queried")
+                else:
+                    logger.debug(f"GPU {index}: {group} read failed: {e}")
+        return values
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'batch_calls': self.batch_calls,
+            'fallback_calls': self.fallback_calls,
+            'unsupported_fields': sum(len(groups) for groups in self._unsupported.values())
+        }
+
+
+@dataclass
+class ProcessGPUUtilization:
+    """Average utilization of one process over its recent NVML samples (percent of the GPU)"""
+    sm_percent: float
+    memory_percent: float
+    encoder_percent: float
+    decoder_percent: float
+    sample_count: int
+
+
+class ProcessUtilizationSampler:
+    """Per-pid SM/memory/encoder/decoder utilization from incremental NVML samples"""
+
+    # NVML keeps a few seconds of samples; average over what arrived in this window
+    WINDOW_SECONDS = 5.0
+    RING_SIZE = 32
+
+    def __init__(self, nvml):
+        self.nvml = nvml
+
+        # device index -> lastSeenTimeStamp (µs, NVML's clock) of the newest sample seen
+        self._cursors: Dict[int, int] = {}
+        # device index -> pid -> ring of (timestamp, sm, memory, encoder, decoder); per
+        # device so concurrent updates of different GPUs never touch the same dict
+        self._rings: Dict[int, Dict[int, Deque[Tuple[int, int, int, int, int]]]] = {}
+        self._unsupported: Set[int] = set()
+
+        # Performance tracking
+        self.query_count = 0
+        self.sample_count = 0
+
+    def reset(self):
+        """Forget cursors and samples (new topology)"""
+        self._cursors.clear()
+        self._rings.clear()
+        self._unsupported.clear()
+
+    def update(self, index: int, handle):
+        """Fetch the samples NVML took since the last call for this GPU"""
+        if index in self._unsupported:
+            return
+        nvml = self.nvml
+        cursor = self._cursors.get(index, 0)
+        self.query_count += 1
+        try:
+            samples = nvml.nvmlDeviceGetProcessUtilization(handle, cursor)
+        except (nvml.NVMLError, AttributeError) as e:
+            if _is_unsupported(nvml, e):
+                self._unsupported.add(index)
+                logger.info(f"🔥 GPU {index}: per-process utilization not supported")
+                return
+            # NOT_FOUND (or a bare SUCCESS from the size probe) means no new samples
+            if getattr(e, 'value', None) in (NVML_SUCCESS, nvml.NVML_ERROR_NOT_FOUND):
+                samples = []
+            elif is_topology_error(nvml, e):
+                raise
+            else:
+                logger.debug(f"GPU {index}: process utilization read failed: {e}")
+                return
+
+        rings = self._rings.setdefault(index, {})
+        for sample in samples:
+            if sample.timeStamp <= cursor:
+                continue
+            ring = rings.get(sample.pid)
+            if ring is None:
+                ring = rings[sample.pid] = deque(maxlen=self.RING_SIZE)
+            ring.append((sample.timeStamp, sample.smUtil, sample.memUtil, sample.encUtil, sample.decUtil))
+            self._cursors[index] = max(self._cursors.get(index, 0), sample.timeStamp)
+            self.sample_count += 1
+
+        # Drop pids whose newest sample has left the window (exited or gone idle)
+        horizon = self._cursors.get(index, 0) - int(self.WINDOW_SECONDS * 1_000_000)
+        for pid in [pid for pid, ring in rings.items() if ring[-1][0] < horizon]:
+            del rings[pid]
+
+    def utilization(self, index: int, pid: int) -> Optional[ProcessGPUUtilization]:
+        """Recent utilization of ``pid`` on GPU ``index``; None without recent samples"""
+        ring = self._rings.get(index, {}).get(pid)
+        if not ring:
+            return None
+        horizon = self._cursors.get(index, 0) - int(self.WINDOW_SECONDS * 1_000_000)
+        recent = [sample for sample in ring if sample[0] >= horizon]
+        if not recent:
+            return None
+        count = len(recent)
+        return ProcessGPUUtilization(
+            sm_percent=sum(sample[1] for sample in recent) / count,
+            memory_percent=sum(sample[2] for sample in recent) / count,
+            encoder_percent=sum(sample[3] for sample in recent) / count,
+            decoder_percent=sum(sample[4] for sample in recent) / count,
+            sample_count=count
+        )
@@ -0,0 +1,83 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Process Identity Cache
+SpicyRiceCakes - Read the immutable stuff once per process lifetime
+
+A process's command line, executable, owner and classification never
+change while it lives, so they are cached under (pid, start time). The
+start time makes pid reuse safe: a recycled pid gets a new key, and the
+stale entry is evicted on the next scan because its key is no longer live.
+"""
+
+import logging
+from dataclasses import dataclass, field
+from threading import Lock
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+# (pid, start time) - start time may be jiffies since boot or an epoch timestamp
+ProcessKey = Tuple[int, Hashable]
+
+
+@dataclass(frozen=True)
+class ProcessIdentity:
+    """Attributes that stay fixed for the lifetime of a process"""
+    pid: int
+    name: str
+    command_line: str
+    executable_path: str
+    username: Optional[str]
+    classification: Dict[str, Any] = field(default_factory=dict)
+
+
+class ProcessIdentityCache:
+    """(pid, start time) -> ProcessIdentity, evicted when the process goes away"""
+
+    def __init__(self):
+        self._entries: Dict[ProcessKey, ProcessIdentity] = {}
+        self._lock = Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, key: ProcessKey) -> Optional[ProcessIdentity]:
+        identity = self._entries.get(key)
+        if identity is None:
+            self.misses += 1
+        else:
+            self.hits += 1
+        return identity
+
+    def put(self, key: ProcessKey, identity: ProcessIdentity):
+        with self._lock:
+            self._entries[key] = identity
+
+    def get_or_load(self, key: ProcessKey, loader: Callable[[], ProcessIdentity]) -> ProcessIdentity:
+        """Return the cached identity, calling ``loader`` only on a miss"""
+        identity = self.get(key)
+        if identity is None:
+            identity = loader()
+            self.put(key, identity)
+        return identity
+
+    def retain(self, live_keys: Iterable[ProcessKey]) -> int:
+        """Evict every entry whose process is not in ``live_keys`` (exited or pid reused)"""
+        live = live_keys if isinstance(live_keys, (set, frozenset)) else set(live_keys)
+        with self._lock:
+            stale = [key for key in self._entries if key not in live]
+            for key in stale:
+                del self._entries[key]
+        self.evictions += len(stale)
+        return len(stale)
+
+    def get_stats(self) -> Dict[str, int]:
+        return {
+            'entries': len(self._entries),
+            'hits': self.hits,
+            'misses': self.misses,
+            'evictions': self.evictions
+        }
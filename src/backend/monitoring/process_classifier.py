@@ -0,0 +1,141 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Process Classification Engine
+SpicyRiceCakes - One compiled matcher for every process category
+
+Compiles every category's patterns into a single alternation and finds
+the highest-priority match in one pass over the text. Results are
+memoised on the normalised input, so the same command line seen on every
+tick is only ever matched once.
+"""
+
+import logging
+import re
+from functools import lru_cache
+from typing import List, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# re.search() semantics make leading/trailing '.*' redundant, but they force
+# the old per-pattern searches to backtrack over the whole string
+_REDUNDANT_PREFIX = re.compile(r'^(?:\.\*)+')
+_REDUNDANT_SUFFIX = re.compile(r'(?<!\\)(?:\.\*)+$')
+
+_REGEX_METACHARACTERS = set('.^$*+?{}[]|()')
+_QUANTIFIERS = set('*+?{')
+
+
+def simplify_pattern(pattern: str) -> str:
+    """Drop leading/trailing '.*' - equivalent under re.search()"""
+    simplified = _REDUNDANT_SUFFIX.sub('', _REDUNDANT_PREFIX.sub('', pattern))
+    return simplified or pattern
+
+
+class ClassificationEngine:
+    """
+    Priority-ordered pattern matcher.
+
+    ``categories`` is a sequence of pattern lists, highest priority first.
+    ``search`` returns ``(category_index, pattern_index)`` of the first
+    pattern - in category order, then list order - that matches anywhere in
+    the text, exactly like trying each ``re.search`` in turn would.
+    """
+
+    def __init__(self, categories: Sequence[Sequence[str]], memo_size: int = 8192):
+        self.categories: List[List[str]] = [list(patterns) for patterns in categories]
+
+        # Flat priority order: (category, pattern) pairs and their compiled forms
+        self._order: List[Tuple[int, int]] = []
+        simplified = []
+        for category_index, patterns in enumerate(self.categories):
+            for pattern_index, pattern in enumerate(patterns):
+                self._order.append((category_index, pattern_index))
+                simplified.append(simplify_pattern(pattern))
+        self._patterns = [re.compile(pattern, re.IGNORECASE) for pattern in simplified]
+
+        # One combined matcher, grouped by leading literal so the regex engine
+        # dispatches on the first character instead of trying every branch.
+        # Capturing/named groups would make CPython's re several times slower
+        # here, so the combined matcher only locates candidate positions.
+        heads = [self._literal_head(pattern) for pattern in simplified]
+        self._matcher = re.compile(self._build_alternation(simplified, heads), re.IGNORECASE)
+
+        # Which patterns can start with a given character (priority order)
+        always = [index for index, head in enumerate(heads) if head is None]
+        by_char = {}
+        for index, head in enumerate(heads):
+            if head is not None:
+                by_char.setdefault(self._head_char(head), []).append(index)
+        self._candidates = {char: sorted(indexes + always) for char, indexes in by_char.items()}
+        self._fallback_candidates = always
+
+        self.search = lru_cache(maxsize=memo_size)(self._search)
+
+    @staticmethod
+    def _literal_head(pattern: str) -> Optional[str]:
+        """Leading literal atom of a pattern, or None if it starts with regex syntax"""
+        if pattern.startswith('\\'):
+            head = pattern[:2]
+            if head[1:].isalnum():  # \d, \w, ... are classes, not literals
+                return None
+        else:
+            head = pattern[:1]
+            if head in _REGEX_METACHARACTERS:
+                return None
+        if '|' in pattern or pattern[len(head):len(head) + 1] in _QUANTIFIERS:
+            return None
+        return head
+
+    @staticmethod
+    def _head_char(head: str) -> str:
+        return head[-1].lower()
+
+    @staticmethod
+    def _build_alternation(patterns: Sequence[str], heads: Sequence[Optional[str]]) -> str:
+        grouped = {}
+        ungrouped = []
+        for pattern, head in zip(patterns, heads):
+            if head is None:
+                ungrouped.append(pattern)
+            else:
+                grouped.setdefault(head, []).append(pattern[len(head):])
+
+        branches = [f"{head}(?:{'|'.join(tails)})" for head, tails in grouped.items()]
+        branches.extend(f"(?:{pattern})" for pattern in ungrouped)
+        return '|'.join(branches)
+
+    def _search(self, text: str) -> Optional[Tuple[int, int]]:
+        best = len(self._patterns)
+        position = 0
+        matcher_search = self._matcher.search
+        patterns = self._patterns
+
+        # Single left-to-right pass: each hit is the leftmost position where
+        # some pattern matches; resolve the highest-priority one there and
+        # keep scanning from the next character so overlaps aren't missed.
+        while best > 0:
+            hit = matcher_search(text, position)
+            if hit is None:
+                break
+            start = hit.start()
+            for index in self._candidates.get(text[start].lower(), self._fallback_candidates):
+                if index >= best:
+                    break
+                if patterns[index].match(text, start):
+                    best = index
+                    break
+            position = start + 1
+
+        return self._order[best] if best < len(patterns) else None
+
+    def pattern(self, category_index: int, pattern_index: int) -> str:
+        """Original (unsimplified) pattern for a match"""
+        return self.categories[category_index][pattern_index]
+
+    def cache_info(self):
+        return self.search.cache_info()
+
+    @staticmethod
+    def normalise(process_name: str, command_line: str = "", executable_path: str = "") -> str:
+        """The text every classifier matches against"""
+        return f"{process_name} {command_line} {executable_path}".lower()
@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Direct /proc Process Scanner
+SpicyRiceCakes - Fast process table reads for busy hosts
+
+Reads /proc/[pid]/stat, /proc/[pid]/statm (and /proc/[pid]/io) for every
+process with raw os.open/os.read calls and derives CPU% and IO rates from
+deltas between scans. Bounded heaps pick the top processes during the scan.
+Expensive attributes (cmdline, exe, username) are only read on demand for
+the processes that are actually reported. psutil remains the portable
+fallback on non-Linux hosts.
+"""
+
+import heapq
+import itertools
+import logging
+import os
+import pwd
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Single-letter states from /proc/[pid]/stat, named like psutil's STATUS_* constants
+PROCESS_STATUS = {
+    'R': 'running',
+    'S': 'sleeping',
+    'D': 'disk-sleep',
+    'T': 'stopped',
+    't': 'tracing-stop',
+    'Z': 'zombie',
+    'X': 'dead',
+    'x': 'dead',
+    'K': 'wake-kill',
+    'W': 'waking',
+    'P': 'parked',
+    'I': 'idle',
+}
+
+# Kernel truncates comm to 15 characters (TASK_COMM_LEN - 1)
+_COMM_MAX_LENGTH = 15
+
+
+def read_proc_file(path: str, size: int = 4096) -> bytes:
+    """Read a small /proc file with exactly open + read + close syscalls"""
+    fd = os.open(path, os.O_RDONLY)
+    try:
+        return os.read(fd, size)
+    finally:
+        os.close(fd)
+
+
+@dataclass
+class ProcessSample:
+    """Cheap per-tick process counters from /proc/[pid]/stat and statm"""
+    pid: int
+    name: str
+    status: str
+    cpu_percent: float
+    memory_rss_bytes: int
+    memory_percent: float
+    start_ticks: Optional[int]  # Clock ticks since boot (None when the sample came from psutil)
+    create_time: float
+    io_read_bytes_per_sec: Optional[float] = None
+    io_write_bytes_per_sec: Optional[float] = None
+
+    @property
+    def identity_key(self) -> Tuple[int, Any]:
+        """(pid, start time) - unique for the lifetime of one process"""
+        return (self.pid, self.start_ticks if self.start_ticks is not None else self.create_time)
+
+    @property
+    def io_bytes_per_sec(self) -> float:
+        return (self.io_read_bytes_per_sec or 0.0) + (self.io_write_bytes_per_sec or 0.0)
+
+
+class ProcProcessScanner:
+    """Linux process table scanner reading /proc directly"""
+
+    def __init__(self, proc_root: str = '/proc', collect_io: bool = True):
+        self.proc_root = proc_root
+        self.collect_io = collect_io
+        self._clock_ticks = os.sysconf('SC_CLK_TCK')
+        self._page_size = os.sysconf('SC_PAGE_SIZE')
+        self._boot_time = self._read_boot_time()
+        self._memory_total = self._read_memory_total()
+
+        # pid -> (start_ticks, utime + stime ticks, monotonic timestamp, (read_bytes, write_bytes))
+        self._last_counters: Dict[int, tuple] = {}
+        self._io_denied: Set[Tuple[int, int]] = set()
+        self._usernames: Dict[int, Optional[str]] = {}
+
+    @staticmethod
+    def is_supported(proc_root: str = '/proc') -> bool:
+        """Check whether this host exposes a Linux-style /proc"""
+        return (hasattr(os, 'sysconf')
+                and os.path.exists(os.path.join(proc_root, 'stat'))
+                and os.path.exists(os.path.join(proc_root, 'self', 'stat')))
+
+    def _read_boot_time(self) -> float:
+        with open(os.path.join(self.proc_root, 'stat'), 'rb') as stat_file:
+            for line in stat_file:
+                if line.startswith(b'btime'):
+                    return float(line.split()[1])
+        raise ValueError("btime missing from /proc/stat")
+
+    def _read_memory_total(self) -> int:
+        with open(os.path.join(self.proc_root, 'meminfo'), 'rb') as meminfo_file:
+            for line in meminfo_file:
+                if line.startswith(b'MemTotal:'):
+                    return int(line.split()[1]) * 1024
+        raise ValueError("MemTotal missing from /proc/meminfo")
+
+    def _pid_path(self, pid: int, name: str) -> str:
+        return f"{self.proc_root}/{pid}/{name}"
+
+    def list_pids(self) -> List[int]:
+        """All numeric entries in /proc"""
+        return [int(name) for name in os.listdir(self.proc_root) if name.isdigit()]
+
+    def scan(self, selector: 'TopKSelector' = None) -> List[ProcessSample]:
+        """
+        Read stat/statm (and io, when enabled) for every process and compute
+        rates since the last scan. Each sample is offered to ``selector`` as
+        it is parsed, so rankings are ready when the scan finishes.
+        """
+        now = time.monotonic()
+        samples = []
+        last_counters = self._last_counters
+        current_counters = {}
+
+        for pid in self.list_pids():
+            try:
+                stat = read_proc_file(self._pid_path(pid, 'stat'))
+                statm = read_proc_file(self._pid_path(pid, 'statm'))
+            except OSError:
+                # Process exited mid-scan (or is hidden from us)
+                continue
+
+            try:
+                sample = self._parse(pid, stat, statm, now, last_counters, current_counters)
+            except (ValueError, IndexError) as e:
+                logger.debug(f"Unparseable /proc entry for PID {pid}: {e}")
+                continue
+
+            samples.append(sample)
+            if selector is not None:
+                selector.offer(sample)
+
+        # Dropping the old table also evicts exited pids
+        self._last_counters = current_counters
+        self._io_denied.intersection_update(
+            (pid, counters[0]) for pid, counters in current_counters.items()
+        )
+        return samples
+
+    def _read_io_bytes(self, pid: int, start_ticks: int) -> Optional[Tuple[int, int]]:
+        """(read_bytes, write_bytes) from /proc/[pid]/io, None if not permitted"""
+        key = (pid, start_ticks)
+        if key in self._io_denied:
+            return None
+        try:
+            data = read_proc_file(self._pid_path(pid, 'io'))
+        except PermissionError:
+            # Stays denied for the lifetime of this process - don't retry every tick
+            self._io_denied.add(key)
+            return None
+        except OSError:
+            return None
+
+        read_bytes = write_bytes = 0
+        for line in data.splitlines():
+            if line.startswith(b'read_bytes:'):
+                read_bytes = int(line[11:])
+            elif line.startswith(b'write_bytes:'):
+                write_bytes = int(line[12:])
+        return read_bytes, write_bytes
+
+    def _parse(self, pid: int, stat: bytes, statm: bytes, now: float,
+               last_counters: Dict[int, tuple], current_counters: Dict[int, tuple]) -> ProcessSample:
+        # comm may contain spaces and parentheses - it ends at the last ')'
+        comm_end = stat.rindex(b')')
+        name = stat[stat.index(b'(') + 1:comm_end].decode('utf-8', 'replace')
+        fields = stat[comm_end + 2:].split()
+
+        # Field numbers from proc(5), minus the 3 that precede this slice
+        state = fields[0].decode()
+        cpu_ticks = int(fields[11]) + int(fields[12])  # utime + stime
+        start_ticks = int(fields[19])
+        rss_bytes = int(statm.split()[1]) * self._page_size
+
+        # Kernel threads have no memory map and no meaningful IO accounting
+        io_bytes = self._read_io_bytes(pid, start_ticks) if self.collect_io and rss_bytes else None
+
+        cpu_percent = 0.0
+        io_read_bytes_per_sec = None
+        io_write_bytes_per_sec = None
+        previous = last_counters.get(pid)
+        if previous is not None and previous[0] == start_ticks:
+            elapsed = now - previous[2]
+            if elapsed > 0:
+                cpu_percent = round((cpu_ticks - previous[1]) / self._clock_ticks / elapsed * 100, 1)
+                if io_bytes is not None and previous[3] is not None:
+                    io_read_bytes_per_sec = max(io_bytes[0] - previous[3][0], 0) / elapsed
+                    io_write_bytes_per_sec = max(io_bytes[1] - previous[3][1], 0) / elapsed
+        current_counters[pid] = (start_ticks, cpu_ticks, now, io_bytes)
+
+        return ProcessSample(
+            pid=pid,
+            name=name,
+            status=PROCESS_STATUS.get(state, state),
+            cpu_percent=cpu_percent,
+            memory_rss_bytes=rss_bytes,
+            memory_percent=rss_bytes / self._memory_total * 100 if self._memory_total else 0.0,
+            start_ticks=start_ticks,
+            create_time=self._boot_time + start_ticks / self._clock_ticks,
+            io_read_bytes_per_sec=io_read_bytes_per_sec,
+            io_write_bytes_per_sec=io_write_bytes_per_sec
+        )
+
+    def read_cmdline(self, pid: int) -> List[str]:
+        """Argument vector of a process (empty for kernel threads and zombies)"""
+        data = read_proc_file(self._pid_path(pid, 'cmdline'), 65536)
+        return [arg.decode('utf-8', 'replace') for arg in data.rstrip(b'\0').split(b'\0') if arg]
+
+    def read_exe(self, pid: int) -> str:
+        """Executable path, or empty string when it can't be resolved"""
+        try:
+            return os.readlink(self._pid_path(pid, 'exe'))
+        except OSError:
+            return ""
+
+    def read_username(self, pid: int) -> Optional[str]:
+        """Owner of the process, resolved through a per-uid cache"""
+        uid = os.stat(f"{self.proc_root}/{pid}").st_uid
+        if uid not in self._usernames:
+            try:
+                self._usernames[uid] = pwd.getpwuid(uid).pw_name
+            except KeyError:
+                self._usernames[uid] = str(uid)
+        return self._usernames[uid]
+
+    @staticmethod
+    def full_name(name: str, cmdline: List[str]) -> str:
+        """Undo comm truncation the way psutil does, using argv[0]"""
+        if len(name) >= _COMM_MAX_LENGTH and cmdline:
+            candidate = os.path.basename(cmdline[0])
+            if candidate.startswith(name):
+                return candidate
+        return name
+
+
+class TopKSelector:
+    """
+    Bounded heaps that keep the top ``limit`` items per ranking while a scan
+    streams past - O(n log k) and no full sort or materialisation.
+    """
+
+    def __init__(self, limit: int, rankings: Dict[str, Callable[[Any], float]],
+                 admit: Callable[[str, Any], bool] = None):
+        self.limit = limit
+        self.rankings = rankings
+        self.admit = admit
+        self._heaps: Dict[str, list] = {name: [] for name in rankings}
+        self._counter = itertools.count()  # Tie-breaker so items are never compared
+
+    def offer(self, item):
+        for name, key in self.rankings.items():
+            if self.admit is not None and not self.admit(name, item):
+                continue
+            entry = (key(item), next(self._counter), item)
+            heap = self._heaps[name]
+            if len(heap) < self.limit:
+                heapq.heappush(heap, entry)
+            elif entry[0] > heap[0][0]:
+                heapq.heapreplace(heap, entry)
+
+    def winners(self, name: str) -> list:
+        """Items of one ranking, highest first"""
+        return [entry[2] for entry in sorted(self._heaps[name], key=lambda entry: (-entry[0], entry[1]))]
+
+    def all_winners(self) -> list:
+        """Distinct items that made it into any ranking"""
+        seen = {}
+        for name in self.rankings:
+            for item in self.winners(name):
+                seen.setdefault(id(item), item)
+        return list(seen.values())
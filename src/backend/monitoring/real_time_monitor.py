@@ -8,37 +8,35 @@ from typing import Dict, Any, Optional
 from threading import Lock
 import json
 
+from .collector_scheduler import UPDATE_FREQUENCIES
+
 # Setup logging
 logger = logging.getLogger(__name__)
 
 class RealTimeMonitor:
     """
-    Unified real-time monitoring system that collects GPU and system metrics
-    and emits them via WebSocket with intelligent update frequencies.
+    Unified real-time monitoring system that reads GPU and system metrics
+    from the sampler's latest snapshot and emits them via WebSocket with
+    intelligent update frequencies.
     
     Implements Sophie's approved architecture with tiered updates and event-driven alerts.
     """
     
-    # Tiered update frequencies (seconds)
-    UPDATE_FREQUENCIES = {
-        'critical': 1,      # CPU >90%, GPU temp >80°C, suspected miners
-        'important': 2,     # GPU/CPU usage, process changes
-        'standard': 5,      # Memory, basic system metrics
-        'background': 10    # Network stats, disk I/O
-    }
+    # Tiered update frequencies (seconds) - shared with the collector scheduler,
+    # which applies the same tiers to collection itself
+    UPDATE_FREQUENCIES = UPDATE_FREQUENCIES
     
-    def __init__(self, socketio, gpu_service, system_monitor):
+    def __init__(self, socketio, sampler):
         """
         Initialize the real-time monitoring system.
         
         Args:
             socketio: Flask-SocketIO instance for WebSocket emission
-            gpu_service: GPUMonitoringService instance
-            system_monitor: SystemMonitor instance
+            sampler: MetricsSampler whose snapshot store feeds every emission
         """
         self.socketio = socketio
-        self.gpu_service = gpu_service
-        self.system_monitor = system_monitor
+        self.sampler = sampler
+        self.snapshot_store = sampler.store
         
         # State management
         self.last_metrics = {}
@@ -122,15 +120,19 @@ class RealTimeMonitor:
     
     def _collect_and_emit_metrics(self, current_time: float):
         """
-        Collect metrics from GPU and system monitors and emit via WebSocket
+        Read the latest metrics snapshot and emit via WebSocket
         using intelligent update frequency logic.
         """
         try:
+            snapshot = self.snapshot_store.latest()
+            if snapshot is None:
+                return
+            
             # Collect GPU metrics
-            gpu_data = self._collect_gpu_metrics()
+            gpu_data = self._collect_gpu_metrics(snapshot)
             
             # Collect system metrics  
-            system_data = self._collect_system_metrics()
+            system_data = self._collect_system_metrics(snapshot)
             
             # Determine update urgency and emit accordingly
             self._emit_tiered_updates(gpu_data, system_data, current_time)
@@ -139,14 +141,14 @@ class RealTimeMonitor:
             logger.error(f"❌ Failed to collect and emit metrics: {e}")
             raise
     
-    def _collect_gpu_metrics(self) -> Dict[str, Any]:
-        """Collect GPU metrics with error handling."""
+    def _collect_gpu_metrics(self, snapshot) -> Dict[str, Any]:
+        """Convert the snapshot's GPU metrics with error handling."""
         try:
-            if not self.gpu_service.is_available():
+            if not snapshot.gpu_available:
                 return {'available': False, 'gpus': []}
             
-            summary = self.gpu_service.get_summary()
-            metrics = self.gpu_service.get_gpu_metrics()
+            summary = snapshot.gpu_summary
+            metrics = snapshot.gpus
             
             # Convert to JSON-serializable format
             gpu_data = []
@@ -181,18 +183,18 @@ class RealTimeMonitor:
                 'available': True,
                 'summary': summary,
                 'gpus': gpu_data,
-                'timestamp': time.time()
+                'timestamp': snapshot.timestamp
             }
             
         except Exception as e:
             logger.error(f"❌ Failed to collect GPU metrics: {e}")
             return {'available': False, 'error': str(e)}
     
-    def _collect_system_metrics(self) -> Dict[str, Any]:
-        """Collect system metrics with error handling."""
+    def _collect_system_metrics(self, snapshot) -> Dict[str, Any]:
+        """Convert the snapshot's system metrics with error handling."""
         try:
-            summary = self.system_monitor.get_summary()
-            metrics = self.system_monitor.get_system_metrics()
+            summary = snapshot.system_summary
+            metrics = snapshot.system
             
             return {
                 'available': True,
@@ -221,7 +223,7 @@ class RealTimeMonitor:
                     }
                     for proc in metrics.top_processes[:10]  # Top 10 processes
                 ],
-                'timestamp': time.time()
+                'timestamp': snapshot.timestamp
             }
             
         except Exception as e:
@@ -304,7 +306,8 @@ class RealTimeMonitor:
                 'gpu': gpu_data,
                 'system': system_data,
                 'timestamp': time.time(),
-                'update_count': self.update_count
+                'update_count': self.update_count,
+                'snapshot_version': self.snapshot_store.version
             }
             
             # Use namespaced event names (Sophie's recommendation)
@@ -419,21 +422,27 @@ class RealTimeMonitor:
             'error_count': self.error_count,
             'uptime_seconds': uptime,
             'updates_per_minute': (self.update_count / uptime * 60) if uptime > 0 else 0,
-            'error_rate': (self.error_count / self.update_count) if self.update_count > 0 else 0
+            'error_rate': (self.error_count / self.update_count) if self.update_count > 0 else 0,
+            'sampler': self.sampler.get_stats()
         }
     
     def force_update(self):
-        """Force an immediate update of all metrics (for manual refresh)."""
+        """Force an immediate emission of the latest snapshot (for manual refresh)."""
         try:
             if not self.monitoring_active:
                 logger.warning("Cannot force update - monitoring not active")
                 return
             
-            current_time = time.time()
+            # Ask the sampler for a fresh snapshot; the next loop iteration picks it up
+            self.sampler.request_refresh()
             
-            # Collect metrics
-            gpu_data = self._collect_gpu_metrics()
-            system_data = self._collect_system_metrics()
+            snapshot = self.snapshot_store.latest()
+            if snapshot is None:
+                logger.warning("Cannot force update - no metrics snapshot yet")
+                return
+            
+            gpu_data = self._collect_gpu_metrics(snapshot)
+            system_data = self._collect_system_metrics(snapshot)
             
             # Emit immediately regardless of frequency limits
             self._emit_metrics_update(gpu_data, system_data, 'critical')
@@ -443,4 +452,4 @@ class RealTimeMonitor:
             
         except Exception as e:
             logger.error(f"❌ Failed to force update: {e}")
-            raise
\ No newline at end of file
+            raise
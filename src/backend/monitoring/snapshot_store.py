@@ -0,0 +1,217 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Metrics Snapshot Store
+SpicyRiceCakes - One sampler, many readers
+
+A single background sampler collects system and GPU metrics and publishes
+them as versioned, read-only snapshots. REST endpoints and Socket.IO emitters
+only ever read the latest snapshot, so no request thread pays for a psutil
+or NVML collection. A CollectorScheduler decides which collectors run on
+each tick; the rest of the snapshot carries their previous values forward.
+"""
+
+import logging
+import time
+from dataclasses import dataclass, field
+from threading import Condition, Event, Thread
+from typing import Any, Dict, Iterable, Optional, Tuple
+
+from .collector_scheduler import CollectorScheduler
+from .container_index import ContainerUsage, merge_gpu_usage
+from .gpu_monitor import GPUMetrics
+from .system_monitor import SystemMetrics
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class MetricsSnapshot:
+    """Immutable view of one sampler tick - treat every nested value as read-only"""
+    version: int
+    system: SystemMetrics
+    gpus: Tuple[GPUMetrics, ...]
+    gpu_available: bool
+    system_summary: Dict[str, Any] = field(default_factory=dict)
+    gpu_summary: Dict[str, Any] = field(default_factory=dict)
+    containers: Tuple[ContainerUsage, ...] = ()  # CPU/RSS/GPU memory per container
+    collection_seconds: float = 0.0
+    timestamp: float = field(default_factory=time.time)
+
+
+class SnapshotStore:
+    """Holds the latest MetricsSnapshot; publishing swaps a single reference"""
+
+    def __init__(self):
+        self._condition = Condition()
+        self._snapshot: Optional[MetricsSnapshot] = None
+        self._version = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def publish(self, system: SystemMetrics, gpus, gpu_available: bool,
+                system_summary: Dict[str, Any] = None, gpu_summary: Dict[str, Any] = None,
+                containers=None, collection_seconds: float = 0.0) -> MetricsSnapshot:
+        """Publish a new snapshot and wake up anyone waiting for one"""
+        with self._condition:
+            self._version += 1
+            snapshot = MetricsSnapshot(
+                version=self._version,
+                system=system,
+                gpus=tuple(gpus or ()),
+                gpu_available=gpu_available,
+                system_summary=system_summary or {},
+                gpu_summary=gpu_summary or {},
+                containers=tuple(containers or ()),
+                collection_seconds=collection_seconds
+            )
+            self._snapshot = snapshot
+            self._condition.notify_all()
+        return snapshot
+
+    def latest(self, timeout: Optional[float] = None) -> Optional[MetricsSnapshot]:
+        """
+        Get the newest snapshot.
+
+        Only blocks (up to ``timeout`` seconds) when nothing has been
+        published yet, e.g. for requests arriving right after startup.
+        """
+        snapshot = self._snapshot
+        if snapshot is not None or not timeout:
+            return snapshot
+
+        with self._condition:
+            self._condition.wait_for(lambda: self._snapshot is not None, timeout=timeout)
+            return self._snapshot
+
+
+class MetricsSampler:
+    """Dedicated background thread that owns all metric collection"""
+
+    def __init__(self, system_monitor, gpu_service, store: SnapshotStore = None,
+                 scheduler: CollectorScheduler = None):
+        self.system_monitor = system_monitor
+        self.gpu_service = gpu_service
+        self.store = store or SnapshotStore()
+        self.scheduler = scheduler or CollectorScheduler()
+
+        # GPU results carried forward between GPU collections
+        self._gpu_available = False
+        self._gpu_metrics = []
+        self._gpu_summary: Dict[str, Any] = {}
+
+        self._thread: Optional[Thread] = None
+        self._stop_event = Event()
+        self._refresh_event = Event()
+
+        # Performance tracking
+        self.sample_count = 0
+        self.error_count = 0
+        self.gpu_error_count = 0
+        self.last_collection_seconds = 0.0
+
+    def start(self):
+        """Start the sampler thread (idempotent)"""
+        if self._thread is not None and self._thread.is_alive():
+            logger.warning("Metrics sampler already running")
+            return
+
+        self._stop_event.clear()
+        self._thread = Thread(target=self._sampling_loop, name="hoof-hearted-sampler", daemon=True)
+        self._thread.start()
+        logger.info(f"📸 Metrics sampler started ({len(self.scheduler.names)} scheduled collectors)")
+
+    def stop(self, timeout: float = 5.0):
+        """Stop the sampler thread"""
+        self._stop_event.set()
+        self._refresh_event.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+        logger.info("⏹️ Metrics sampler stopped")
+
+    def request_refresh(self):
+        """Ask the sampler to run every collector without waiting for their deadlines"""
+        self.scheduler.request_all()
+        self._refresh_event.set()
+
+    def sample_once(self, collectors: Iterable[str] = None) -> MetricsSnapshot:
+        """Run the given collectors (default: all) and publish a new snapshot"""
+        started = time.monotonic()
+        names = set(self.scheduler.names if collectors is None else collectors)
+
+        system_names = [name for name in self.system_monitor.COLLECTORS if name in names]
+        system_metrics = self.system_monitor.refresh_collectors(system_names)
+        for name in system_names:
+            self.scheduler.complete(name, self.system_monitor.get_collector_value(name))
+
+        if 'gpu' in names or not self.store.version:
+            self._collect_gpu()
+
+        system_summary = self.system_monitor.get_summary(system_metrics)
+        containers = merge_gpu_usage(system_metrics.containers, self._gpu_metrics)
+
+        collection_seconds = time.monotonic() - started
+        self.last_collection_seconds = collection_seconds
+        self.sample_count += 1
+
+        return self.store.publish(
+            system=system_metrics,
+            gpus=self._gpu_metrics,
+            gpu_available=self._gpu_available,
+            system_summary=system_summary,
+            gpu_summary=self._gpu_summary,
+            containers=containers,
+            collection_seconds=collection_seconds
+        )
+
+    def _collect_gpu(self):
+        """GPU collection - a failure keeps the last good GPU values instead of aborting the tick"""
+        try:
+            available = self.gpu_service.is_available()
+            metrics = self.gpu_service.get_gpu_metrics(force_update=True) if available else []
+            self.system_monitor.tag_gpu_processes(metrics)
+            summary = self.gpu_service.get_summary(metrics)
+        except Exception as e:
+            self.gpu_error_count += 1
+            logger.error(f"❌ GPU collection failed, keeping previous GPU values: {e}")
+            self.scheduler.defer('gpu')
+            return
+
+        self._gpu_available = available
+        self._gpu_metrics = metrics
+        self._gpu_summary = summary
+        self.scheduler.complete('gpu', metrics)
+
+    def _sampling_loop(self):
+        """Run whichever collectors are due, then sleep until the next deadline"""
+        while not self._stop_event.is_set():
+            due = self.scheduler.due()
+            if due:
+                try:
+                    self.sample_once(due)
+                except Exception as e:
+                    self.error_count += 1
+                    logger.error(f"❌ Metrics sampler tick failed: {e}")
+                    # Don't spin on a collector that keeps failing - retry in its next slot
+                    for name in self.scheduler.due():
+                        self.scheduler.defer(name)
+
+            self._refresh_event.wait(timeout=self.scheduler.seconds_until_next())
+            self._refresh_event.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get sampler statistics for the monitoring stats endpoint"""
+        snapshot = self.store.latest()
+        return {
+            'running': self._thread is not None and self._thread.is_alive(),
+            'collectors': self.scheduler.get_stats(),
+            'system_collectors': self.system_monitor.get_collector_stats(),
+            'sample_count': self.sample_count,
+            'error_count': self.error_count,
+            'gpu_error_count': self.gpu_error_count,
+            'last_collection_seconds': self.last_collection_seconds,
+            'snapshot_version': snapshot.version if snapshot else 0,
+            'snapshot_age_seconds': (time.time() - snapshot.timestamp) if snapshot else None
+        }
@@ -8,12 +8,29 @@ with CPU, memory, disk, and network analysis.
 """
 
 import logging
+import os
 import time
 import platform
-from dataclasses import dataclass
-from typing import List, Dict, Optional, Tuple
+from concurrent.futures import Future, ThreadPoolExecutor, TimeoutError as FutureTimeoutError
+from functools import partial
+from threading import Lock
+from dataclasses import dataclass, replace
+from typing import Any, Dict, Iterable, List, Optional, Tuple
 import psutil
 
+from .connection_stats import ConnectionStats, ConnectionStatsCollector
+from .cgroup_collector import CgroupCollector, CgroupStats
+from .container_index import ContainerIndex, ContainerUsage, DockerResolver
+from .cpu_sampler import ProcStatCPUSampler
+from .diskstats import BlockDeviceIO, DiskStatsSampler
+from .host_paths import HostPaths
+from .interface_collector import InterfaceCollector
+from .mount_registry import MountRegistry
+from .gpu_monitor import ProcessClassifier
+from .process_classifier import ClassificationEngine
+from .process_cache import ProcessIdentity, ProcessIdentityCache
+from .process_scanner import ProcProcessScanner, ProcessSample, TopKSelector
+
 logger = logging.getLogger(__name__)
 
 
@@ -28,6 +45,7 @@ class CPUMetrics:
     load_average: Optional[Tuple[float, float, float]]  # 1min, 5min, 15min
     core_count: int
     thread_count: int
+    per_state_percent: Optional[Dict[str, float]] = None  # user, system, iowait, steal, irq, ...
     timestamp: float = None
     
     def __post_init__(self):
@@ -89,6 +107,8 @@ class NetworkInterface:
     bytes_recv_per_sec: Optional[float] = None
     is_up: bool = True
     addresses: List[str] = None
+    mtu: Optional[int] = None
+    speed_mbps: Optional[int] = None  # Link speed; None for virtual interfaces
     timestamp: float = None
     
     def __post_init__(self):
@@ -107,6 +127,7 @@ class NetworkMetrics:
     active_connections: int
     total_bytes_sent_per_sec: Optional[float] = None
     total_bytes_recv_per_sec: Optional[float] = None
+    connection_stats: Optional[ConnectionStats] = None  # Socket counts by protocol (and TCP state)
     timestamp: float = None
     
     def __post_init__(self):
@@ -129,6 +150,12 @@ class SystemProcess:
     runtime_seconds: Optional[float] = None
     process_type: Optional[str] = None  # 'backup', 'system', 'development', 'database', 'unknown'
     is_system_intensive: bool = False
+    io_read_bytes_per_sec: Optional[float] = None
+    io_write_bytes_per_sec: Optional[float] = None
+    container_id: Optional[str] = None
+    container_name: Optional[str] = None
+    compose_project: Optional[str] = None
+    systemd_unit: Optional[str] = None
     timestamp: float = None
     
     def __post_init__(self):
@@ -143,13 +170,31 @@ class SystemMetrics:
     memory: MemoryMetrics
     disks: List[DiskMetrics]
     network: NetworkMetrics
-    top_processes: List[SystemProcess]
+    top_processes: List[SystemProcess]  # Ranked by CPU usage
     platform_info: Dict[str, str]
+    top_processes_by_memory: List[SystemProcess] = None  # Ranked by resident memory
+    top_processes_by_io: List[SystemProcess] = None  # Ranked by disk read + write rate
+    block_devices: List[BlockDeviceIO] = None  # IO activity per block device (disks, partitions, dm/md, loop)
+    stale_collectors: List[str] = None  # Collectors that missed their deadline - last good value shown
+    containers: List[ContainerUsage] = None  # CPU/RSS rollup per container (GPU memory is added per snapshot)
+    cgroups: List[CgroupStats] = None  # cgroup v2 usage per container and top-level slice
     timestamp: float = None
     
     def __post_init__(self):
         if self.timestamp is None:
             self.timestamp = time.time()
+        if self.top_processes_by_memory is None:
+            self.top_processes_by_memory = []
+        if self.top_processes_by_io is None:
+            self.top_processes_by_io = []
+        if self.block_devices is None:
+            self.block_devices = []
+        if self.stale_collectors is None:
+            self.stale_collectors = []
+        if self.containers is None:
+            self.containers = []
+        if self.cgroups is None:
+            self.cgroups = []
 
 
 class SystemProcessClassifier:
@@ -183,15 +228,60 @@ class SystemProcessClassifier:
         r'.*dock.*', r'.*activity.?monitor.*'
     ]
     
+    # Checked after the GPU categories, in this priority order
+    CATEGORY_RESULTS = [
+        {
+            'process_type': 'backup',
+            'is_system_intensive': True,
+            'confidence': 0.8,
+            'reason': 'Backup or synchronization process'
+        },
+        {
+            'process_type': 'development',
+            'is_system_intensive': True,
+            'confidence': 0.7,
+            'reason': 'Development or compilation process'
+        },
+        {
+            'process_type': 'database',
+            'is_system_intensive': True,
+            'confidence': 0.8,
+            'reason': 'Database or data processing service'
+        },
+        {
+            'process_type': 'system',
+            'is_system_intensive': False,  # System processes are normal
+            'confidence': 0.6,
+            'reason': 'System or OS process'
+        },
+    ]
+    
+    _engine = None
+    
+    @classmethod
+    def get_engine(cls) -> ClassificationEngine:
+        """One compiled matcher covering the GPU categories followed by the system ones"""
+        if cls._engine is None:
+            cls._engine = ClassificationEngine(
+                ProcessClassifier.category_patterns() + [
+                    cls.BACKUP_PROCESSES, cls.DEVELOPMENT_PROCESSES,
+                    cls.DATABASE_PROCESSES, cls.SYSTEM_PROCESSES
+                ]
+            )
+        return cls._engine
+    
     @staticmethod
     def classify_process(process_name: str, command_line: str = "", executable_path: str = "") -> Dict[str, any]:
         """Classify system process to explain high resource usage"""
-        from .gpu_monitor import ProcessClassifier
+        engine = SystemProcessClassifier.get_engine()
+        text_to_analyze = engine.normalise(process_name, command_line, executable_path)
+        
+        match = engine.search(text_to_analyze)
+        gpu_category_count = len(ProcessClassifier.CATEGORY_RESULTS)
         
-        # First try GPU-specific classification
-        gpu_classification = ProcessClassifier.classify_process(process_name, command_line, executable_path)
-        if gpu_classification['process_type'] != 'unknown':
-            return gpu_classification
+        # GPU-specific classification takes precedence
+        if match is not None and match[0] < gpu_category_count:
+            return ProcessClassifier.result_for_match(match[0], engine.pattern(*match))
         
         # Extended classification for system processes
         classification = {
@@ -200,56 +290,8 @@ class SystemProcessClassifier:
             'confidence': 0.0,
             'reason': 'Unknown process type'
         }
-        
-        text_to_analyze = f"{process_name} {command_line} {executable_path}".lower()
-        
-        # Check for backup processes
-        for pattern in SystemProcessClassifier.BACKUP_PROCESSES:
-            import re
-            if re.search(pattern, text_to_analyze, re.IGNORECASE):
-                classification.update({
-                    'process_type': 'backup',
-                    'is_system_intensive': True,
-                    'confidence': 0.8,
-                    'reason': 'Backup or synchronization process'
-                })
-                return classification
-        
-        # Check for development processes
-        for pattern in SystemProcessClassifier.DEVELOPMENT_PROCESSES:
-            import re
-            if re.search(pattern, text_to_analyze, re.IGNORECASE):
-                classification.update({
-                    'process_type': 'development',
-                    'is_system_intensive': True,
-                    'confidence': 0.7,
-                    'reason': 'Development or compilation process'
-                })
-                return classification
-        
-        # Check for database processes
-        for pattern in SystemProcessClassifier.DATABASE_PROCESSES:
-            import re
-            if re.search(pattern, text_to_analyze, re.IGNORECASE):
-                classification.update({
-                    'process_type': 'database',
-                    'is_system_intensive': True,
-                    'confidence': 0.8,
-                    'reason': 'Database or data processing service'
-                })
-                return classification
-        
-        # Check for system processes
-        for pattern in SystemProcessClassifier.SYSTEM_PROCESSES:
-            import re
-            if re.search(pattern, text_to_analyze, re.IGNORECASE):
-                classification.update({
-                    'process_type': 'system',
-                    'is_system_intensive': False,  # System processes are normal
-                    'confidence': 0.6,
-                    'reason': 'System or OS process'
-                })
-                return classification
+        if match is not None:
+            classification.update(SystemProcessClassifier.CATEGORY_RESULTS[match[0] - gpu_category_count])
         
         return classification
 
@@ -257,14 +299,131 @@ class SystemProcessClassifier:
 class SystemMonitor:
     """Comprehensive system monitoring service"""
     
-    def __init__(self, update_interval: float = 2.0):
+    # Independently refreshable parts of SystemMetrics
+    COLLECTORS = ('cpu', 'sensors', 'memory', 'disk', 'network', 'processes', 'containers')
+    
+    # Per-collector deadlines (seconds) - a hung NFS mount or slow
+    # net_connections() must not hold up the rest of the tick
+    COLLECTOR_TIMEOUTS = {
+        'cpu': 1.0,
+        'sensors': 2.0,
+        'memory': 1.0,
+        'disk': 3.0,
+        'network': 3.0,
+        'processes': 3.0,
+        'containers': 2.0
+    }
+    
+    def __init__(self, update_interval: float = 2.0, host_paths: Optional[HostPaths] = None):
         self.update_interval = update_interval
+        
+        # HOST_PROC / HOST_SYS send every reader (psutil included) to the host's proc and sys
+        self.host_paths = host_paths or HostPaths.from_env()
+        self.host_paths.configure_psutil()
+        
         self._last_update = 0
         self._cached_metrics = None
         self._last_disk_io = None
+        self._last_disk_io_time = None
         self._last_network_io = None
+        self._last_network_io_time = None
         self._platform_info = self._get_platform_info()
         
+        # Latest value from each collector - a partial refresh reuses the rest
+        self._collector_values: Dict[str, Any] = {}
+        self._collector_functions = {
+            'cpu': lambda: self.get_cpu_metrics(include_temperature=False),
+            'sensors': self._get_cpu_temperature,
+            'memory': self.get_memory_metrics,
+            'disk': self.get_storage_metrics,
+            'network': self.get_network_metrics,
+            'processes': self.get_process_rankings,
+            'containers': self.get_cgroup_metrics
+        }
+        
+        # Per-block-device IO rates from /proc/diskstats, psutil elsewhere
+        paths = self.host_paths
+        self._diskstats = None
+        if DiskStatsSampler.is_supported(paths.proc_root):
+            self._diskstats = DiskStatsSampler(paths.proc_root, paths.sys_root)
+        self._block_devices: List[BlockDeviceIO] = []
+        
+        # Interface counters from one /proc/net/dev read, addresses cached until interfaces change
+        self._interface_collector = None
+        if InterfaceCollector.is_supported(paths.net_root):
+            self._interface_collector = InterfaceCollector(
+                paths.net_root, paths.sys_class_net,
+                # getifaddrs() only sees our own namespace - don't pin its addresses on host interfaces
+                read_addresses=paths.shares_network_namespace()
+            )
+        
+        # Connection counts from /proc/net/sockstat and snmp, psutil.net_connections elsewhere
+        self._connection_stats = None
+        if ConnectionStatsCollector.is_supported(paths.net_root):
+            self._connection_stats = ConnectionStatsCollector(
+                paths.net_root,
+                collect_tcp_states=os.getenv('TCP_STATE_COUNTS', 'false').lower() == 'true'
+            )
+        
+        # Mount table parsed only when it changes; capacity refreshed on a slower cadence
+        self._mount_registry = None
+        if MountRegistry.is_supported(paths.mountinfo_path):
+            try:
+                self._mount_registry = MountRegistry(paths.mountinfo_path, paths.filesystems_path,
+                                                     rootfs=paths.rootfs)
+            except Exception as e:
+                logger.warning(f"Mount registry unavailable, using psutil: {e}")
+        
+        # Collectors run concurrently; at most one in flight each, so a hung
+        # collector occupies one worker instead of piling up new ones
+        self._collector_pool = ThreadPoolExecutor(
+            max_workers=len(self.COLLECTORS), thread_name_prefix='hoof-hearted-collector'
+        )
+        self._in_flight: Dict[str, Future] = {}
+        self._stale_collectors = set()
+        self._collector_stats = {
+            name: {'runs': 0, 'timeouts': 0, 'errors': 0, 'stale': 0} for name in self.COLLECTORS
+        }
+        
+        # Single-flight refresh: one collection per expiry, everyone else reuses it
+        self._refresh_lock = Lock()
+        self._refresh_generation = 0
+        self.collection_count = 0
+        
+        # Non-blocking CPU sampling: /proc/stat deltas on Linux, psutil elsewhere
+        self._cpu_sampler = None
+        if ProcStatCPUSampler.is_supported(paths.proc_root):
+            try:
+                self._cpu_sampler = ProcStatCPUSampler(paths.proc_root)
+            except Exception as e:
+                logger.warning(f"/proc/stat CPU sampler unavailable, using psutil: {e}")
+        if self._cpu_sampler is None:
+            # Prime psutil's non-blocking counters so the first tick has a baseline
+            psutil.cpu_percent(interval=None)
+            psutil.cpu_percent(interval=None, percpu=True)
+            psutil.cpu_times_percent(interval=None)
+        
+        # cmdline/exe/username/classification per (pid, start time)
+        self._identity_cache = ProcessIdentityCache()
+        
+        # Container / compose project / systemd unit per (pid, start time), names via docker.sock
+        docker_resolver = DockerResolver() if DockerResolver.is_supported() else None
+        self.container_index = ContainerIndex(self.host_paths.proc_root, docker_resolver)
+        
+        # Per-container and per-slice usage from cgroup v2 files - no process scan needed
+        self._cgroup_collector = None
+        if CgroupCollector.is_supported(self.host_paths.sys_root):
+            self._cgroup_collector = CgroupCollector(self.host_paths.sys_root, docker_resolver)
+        self._last_process_io = {}
+        
+        # Direct /proc process table reads on Linux, psutil.process_iter elsewhere
+        self._process_scanner = None
+        if ProcProcessScanner.is_supported(paths.proc_root):
+            try:
+                self._process_scanner = ProcProcessScanner(paths.proc_root)
+            except Exception as e:
+                logger.warning(f"/proc process scanner unavailable, using psutil: {e}")
+        
         logger.info("🖥️ System monitoring initialized")
     
     def _get_platform_info(self) -> Dict[str, str]:
@@ -279,11 +438,10 @@ class SystemMonitor:
             'hostname': platform.node()
         }
     
-    def get_cpu_metrics(self) -> CPUMetrics:
-        """Get comprehensive CPU metrics"""
-        # CPU usage (with short interval for responsiveness)
-        cpu_percent = psutil.cpu_percent(interval=0.1)
-        per_core_usage = psutil.cpu_percent(interval=0.1, percpu=True)
+    def get_cpu_metrics(self, include_temperature: bool = True) -> CPUMetrics:
+        """Get comprehensive CPU metrics (temperature comes from the slower 'sensors' collector)"""
+        # CPU usage since the previous tick (never sleeps)
+        cpu_percent, per_core_usage, per_state_percent = self._sample_cpu_usage()
         
         # CPU frequency
         try:
@@ -295,7 +453,7 @@ class SystemMonitor:
             frequency_max_mhz = None
         
         # CPU temperature (platform-specific)
-        temperature_celsius = self._get_cpu_temperature()
+        temperature_celsius = self._get_cpu_temperature() if include_temperature else None
         
         # Load average (Unix-like systems)
         try:
@@ -315,9 +473,31 @@ class SystemMonitor:
             temperature_celsius=temperature_celsius,
             load_average=load_average,
             core_count=core_count,
-            thread_count=thread_count
+            thread_count=thread_count,
+            per_state_percent=per_state_percent
         )
     
+    def _sample_cpu_usage(self) -> Tuple[float, List[float], Optional[Dict[str, float]]]:
+        """Total, per-core and per-state CPU usage over the same window"""
+        if self._cpu_sampler is not None:
+            try:
+                utilization = self._cpu_sampler.sample()
+                if utilization is not None:
+                    return (utilization.usage_percent, utilization.per_core_usage,
+                            utilization.per_state_percent)
+                return 0.0, [], None
+            except Exception as e:
+                logger.warning(f"/proc/stat CPU sampling failed, falling back to psutil: {e}")
+                self._cpu_sampler = None
+        
+        cpu_percent = psutil.cpu_percent(interval=None)
+        per_core_usage = psutil.cpu_percent(interval=None, percpu=True)
+        try:
+            per_state_percent = psutil.cpu_times_percent(interval=None)._asdict()
+        except Exception:
+            per_state_percent = None
+        return cpu_percent, per_core_usage, per_state_percent
+    
     def _get_cpu_temperature(self) -> Optional[float]:
         """Get CPU temperature (platform-specific)"""
         try:
@@ -365,16 +545,11 @@ class SystemMonitor:
         """Get disk usage and I/O metrics"""
         disk_metrics = []
         
-        # Get disk usage for all mounted partitions
-        partitions = psutil.disk_partitions()
+        # Real filesystems - from the change-driven mount registry when available
+        partitions = self._list_partitions()
         
-        # Get current I/O counters for rate calculation
-        try:
-            current_disk_io = psutil.disk_io_counters(perdisk=True)
-            current_time = time.time()
-        except:
-            current_disk_io = None
-            current_time = None
+        # One IO counter read per tick, rates per device from its own previous sample
+        io_rates = self._sample_disk_io()
         
         for partition in partitions:
             try:
@@ -382,27 +557,13 @@ class SystemMonitor:
                 if partition.fstype in ['devfs', 'proc', 'sysfs', 'tmpfs', 'devtmpfs']:
                     continue
                 
-                usage = psutil.disk_usage(partition.mountpoint)
-                
-                # Calculate I/O rates if we have previous data
-                io_read_bytes_per_sec = None
-                io_write_bytes_per_sec = None
-                io_read_count_per_sec = None
-                io_write_count_per_sec = None
+                if self._mount_registry is not None:
+                    usage = self._mount_registry.capacity(partition)
+                else:
+                    usage = psutil.disk_usage(self.host_paths.host_path(partition.mountpoint))
                 
-                if (current_disk_io and self._last_disk_io and 
-                    partition.device in current_disk_io and 
-                    partition.device in self._last_disk_io):
-                    
-                    time_delta = current_time - self._last_update
-                    if time_delta > 0:
-                        curr_io = current_disk_io[partition.device]
-                        last_io = self._last_disk_io[partition.device]
-                        
-                        io_read_bytes_per_sec = (curr_io.read_bytes - last_io.read_bytes) / time_delta
-                        io_write_bytes_per_sec = (curr_io.write_bytes - last_io.write_bytes) / time_delta
-                        io_read_count_per_sec = (curr_io.read_count - last_io.read_count) / time_delta
-                        io_write_count_per_sec = (curr_io.write_count - last_io.write_count) / time_delta
+                io_read_bytes_per_sec, io_write_bytes_per_sec, io_read_count_per_sec, io_write_count_per_sec = \
+                    io_rates(partition)
                 
                 disk_metrics.append(DiskMetrics(
                     device=partition.device,
@@ -425,17 +586,144 @@ class SystemMonitor:
                 logger.warning(f"Failed to get disk metrics for {partition.device}: {e}")
                 continue
         
-        # Store current I/O data for next calculation
+        return disk_metrics
+    
+    def _sample_disk_io(self):
+        """Sample IO counters once; returns partition -> (read B/s, write B/s, read IOPS, write IOPS)"""
+        no_rates = (None, None, None, None)
+        
+        if self._diskstats is not None:
+            try:
+                self._diskstats.sample()
+                self._block_devices = self._diskstats.active_devices()
+                
+                def diskstats_rates(partition):
+                    device = self._diskstats.device_for(getattr(partition, 'device_id', None), partition.device)
+                    if device is None:
+                        return no_rates
+                    return (device.read_bytes_per_sec, device.write_bytes_per_sec,
+                            device.read_iops, device.write_iops)
+                
+                return diskstats_rates
+            except Exception as e:
+                logger.warning(f"/proc/diskstats sampling failed, falling back to psutil: {e}")
+                self._diskstats = None
+                self._block_devices = []
+        
+        try:
+            current_disk_io = psutil.disk_io_counters(perdisk=True)
+            current_time = time.monotonic()
+        except:
+            current_disk_io = None
+            current_time = None
+        
+        last_disk_io = self._last_disk_io
+        time_delta = current_time - self._last_disk_io_time if current_time and self._last_disk_io_time else 0
         self._last_disk_io = current_disk_io
+        self._last_disk_io_time = current_time
         
-        return disk_metrics
+        def psutil_rates(partition):
+            # perdisk keys are bare kernel names ('sda1'), not /dev paths
+            name = os.path.basename(partition.device)
+            if not (current_disk_io and last_disk_io and time_delta > 0
+                    and name in current_disk_io and name in last_disk_io):
+                return no_rates
+            curr_io = current_disk_io[name]
+            last_io = last_disk_io[name]
+            return ((curr_io.read_bytes - last_io.read_bytes) / time_delta,
+                    (curr_io.write_bytes - last_io.write_bytes) / time_delta,
+                    (curr_io.read_count - last_io.read_count) / time_delta,
+                    (curr_io.write_count - last_io.write_count) / time_delta)
+        
+        return psutil_rates
+    
+    def get_storage_metrics(self) -> Dict[str, list]:
+        """Filesystems and the block devices behind them, from one IO sample"""
+        disks = self.get_disk_metrics()
+        return {'disks': disks, 'block_devices': list(self._block_devices)}
+    
+    def _list_partitions(self) -> list:
+        if self._mount_registry is not None:
+            try:
+                return self._mount_registry.mounts()
+            except Exception as e:
+                logger.warning(f"Mount registry failed, falling back to psutil: {e}")
+                self._mount_registry = None
+        
+        return psutil.disk_partitions()
     
     def get_network_metrics(self) -> NetworkMetrics:
         """Get network interface and usage metrics"""
+        interfaces = None
+        if self._interface_collector is not None:
+            try:
+                interfaces = self._get_interfaces_proc()
+            except Exception as e:
+                logger.warning(f"/proc/net/dev unavailable, falling back to psutil: {e}")
+                self._interface_collector = None
+        if interfaces is None:
+            interfaces = self._get_interfaces_psutil()
+        
+        has_rates = any(interface.bytes_sent_per_sec is not None for interface in interfaces.values())
+        total_bytes_sent_per_sec = sum(interface.bytes_sent_per_sec for interface in interfaces.values()
+                                       if interface.bytes_sent_per_sec is not None)
+        total_bytes_recv_per_sec = sum(interface.bytes_recv_per_sec for interface in interfaces.values()
+                                       if interface.bytes_recv_per_sec is not None)
+        
+        # Get active connections count (kernel counters, not a walk over every socket)
+        connection_stats = None
+        if self._connection_stats is not None:
+            try:
+                connection_stats = self._connection_stats.collect()
+            except Exception as e:
+                logger.warning(f"Socket counters unavailable, falling back to psutil: {e}")
+                self._connection_stats = None
+        
+        if connection_stats is not None:
+            active_connections = connection_stats.total
+        else:
+            try:
+                active_connections = len(psutil.net_connections())
+            except:
+                active_connections = 0
+        
+        return NetworkMetrics(
+            interfaces=interfaces,
+            total_bytes_sent=sum(interface.bytes_sent for interface in interfaces.values()),
+            total_bytes_recv=sum(interface.bytes_recv for interface in interfaces.values()),
+            total_bytes_sent_per_sec=total_bytes_sent_per_sec if has_rates else None,
+            total_bytes_recv_per_sec=total_bytes_recv_per_sec if has_rates else None,
+            active_connections=active_connections,
+            connection_stats=connection_stats
+        )
+    
+    def _get_interfaces_proc(self) -> Dict[str, NetworkInterface]:
+        """Interfaces from the /proc/net/dev collector (loopback skipped)"""
+        interfaces = {}
+        for name, sample in self._interface_collector.collect().items():
+            if name.startswith('lo'):
+                continue
+            interfaces[name] = NetworkInterface(
+                name=name,
+                bytes_sent=sample.bytes_sent,
+                bytes_recv=sample.bytes_recv,
+                packets_sent=sample.packets_sent,
+                packets_recv=sample.packets_recv,
+                bytes_sent_per_sec=sample.bytes_sent_per_sec,
+                bytes_recv_per_sec=sample.bytes_recv_per_sec,
+                is_up=sample.info.is_up,
+                addresses=list(sample.info.addresses),
+                mtu=sample.info.mtu,
+                speed_mbps=sample.info.speed_mbps
+            )
+        return interfaces
+    
+    def _get_interfaces_psutil(self) -> Dict[str, NetworkInterface]:
+        """Interfaces from psutil counters, addresses and stats (non-Linux fallback)"""
         # Get current network I/O counters
         try:
             net_io = psutil.net_io_counters(pernic=True)
-            current_time = time.time()
+            current_time = time.monotonic()
         except:
             net_io = {}
             current_time = None
@@ -453,10 +741,6 @@ class SystemMonitor:
             net_if_stats = {}
         
         interfaces = {}
-        total_bytes_sent = 0
-        total_bytes_recv = 0
-        total_bytes_sent_per_sec = 0
-        total_bytes_recv_per_sec = 0
         
         for interface_name, io_counters in net_io.items():
             # Skip loopback interfaces
@@ -479,16 +763,15 @@ class SystemMonitor:
             bytes_recv_per_sec = None
             
             if (self._last_network_io and interface_name in self._last_network_io and current_time):
-                time_delta = current_time - self._last_update
+                time_delta = current_time - self._last_network_io_time
                 if time_delta > 0:
                     last_io = self._last_network_io[interface_name]
                     bytes_sent_per_sec = (io_counters.bytes_sent - last_io.bytes_sent) / time_delta
                     bytes_recv_per_sec = (io_counters.bytes_recv - last_io.bytes_recv) / time_delta
                     
-                    if bytes_sent_per_sec >= 0:  # Sanity check
-                        total_bytes_sent_per_sec += bytes_sent_per_sec
-                    if bytes_recv_per_sec >= 0:  # Sanity check
-                        total_bytes_recv_per_sec += bytes_recv_per_sec
+                    if bytes_sent_per_sec < 0 or bytes_recv_per_sec < 0:  # Sanity check
+                        bytes_sent_per_sec = None
+                        bytes_recv_per_sec = None
             
             interfaces[interface_name] = NetworkInterface(
                 name=interface_name,
@@ -499,118 +782,381 @@ class SystemMonitor:
                 bytes_sent_per_sec=bytes_sent_per_sec,
                 bytes_recv_per_sec=bytes_recv_per_sec,
                 is_up=is_up,
-                addresses=addresses
+                addresses=addresses,
+                mtu=net_if_stats[interface_name].mtu if interface_name in net_if_stats else None
             )
-            
-            total_bytes_sent += io_counters.bytes_sent
-            total_bytes_recv += io_counters.bytes_recv
         
         # Store current network I/O data for next calculation
         self._last_network_io = net_io
+        self._last_network_io_time = current_time
         
-        # Get active connections count
-        try:
-            active_connections = len(psutil.net_connections())
-        except:
-            active_connections = 0
-        
-        return NetworkMetrics(
-            interfaces=interfaces,
-            total_bytes_sent=total_bytes_sent,
-            total_bytes_recv=total_bytes_recv,
-            total_bytes_sent_per_sec=total_bytes_sent_per_sec if current_time else None,
-            total_bytes_recv_per_sec=total_bytes_recv_per_sec if current_time else None,
-            active_connections=active_connections
-        )
+        return interfaces
+    
+    @property
+    def cgroup_available(self) -> bool:
+        return self._cgroup_collector is not None
+    
+    def get_cgroup_metrics(self) -> List[CgroupStats]:
+        """Container and slice usage from cgroup v2 (empty without a v2 hierarchy)"""
+        if self._cgroup_collector is None:
+            return []
+        return self._cgroup_collector.collect()
     
     def get_top_processes(self, limit: int = 10) -> List[SystemProcess]:
         """Get top resource-consuming processes"""
-        processes = []
+        return self.get_process_rankings(limit)['cpu']
+    
+    def get_process_rankings(self, limit: int = 10) -> Dict[str, list]:
+        """Top processes by CPU, resident memory and disk IO plus the per-container rollup, from a single scan"""
+        if self._process_scanner is not None:
+            try:
+                return self._get_process_rankings_proc(limit)
+            except Exception as e:
+                logger.warning(f"/proc process scan failed, falling back to psutil: {e}")
+                self._process_scanner = None
+        
+        return self._get_process_rankings_psutil(limit)
+    
+    @staticmethod
+    def _new_process_selector(limit: int) -> TopKSelector:
+        """Bounded heaps for each ranking, filled while the process table streams past"""
+        def admit(ranking, sample):
+            if ranking == 'io':
+                return sample.io_bytes_per_sec > 0
+            # Skip kernel threads and very low usage processes
+            return sample.cpu_percent >= 0.1 or sample.memory_percent >= 0.1
+        
+        return TopKSelector(limit, {
+            'cpu': lambda sample: sample.cpu_percent,
+            'memory': lambda sample: sample.memory_rss_bytes,
+            'io': lambda sample: sample.io_bytes_per_sec
+        }, admit=admit)
+    
+    def _rollup_containers(self, samples: List[ProcessSample]) -> List[ContainerUsage]:
+        """Per-container CPU/RSS from this tick's samples (cgroups are parsed once per process)"""
+        index = self.container_index
+        containers: Dict[str, ContainerUsage] = {}
+        rss_bytes: Dict[str, int] = {}
+        
+        for sample in samples:
+            origin = index.origin(sample.pid, sample.identity_key)
+            container_id = origin.container_id
+            if container_id is None:
+                continue
+            usage = containers.get(container_id)
+            if usage is None:
+                usage = containers[container_id] = index.new_usage(origin)
+                rss_bytes[container_id] = 0
+            usage.process_count += 1
+            usage.cpu_percent += sample.cpu_percent
+            rss_bytes[container_id] += sample.memory_rss_bytes
+        
+        index.retain(sample.identity_key for sample in samples)
+        for container_id, usage in containers.items():
+            usage.memory_mb = rss_bytes[container_id] // (1024 * 1024)
+        return sorted(containers.values(), key=lambda usage: usage.cpu_percent, reverse=True)
+    
+    def tag_gpu_processes(self, gpu_metrics):
+        """Attach container/compose/unit attribution to GPU processes (in place)"""
+        index = self.container_index
+        for gpu in gpu_metrics:
+            for process in gpu.processes:
+                for field_name, value in index.tags(index.origin_for_pid(process.pid)).items():
+                    setattr(process, field_name, value)
+    
+    def _enrich_rankings(self, selector: TopKSelector, load_identity) -> Dict[str, List[SystemProcess]]:
+        """Fully enrich only the winners - each process once, even if it wins several rankings"""
+        current_time = time.time()
+        enriched = {}
+        
+        for sample in selector.all_winners():
+            try:
+                identity = self._identity_cache.get_or_load(
+                    sample.identity_key, lambda: load_identity(sample)
+                )
+            except (OSError, psutil.NoSuchProcess, psutil.AccessDenied):
+                # Process exited between the scan and enrichment
+                continue
+            except Exception as e:
+                logger.debug(f"Error processing process {sample.pid}: {e}")
+                continue
+            
+            enriched[id(sample)] = self._build_system_process(
+                identity,
+                cpu_percent=sample.cpu_percent,
+                memory_mb=sample.memory_rss_bytes // (1024 * 1024),
+                memory_percent=sample.memory_percent,
+                status=sample.status,
+                runtime_seconds=current_time - sample.create_time if sample.create_time else None,
+                io_read_bytes_per_sec=sample.io_read_bytes_per_sec,
+                io_write_bytes_per_sec=sample.io_write_bytes_per_sec,
+                **self.container_index.tags(self.container_index.origin(sample.pid, sample.identity_key))
+            )
+        
+        return {
+            ranking: [enriched[id(sample)] for sample in selector.winners(ranking) if id(sample) in enriched]
+            for ranking in selector.rankings
+        }
+    
+    def _get_process_rankings_proc(self, limit: int) -> Dict[str, list]:
+        """Fast path: bulk /proc scan, enrich only the processes we report"""
+        selector = self._new_process_selector(limit)
+        samples = self._process_scanner.scan(selector)
+        self._identity_cache.retain(sample.identity_key for sample in samples)
+        containers = self._rollup_containers(samples)
+        
+        rankings = self._enrich_rankings(selector, self._load_identity_proc)
+        rankings['containers'] = containers
+        return rankings
+    
+    def _load_identity_proc(self, sample) -> ProcessIdentity:
+        """Read and classify the immutable attributes of a scanned process"""
+        scanner = self._process_scanner
+        cmdline = scanner.read_cmdline(sample.pid)
+        name = scanner.full_name(sample.name, cmdline)
+        command_line = ' '.join(cmdline)
+        executable_path = scanner.read_exe(sample.pid)
+        return ProcessIdentity(
+            pid=sample.pid,
+            name=name,
+            command_line=command_line,
+            executable_path=executable_path,
+            username=scanner.read_username(sample.pid),
+            classification=SystemProcessClassifier.classify_process(name, command_line, executable_path)
+        )
+    
+    def _get_process_rankings_psutil(self, limit: int) -> Dict[str, list]:
+        """Portable path using psutil.process_iter"""
+        selector = self._new_process_selector(limit)
+        handles = {}
+        samples = []
+        live_keys = set()
+        last_io = self._last_process_io
+        current_io = {}
+        now = time.monotonic()
         
         try:
-            # Get all processes with resource usage
-            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info', 
-                                           'memory_percent', 'status', 'username', 
-                                           'cmdline', 'exe', 'create_time']):
+            # Only dynamic counters per tick - immutable attributes come from the identity cache
+            for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_info',
+                                           'memory_percent', 'status', 'create_time', 'io_counters']):
                 try:
                     info = proc.info
+                    key = (info['pid'], info['create_time'])
+                    live_keys.add(key)
                     
-                    # Skip kernel threads and very low usage processes
-                    if info['cpu_percent'] < 0.1 and info['memory_percent'] < 0.1:
-                        continue
-                    
-                    # Get additional process information
-                    command_line = ' '.join(info['cmdline']) if info['cmdline'] else ""
-                    executable_path = info['exe'] if info['exe'] else ""
-                    runtime_seconds = time.time() - info['create_time'] if info['create_time'] else None
-                    
-                    # Classify process
-                    classification = SystemProcessClassifier.classify_process(
-                        info['name'], command_line, executable_path
-                    )
+                    io_read_bytes_per_sec = None
+                    io_write_bytes_per_sec = None
+                    io_counters = info['io_counters']
+                    if io_counters is not None:
+                        current_io[key] = (io_counters.read_bytes, io_counters.write_bytes, now)
+                        previous = last_io.get(key)
+                        if previous is not None and now > previous[2]:
+                            io_read_bytes_per_sec = max(io_counters.read_bytes - previous[0], 0) / (now - previous[2])
+                            io_write_bytes_per_sec = max(io_counters.write_bytes - previous[1], 0) / (now - previous[2])
                     
-                    processes.append(SystemProcess(
+                    sample = ProcessSample(
                         pid=info['pid'],
-                        name=info['name'],
-                        cpu_percent=info['cpu_percent'],
-                        memory_mb=info['memory_info'].rss // (1024 * 1024) if info['memory_info'] else 0,
-                        memory_percent=info['memory_percent'],
+                        name=info['name'] or "",
                         status=info['status'],
-                        username=info['username'],
-                        command_line=command_line,
-                        executable_path=executable_path,
-                        runtime_seconds=runtime_seconds,
-                        process_type=classification['process_type'],
-                        is_system_intensive=classification.get('is_system_intensive', False)
-                    ))
+                        cpu_percent=info['cpu_percent'] or 0.0,
+                        memory_rss_bytes=info['memory_info'].rss if info['memory_info'] else 0,
+                        memory_percent=info['memory_percent'] or 0.0,
+                        start_ticks=None,
+                        create_time=info['create_time'],
+                        io_read_bytes_per_sec=io_read_bytes_per_sec,
+                        io_write_bytes_per_sec=io_write_bytes_per_sec
+                    )
+                    handles[sample.pid] = proc
+                    samples.append(sample)
+                    selector.offer(sample)
                     
-                except (psutil.NoSuchProcess, psutil.AccessDenied):
-                    continue
                 except Exception as e:
                     logger.debug(f"Error processing process {proc.pid}: {e}")
                     continue
             
-            # Sort by CPU usage (descending) and limit results
-            processes.sort(key=lambda p: p.cpu_percent, reverse=True)
-            return processes[:limit]
+            self._last_process_io = current_io
+            self._identity_cache.retain(live_keys)
+            containers = self._rollup_containers(samples)
+            
+            rankings = self._enrich_rankings(
+                selector, lambda sample: self._load_identity_psutil(handles[sample.pid], sample)
+            )
+            rankings['containers'] = containers
+            return rankings
             
         except Exception as e:
             logger.error(f"Failed to get top processes: {e}")
-            return []
+            return {ranking: [] for ranking in selector.rankings}
+    
+    @staticmethod
+    def _load_identity_psutil(proc, sample) -> ProcessIdentity:
+        """Read and classify the immutable attributes of a psutil process"""
+        with proc.oneshot():
+            cmdline = proc.cmdline()
+            command_line = ' '.join(cmdline) if cmdline else ""
+            try:
+                executable_path = proc.exe() or ""
+            except psutil.AccessDenied:
+                executable_path = ""
+            try:
+                username = proc.username()
+            except psutil.AccessDenied:
+                username = None
+        
+        return ProcessIdentity(
+            pid=sample.pid,
+            name=sample.name,
+            command_line=command_line,
+            executable_path=executable_path,
+            username=username,
+            classification=SystemProcessClassifier.classify_process(sample.name, command_line, executable_path)
+        )
+    
+    @staticmethod
+    def _build_system_process(identity: ProcessIdentity, **counters) -> SystemProcess:
+        """Combine cached identity with this tick's counters"""
+        classification = identity.classification
+        return SystemProcess(
+            pid=identity.pid,
+            name=identity.name,
+            username=identity.username,
+            command_line=identity.command_line,
+            executable_path=identity.executable_path,
+            process_type=classification['process_type'],
+            is_system_intensive=classification.get('is_system_intensive', False),
+            **counters
+        )
     
     def get_system_metrics(self, force_update: bool = False) -> SystemMetrics:
         """Get complete system metrics with caching"""
+        if not force_update and not self._is_cache_expired():
+            return self._cached_metrics
+        
+        generation = self._refresh_generation
+        with self._refresh_lock:
+            # Another caller refreshed while we were waiting - reuse its result
+            if self._refresh_generation != generation and self._cached_metrics is not None:
+                return self._cached_metrics
+            if not force_update and not self._is_cache_expired():
+                return self._cached_metrics
+            
+            self._refresh_metrics()
+            self._refresh_generation += 1
+        
+        return self._cached_metrics
+    
+    def refresh_collectors(self, names: Iterable[str]) -> SystemMetrics:
+        """Re-run only the named collectors and rebuild SystemMetrics around them"""
+        with self._refresh_lock:
+            self._refresh_metrics(names)
+            self._refresh_generation += 1
+        
+        return self._cached_metrics
+    
+    def get_collector_value(self, name: str) -> Any:
+        """Latest raw value of one collector (None before it has run)"""
+        return self._collector_values.get(name)
+    
+    def _is_cache_expired(self) -> bool:
+        return self._cached_metrics is None or (time.time() - self._last_update) >= self.update_interval
+    
+    def _refresh_metrics(self, names: Iterable[str] = None):
+        """Run the named collectors (default: all) - callers must hold ``_refresh_lock``"""
         current_time = time.time()
+        self.collection_count += 1
+        
+        # Collectors that have never run are always included so the metrics are complete
+        requested = set(self.COLLECTORS if names is None else names)
+        requested.update(name for name in self.COLLECTORS if name not in self._collector_values)
+        
+        self._run_collectors([name for name in self.COLLECTORS if name in requested])
+        
+        try:
+            self._cached_metrics = self._compose_metrics()
+            self._last_update = current_time
+            
+            # Log interesting system status
+            self._log_system_status(self._cached_metrics)
+            
+        except Exception as e:
+            logger.error(f"Failed to update system metrics: {e}")
+            if self._cached_metrics is None:
+                # Return minimal metrics if we have nothing
+                self._cached_metrics = self._get_fallback_metrics()
+    
+    def _run_collectors(self, names: List[str]):
+        """Run collectors on the worker pool, waiting for each only until its deadline"""
+        started = time.monotonic()
+        pending = {}
+        
+        for name in names:
+            future = self._in_flight.get(name)
+            if future is None:
+                future = self._collector_pool.submit(self._collector_functions[name])
+                self._in_flight[name] = future
+                future.add_done_callback(partial(self._collector_done, name))
+            # Otherwise it is still stuck from an earlier tick - keep waiting on that run
+            pending[name] = future
         
-        if force_update or (current_time - self._last_update) >= self.update_interval:
+        for name, future in pending.items():
+            stats = self._collector_stats[name]
+            timeout = self.COLLECTOR_TIMEOUTS.get(name, 1.0)
             try:
-                cpu_metrics = self.get_cpu_metrics()
-                memory_metrics = self.get_memory_metrics()
-                disk_metrics = self.get_disk_metrics()
-                network_metrics = self.get_network_metrics()
-                top_processes = self.get_top_processes()
-                
-                self._cached_metrics = SystemMetrics(
-                    cpu=cpu_metrics,
-                    memory=memory_metrics,
-                    disks=disk_metrics,
-                    network=network_metrics,
-                    top_processes=top_processes,
-                    platform_info=self._platform_info
-                )
-                
-                self._last_update = current_time
-                
-                # Log interesting system status
-                self._log_system_status(self._cached_metrics)
-                
+                future.result(timeout=max(started + timeout - time.monotonic(), 0))
+            except FutureTimeoutError:
+                stats['timeouts'] += 1
+                logger.warning(f"⏳ {name} collector missed its {timeout}s deadline - using last good value")
             except Exception as e:
-                logger.error(f"Failed to update system metrics: {e}")
-                if self._cached_metrics is None:
-                    # Return minimal metrics if we have nothing
-                    self._cached_metrics = self._get_fallback_metrics()
+                stats['errors'] += 1
+                logger.error(f"Failed to collect {name} metrics: {e}")
+            else:
+                self._stale_collectors.discard(name)
+                continue
+            
+            self._stale_collectors.add(name)
+            stats['stale'] += 1
+    
+    def _collector_done(self, name: str, future: Future):
+        """Keep a collector's value whenever it finishes - even after its deadline"""
+        if self._in_flight.get(name) is future:
+            del self._in_flight[name]
+        if not future.cancelled() and future.exception() is None:
+            self._collector_values[name] = future.result()
+            self._collector_stats[name]['runs'] += 1
+    
+    def get_collector_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Run, timeout, error and stale counters for each collector"""
+        return {
+            name: dict(
+                stats,
+                is_stale=name in self._stale_collectors,
+                in_flight=name in self._in_flight,
+                timeout_seconds=self.COLLECTOR_TIMEOUTS.get(name, 1.0)
+            )
+            for name, stats in self._collector_stats.items()
+        }
+    
+    def _compose_metrics(self) -> SystemMetrics:
+        """SystemMetrics from the latest value of every collector"""
+        values = self._collector_values
+        fallback = self._get_fallback_metrics()
+        process_rankings = values.get('processes') or {}
+        storage = values.get('disk') or {}
         
-        return self._cached_metrics
+        return SystemMetrics(
+            cpu=replace(values.get('cpu', fallback.cpu), temperature_celsius=values.get('sensors')),
+            memory=values.get('memory', fallback.memory),
+            disks=storage.get('disks', fallback.disks),
+            network=values.get('network', fallback.network),
+            top_processes=process_rankings.get('cpu', []),
+            top_processes_by_memory=process_rankings.get('memory', []),
+            top_processes_by_io=process_rankings.get('io', []),
+            containers=process_rankings.get('containers', []),
+            cgroups=values.get('containers', []),
+            platform_info=self._platform_info,
+            block_devices=storage.get('block_devices', []),
+            stale_collectors=sorted(self._stale_collectors)
+        )
     
     def _get_fallback_metrics(self) -> SystemMetrics:
         """Get minimal fallback metrics when monitoring fails"""
@@ -638,9 +1184,10 @@ class SystemMonitor:
             for proc in intensive_processes[:3]:  # Log top 3
                 logger.info(f"  └── {proc.name} (PID {proc.pid}): {proc.cpu_percent:.1f}% CPU, {proc.memory_percent:.1f}% memory")
     
-    def get_summary(self) -> Dict:
-        """Get system summary for dashboard"""
-        metrics = self.get_system_metrics()
+    def get_summary(self, metrics: Optional[SystemMetrics] = None) -> Dict:
+        """Get system summary for dashboard (from ``metrics`` when given, e.g. a sampler snapshot)"""
+        if metrics is None:
+            metrics = self.get_system_metrics()
         
         # Identify why the system might be under load
         load_explanation = []
@@ -713,7 +1260,8 @@ class SystemMonitor:
                 "total_monitored": len(metrics.top_processes),
                 "intensive_count": len(intensive_processes)
             },
-            "platform": metrics.platform_info['system']
+            "platform": metrics.platform_info['system'],
+            "stale_collectors": metrics.stale_collectors
         }
 
 
@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - AMD sysfs Monitor Test Script
+AMDMonitor against a fixture /sys/class/drm tree
+"""
+
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+from monitoring.gpu_monitor import AMDMonitor, GPUVendor
+
+GB = 1024 * 1024 * 1024
+
+
+def write_files(directory, files):
+    os.makedirs(directory, exist_ok=True)
+    for name, content in files.items():
+        with open(os.path.join(directory, name), 'w') as f:
+            f.write(f"{content}\n")
+
+
+def add_card(sys_root, card, pci_slot, vendor, files, hwmon=None):
+    device_dir = os.path.join(sys_root, 'devices', 'pci0000:00', pci_slot)
+    write_files(device_dir, dict(files, vendor=vendor))
+    if hwmon is not None:
+        write_files(os.path.join(device_dir, 'hwmon', 'hwmon3'), hwmon)
+    card_dir = os.path.join(sys_root, 'class', 'drm', card)
+    os.makedirs(card_dir)
+    os.symlink(device_dir, os.path.join(card_dir, 'device'))
+    return device_dir
+
+
+def make_sys_root():
+    sys_root = tempfile.mkdtemp(prefix='hoof-hearted-sys-')
+    radeon = add_card(sys_root, 'card1', '0000:03:00.0', '0x1002', {
+        'uevent': "DRIVER=amdgpu\nPCI_ID=1002:744C",
+        'gpu_busy_percent': 97,
+        'mem_busy_percent': 41,
+        'mem_info_vram_used': 12 * GB,
+        'mem_info_vram_total': 24 * GB,
+    }, hwmon={
+        'temp1_input': 68000, 'temp1_label': 'edge',
+        'temp2_input': 85000, 'temp2_label': 'junction',
+        'temp3_input': 80000, 'temp3_label': 'mem',
+        'fan1_input': 1850,
+        'pwm1': 153, 'pwm1_max': 255,
+        'power1_average': 287000000,
+        'power1_cap': 355000000,
+    })
+    # Integrated Intel GPU and a connector entry - neither is an AMD card
+    add_card(sys_root, 'card0', '0000:00:02.0', '0x8086', {'gpu_busy_percent': 0})
+    os.makedirs(os.path.join(sys_root, 'class', 'drm', 'card1-DP-1'))
+    write_files(os.path.join(sys_root, 'module', 'amdgpu'), {})
+    return sys_root, radeon
+
+
+def test_reads_amd_cards_from_sysfs():
+    sys_root, _ = make_sys_root()
+    monitor = AMDMonitor(sys_root=sys_root)
+    assert monitor.is_available() and monitor.get_gpu_count() == 1
+
+    gpu = monitor.get_gpu_metrics()[0]
+    assert (gpu.gpu_id, gpu.vendor, gpu.name) == (0, GPUVendor.AMD, "AMD GPU [1002:744c]")
+    assert (gpu.utilization_percent, gpu.memory_used_mb, gpu.memory_total_mb, gpu.memory_percent) == (97.0, 12288, 24576, 50.0)
+    assert (gpu.temperature_c, gpu.memory_temperature_c) == (68, 80)
+    assert (gpu.fan_speed_percent, gpu.fan_speed_rpm) == (60, 1850)
+    assert (gpu.power_draw_watts, gpu.power_limit_watts) == (287.0, 355.0)
+    assert gpu.driver_version.startswith('amdgpu ')
+
+
+def test_values_are_re_read_through_open_fds():
+    sys_root, radeon = make_sys_root()
+    monitor = AMDMonitor(sys_root=sys_root)
+    monitor.get_gpu_metrics()
+    fds = dict(monitor._reader.devices[0]._fds)
+
+    write_files(radeon, {'gpu_busy_percent': 3})
+    write_files(os.path.join(radeon, 'hwmon', 'hwmon3'), {'power1_average': 31000000})
+    gpu = monitor.get_gpu_metrics()[0]
+    assert (gpu.utilization_percent, gpu.power_draw_watts) == (3.0, 31.0)
+    assert monitor._reader.devices[0]._fds == fds
+    assert monitor._reader.discovery_count == 1
+
+
+def test_no_amd_gpu():
+    sys_root = tempfile.mkdtemp(prefix='hoof-hearted-sys-')
+    add_card(sys_root, 'card0', '0000:00:02.0', '0x8086', {'gpu_busy_percent': 0})
+    monitor = AMDMonitor(sys_root=sys_root)
+    assert not monitor.is_available()
+    assert monitor.get_gpu_metrics() == []
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - AMD sysfs Monitor Tests")
+    test_reads_amd_cards_from_sysfs()
+    test_values_are_re_read_through_open_fds()
+    test_no_amd_gpu()
+    print("✅ AMD sysfs monitor tests passed")
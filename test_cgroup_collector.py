@@ -0,0 +1,111 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Cgroup Collector Test Script
+Container and slice usage from a cgroup v2 fixture tree
+"""
+
+import os
+import shutil
+import sys
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+from monitoring.cgroup_collector import CgroupCollector
+
+WEB_ID = 'c' * 64
+POD_ID = 'd' * 64
+WEB = f"system.slice/docker-{WEB_ID}.scope"
+POD = f"kubepods.slice/kubepods-burstable.slice/kubepods-burstable-pod1.slice/cri-containerd-{POD_ID}.scope"
+
+
+def write_cgroup(root, path, usage_usec, rbytes=0, wbytes=0, memory=0, memory_max='max', throttled_usec=0):
+    directory = os.path.join(root, path)
+    os.makedirs(directory, exist_ok=True)
+    files = {
+        'cpu.stat': f"usage_usec {usage_usec}\nuser_usec {usage_usec}\nsystem_usec 0\n"
+                    f"nr_periods 0\nnr_throttled 0\nthrottled_usec {throttled_usec}\n",
+        'memory.current': f"{memory}\n",
+        'memory.max': f"{memory_max}\n",
+        'memory.stat': f"anon {memory // 2}\nfile {memory // 2}\nkernel 0\n",
+        'io.stat': f"8:0 rbytes={rbytes} wbytes={wbytes} rios=1 wios=1 dbytes=0 dios=0\n",
+        'memory.pressure': "some avg10=12.50 avg60=3.00 avg300=1.00 total=100\n"
+                           "full avg10=4.25 avg60=1.00 avg300=0.50 total=50\n",
+    }
+    for name, content in files.items():
+        with open(os.path.join(directory, name), 'w') as f:
+            f.write(content)
+
+
+def make_sys_root():
+    sys_root = tempfile.mkdtemp(prefix='hoof-hearted-sys-')
+    root = os.path.join(sys_root, 'fs', 'cgroup')
+    os.makedirs(root)
+    with open(os.path.join(root, 'cgroup.controllers'), 'w') as f:
+        f.write("cpuset cpu io memory pids\n")
+    write_cgroup(root, 'system.slice', 0)
+    write_cgroup(root, 'system.slice/sshd.service', 0)
+    write_cgroup(root, WEB, 0, memory=512 * 1024 * 1024, memory_max=str(1024 * 1024 * 1024))
+    write_cgroup(root, f"{WEB}/init.scope", 0)  # Nested cgroup inside the container
+    write_cgroup(root, 'user.slice', 0)
+    write_cgroup(root, 'kubepods.slice', 0)
+    write_cgroup(root, POD, 0)
+    return sys_root, root
+
+
+def test_discovers_containers_and_top_level_slices():
+    sys_root, _ = make_sys_root()
+    collector = CgroupCollector(sys_root)
+    stats = {cgroup.path: cgroup for cgroup in collector.collect()}
+
+    assert set(stats) == {'system.slice', 'user.slice', 'kubepods.slice', WEB, POD}
+    web = stats[WEB]
+    assert (web.kind, web.container_id, web.name) == ('container', WEB_ID, WEB_ID[:12])
+    assert web.memory_max_bytes == 1024 * 1024 * 1024
+    assert web.memory_anon_bytes == 256 * 1024 * 1024
+    assert (web.memory_pressure_some, web.memory_pressure_full) == (12.5, 4.25)
+    assert web.cpu_pressure_some is None  # No cpu.pressure file
+    assert stats['user.slice'].memory_max_bytes is None
+    assert web.cpu_percent is None  # No baseline yet
+
+
+def test_rates_from_counter_deltas():
+    sys_root, root = make_sys_root()
+    collector = CgroupCollector(sys_root)
+    collector.collect()
+
+    # One second later: 1.5 CPUs busy, 0.25s throttled, 10 MB read, 2 MB written
+    for path, counters in list(collector._last_counters.items()):
+        collector._last_counters[path] = counters[:4] + (counters[4] - 1.0,)
+    write_cgroup(root, WEB, 1_500_000, rbytes=10_000_000, wbytes=2_000_000, throttled_usec=250_000)
+    web = next(cgroup for cgroup in collector.collect() if cgroup.path == WEB)
+
+    assert abs(web.cpu_percent - 150.0) < 1.0
+    assert abs(web.cpu_throttled_percent - 25.0) < 0.5
+    assert abs(web.io_read_bytes_per_sec - 10_000_000) < 100_000
+    assert abs(web.io_write_bytes_per_sec - 2_000_000) < 20_000
+
+    # Container restarted - counters went backwards, so no bogus negative rate
+    write_cgroup(root, WEB, 10)
+    web = next(cgroup for cgroup in collector.collect() if cgroup.path == WEB)
+    assert web.cpu_percent is None
+
+
+def test_discovery_is_cached_until_a_cgroup_disappears():
+    sys_root, root = make_sys_root()
+    collector = CgroupCollector(sys_root, discovery_interval=3600)
+    for _ in range(5):
+        collector.collect()
+    assert collector.discovery_count == 1
+
+    shutil.rmtree(os.path.join(root, POD))
+    assert POD not in {cgroup.path for cgroup in collector.collect()}
+    collector.collect()
+    assert collector.discovery_count == 2
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - Cgroup Collector Tests")
+    test_discovers_containers_and_top_level_slices()
+    test_rates_from_counter_deltas()
+    test_discovery_is_cached_until_a_cgroup_disappears()
+    print("✅ Cgroup collector tests passed")
@@ -0,0 +1,76 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Collector Isolation Test Script
+A hung collector misses its deadline, goes stale and never blocks the tick
+"""
+
+import os
+import sys
+import threading
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+from monitoring.system_monitor import SystemMonitor, CPUMetrics, MemoryMetrics, NetworkMetrics, DiskMetrics
+
+
+class HangingDiskMonitor(SystemMonitor):
+    """SystemMonitor whose disk collector hangs like a dead NFS mount until released"""
+
+    COLLECTOR_TIMEOUTS = dict(SystemMonitor.COLLECTOR_TIMEOUTS, disk=0.2)
+
+    def __init__(self):
+        super().__init__(update_interval=60.0)
+        self.release = threading.Event()
+        self.release.set()
+        self.disk_calls = 0
+
+    def get_cpu_metrics(self, include_temperature: bool = True):
+        return CPUMetrics(10.0, [10.0], None, None, None, None, 1, 1)
+
+    def get_memory_metrics(self):
+        return MemoryMetrics(1024, 512, 512, 50.0, 512, 0, 0, 0.0, 0)
+
+    def get_disk_metrics(self):
+        self.disk_calls += 1
+        self.release.wait()
+        return [DiskMetrics('/dev/nfs', '/mnt/nfs', 'nfs', 100, 50, 50, 50.0)]
+
+    def get_network_metrics(self):
+        return NetworkMetrics({}, 0, 0, 0)
+
+    def get_process_rankings(self, limit: int = 10):
+        return {'cpu': [], 'memory': [], 'io': []}
+
+
+def test_hung_collector_goes_stale_without_blocking():
+    monitor = HangingDiskMonitor()
+    metrics = monitor.get_system_metrics(force_update=True)
+    assert metrics.stale_collectors == []
+    assert metrics.disks[0].mountpoint == '/mnt/nfs'
+
+    # The mount hangs: the tick finishes at the disk deadline with the last good value
+    monitor.release.clear()
+    started = time.monotonic()
+    metrics = monitor.refresh_collectors(['cpu', 'disk'])
+    assert time.monotonic() - started < 1.0
+    assert metrics.stale_collectors == ['disk']
+    assert metrics.disks[0].mountpoint == '/mnt/nfs'
+
+    # Still hung: no second call piles up behind the first
+    metrics = monitor.refresh_collectors(['disk'])
+    assert monitor.disk_calls == 2
+    stats = monitor.get_collector_stats()['disk']
+    assert stats['timeouts'] == 2 and stats['stale'] == 2 and stats['in_flight']
+
+    # Mount recovers - the next tick is fresh again
+    monitor.release.set()
+    time.sleep(0.05)
+    metrics = monitor.refresh_collectors(['disk'])
+    assert metrics.stale_collectors == []
+    assert not monitor.get_collector_stats()['disk']['is_stale']
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - Collector Isolation Tests")
+    test_hung_collector_goes_stale_without_blocking()
+    print("✅ Collector isolation tests passed")
@@ -0,0 +1,90 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Collector Scheduler Test Script
+Per-collector cadences, signal-driven escalation and drift-free deadlines
+"""
+
+import os
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+from monitoring.collector_scheduler import CollectorScheduler, ScheduledCollector
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def __call__(self):
+        return self.now
+
+
+def run_for(scheduler, clock, seconds, step=0.25, value_for=lambda name: None):
+    """Advance the fake clock, completing whatever is due, and count runs"""
+    runs = {name: 0 for name in scheduler.names}
+    end = clock.now + seconds
+    while clock.now < end:
+        for name in scheduler.due():
+            runs[name] += 1
+            scheduler.complete(name, value_for(name))
+        clock.now += step
+    return runs
+
+
+def test_each_collector_keeps_its_own_cadence():
+    clock = FakeClock()
+    scheduler = CollectorScheduler([
+        ScheduledCollector('cpu', 'important'),
+        ScheduledCollector('memory', 'standard'),
+        ScheduledCollector('network', 'background'),
+    ], clock=clock)
+
+    runs = run_for(scheduler, clock, 60)
+
+    assert runs == {'cpu': 30, 'memory': 12, 'network': 6}
+
+
+def test_escalation_follows_only_the_collectors_own_signal():
+    clock = FakeClock()
+    hot = {'value': True}
+    scheduler = CollectorScheduler([
+        ScheduledCollector('sensors', 'standard', lambda value: 'critical' if value else None),
+        ScheduledCollector('disk', 'background', lambda value: 'standard' if value else None),
+    ], clock=clock)
+
+    runs = run_for(scheduler, clock, 20, value_for=lambda name: hot['value'] if name == 'sensors' else False)
+    assert scheduler.tier('sensors') == 'critical'
+    assert scheduler.tier('disk') == 'background'
+    assert runs['sensors'] == 20
+
+    # Signal clears - back to the base tier
+    hot['value'] = False
+    run_for(scheduler, clock, 10, value_for=lambda name: hot['value'])
+    assert scheduler.tier('sensors') == 'standard'
+
+
+def test_deadlines_do_not_drift_on_slow_ticks():
+    clock = FakeClock()
+    scheduler = CollectorScheduler([ScheduledCollector('cpu', 'important')], clock=clock)
+    start = clock.now
+
+    # Every collection finishes 0.3s late - the schedule stays on the 2s grid
+    for expected in range(1, 6):
+        clock.now += 0.3
+        scheduler.complete('cpu')
+        assert scheduler.seconds_until_next() == start + expected * 2 - clock.now
+        clock.now = start + expected * 2
+
+    # A long stall skips missed slots instead of bursting to catch up
+    clock.now += 7.1
+    scheduler.complete('cpu')
+    assert scheduler.due() == []
+    assert 0 < scheduler.seconds_until_next() <= 2
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - Collector Scheduler Tests")
+    test_each_collector_keeps_its_own_cadence()
+    test_escalation_follows_only_the_collectors_own_signal()
+    test_deadlines_do_not_drift_on_slow_ticks()
+    print("✅ Collector scheduler tests passed")
@@ -0,0 +1,74 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Connection Statistics Test Script
+Socket counts from sockstat/snmp fixtures and the streaming TCP state pass
+"""
+
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+from monitoring.connection_stats import ConnectionStatsCollector
+
+SOCKSTAT = """sockets: used 412
+TCP: inuse 37 orphan 1 tw 12 alloc 40 mem 3
+UDP: inuse 5 mem 1
+UDPLITE: inuse 0
+RAW: inuse 0
+FRAG: inuse 0 memory 0
+"""
+
+SOCKSTAT6 = """TCP6: inuse 8
+UDP6: inuse 2
+UDPLITE6: inuse 0
+RAW6: inuse 0
+FRAG6: inuse 0 memory 0
+"""
+
+SNMP = """Tcp: RtoAlgorithm RtoMin RtoMax MaxConn ActiveOpens PassiveOpens AttemptFails EstabResets CurrEstab InSegs OutSegs RetransSegs InErrs OutRsts InCsumErrors
+Tcp: 1 200 120000 -1 1500 900 3 8 29 60000 59000 42 0 7 0
+"""
+
+TCP = """  sl  local_address rem_address   st tx_queue rx_queue tr tm->when retrnsmt   uid  timeout inode
+   0: 00000000:1F90 00000000:0000 0A 00000000:00000000 00:00000000 00000000     0        0 1 1 0 100 0 0 10 0
+   1: 0100007F:1F90 0100007F:A1B2 01 00000000:00000000 00:00000000 00000000     0        0 2 1 0 20 4 30 10 -1
+   2: 0100007F:A1B2 0100007F:1F90 01 00000000:00000000 00:00000000 00000000     0        0 3 1 0 20 4 30 10 -1
+   3: 0100007F:A1B3 0100007F:1F90 06 00000000:00000000 03:00001234 00000000     0        0 0 3 0
+"""
+
+
+def make_net_root():
+    root = tempfile.mkdtemp(prefix='hoof-hearted-net-')
+    for name, content in (('sockstat', SOCKSTAT), ('sockstat6', SOCKSTAT6), ('snmp', SNMP), ('tcp', TCP)):
+        with open(os.path.join(root, name), 'w') as f:
+            f.write(content)
+    return root
+
+
+def test_counts_from_kernel_counters():
+    stats = ConnectionStatsCollector(make_net_root()).collect()
+
+    assert stats.tcp_in_use == 45
+    assert stats.udp_in_use == 7
+    assert stats.tcp_time_wait == 12
+    assert stats.tcp_established == 29
+    assert stats.tcp_retransmitted_segments == 42
+    assert stats.total == 45 + 12 + 7
+    assert stats.tcp_states is None  # Per-state pass is opt-in
+
+
+def test_streaming_tcp_state_counts():
+    stats = ConnectionStatsCollector(make_net_root(), collect_tcp_states=True).collect()
+    assert stats.tcp_states == {'LISTEN': 1, 'ESTABLISHED': 2, 'TIME_WAIT': 1}
+
+    # Skipped when the host has more sockets than the scan budget allows
+    busy = ConnectionStatsCollector(make_net_root(), collect_tcp_states=True, max_state_scan_sockets=10)
+    assert busy.collect().tcp_states is None
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - Connection Statistics Tests")
+    test_counts_from_kernel_counters()
+    test_streaming_tcp_state_counts()
+    print("✅ Connection statistics tests passed")
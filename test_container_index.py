@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Container Attribution Test Script
+cgroup parsing, the incremental pid index and docker.sock name resolution
+"""
+
+import json
+import os
+import socketserver
+import sys
+import tempfile
+import threading
+from http.server import BaseHTTPRequestHandler
+from types import SimpleNamespace
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+from monitoring.container_index import (
+    ContainerIndex, DockerResolver, merge_gpu_usage, origin_from_cgroup, parse_cgroup
+)
+
+WEB_ID = 'a' * 64
+DB_ID = 'b' * 64
+
+
+def make_proc_root(cgroups):
+    root = tempfile.mkdtemp(prefix='hoof-hearted-proc-')
+    for pid, content in cgroups.items():
+        os.makedirs(os.path.join(root, str(pid)))
+        with open(os.path.join(root, str(pid), 'cgroup'), 'w') as f:
+            f.write(content)
+    return root
+
+
+class FakeDockerHandler(BaseHTTPRequestHandler):
+    requests = []
+
+    def do_GET(self):
+        FakeDockerHandler.requests.append(self.path)
+        body = json.dumps([{
+            'Id': WEB_ID,
+            'Names': ['/shop-web-1'],
+            'Image': 'shop/web:latest',
+            'Labels': {'com.docker.compose.project': 'shop', 'com.docker.compose.service': 'web'}
+        }]).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/json')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+
+class FakeDockerServer(socketserver.ThreadingMixIn, socketserver.UnixStreamServer):
+    daemon_threads = True
+
+    def get_request(self):
+        request, _ = super().get_request()
+        return request, ('docker', 0)
+
+
+def test_cgroup_paths():
+    assert parse_cgroup(b"0::/system.slice/nginx.service\n") == "/system.slice/nginx.service"
+    assert parse_cgroup(b"12:cpu,cpuacct:/docker/x\n1:name=systemd:/docker/x\n") == "/docker/x"
+
+    docker = origin_from_cgroup(f"/system.slice/docker-{WEB_ID}.scope")
+    assert (docker.container_id, docker.runtime) == (WEB_ID, 'docker')
+    # cgroup namespaces show host processes relative to our own cgroup
+    assert origin_from_cgroup(f"/../../docker/{WEB_ID}").container_id == WEB_ID
+    assert origin_from_cgroup(f"/kubepods.slice/cri-containerd-{DB_ID}.scope").runtime == 'containerd'
+
+    unit = origin_from_cgroup("/system.slice/plexmediaserver.service")
+    assert unit.container_id is None
+    assert unit.systemd_unit == 'plexmediaserver.service'
+
+
+def test_index_parses_each_process_once():
+    root = make_proc_root({
+        10: f"0::/system.slice/docker-{WEB_ID}.scope\n",
+        11: f"0::/system.slice/docker-{DB_ID}.scope\n",
+        12: "0::/system.slice/sshd.service\n",
+    })
+    index = ContainerIndex(root)
+
+    for _ in range(5):
+        origins = [index.origin(pid, (pid, 100)) for pid in (10, 11, 12)]
+        index.retain((pid, 100) for pid in (10, 11, 12))
+    assert index.parse_count == 3
+    assert [origin.container_id for origin in origins] == [WEB_ID, DB_ID, None]
+    assert index.origin_for_pid(12).systemd_unit == 'sshd.service'
+
+    # pid 10 restarted with a new start time - parsed again, old entry evicted
+    index.origin(10, (10, 200))
+    index.retain([(10, 200), (11, 100), (12, 100)])
+    assert index.parse_count == 4
+    assert index.get_stats()['tracked_processes'] == 3
+
+
+def test_docker_names_and_gpu_rollup():
+    socket_path = os.path.join(tempfile.mkdtemp(prefix='hoof-hearted-docker-'), 'docker.sock')
+    server = FakeDockerServer(socket_path, FakeDockerHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    try:
+        root = make_proc_root({20: f"0::/system.slice/docker-{WEB_ID}.scope\n"})
+        resolver = DockerResolver(socket_path, ttl=60, min_refresh_interval=60)
+        index = ContainerIndex(root, resolver)
+
+        tags = index.tags(index.origin(20, (20, 1)))
+        assert tags['container_name'] == 'shop-web-1'
+        assert tags['compose_project'] == 'shop'
+
+        # Unknown ids don't hammer the socket - one list call per refresh window
+        assert resolver.resolve(DB_ID) is None
+        assert len(FakeDockerHandler.requests) == 1
+
+        web = index.new_usage(index.origin_for_pid(20))
+        web.cpu_percent, web.memory_mb, web.process_count = 150.0, 2048, 3
+        gpu_process = SimpleNamespace(pid=20, gpu_memory_mb=6000, **tags)
+        merged = merge_gpu_usage([web], [SimpleNamespace(processes=[gpu_process])])
+        assert [(usage.name, usage.gpu_memory_mb, usage.cpu_percent) for usage in merged] == [('shop-web-1', 6000, 150.0)]
+        assert web.gpu_memory_mb == 0  # The scan's rollup is never mutated
+    finally:
+        server.shutdown()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - Container Attribution Tests")
+    test_cgroup_paths()
+    test_index_parses_each_process_once()
+    test_docker_names_and_gpu_rollup()
+    print("✅ Container attribution tests passed")
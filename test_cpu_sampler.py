@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - /proc/stat CPU Sampler Test Script
+Total, per-core and per-state utilisation from two fixture snapshots
+"""
+
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+from monitoring.cpu_sampler import ProcStatCPUSampler
+
+#       user nice system idle iowait irq softirq steal
+FIRST = """cpu  1000 0 500 8000 500 0 0 0 0 0
+cpu0 500 0 250 4000 250 0 0 0 0 0
+cpu1 500 0 250 4000 250 0 0 0 0 0
+intr 123456 0 0
+ctxt 987654
+btime 1700000000
+"""
+
+# cpu0: +250 user +50 system +200 idle -> 60% busy
+# cpu1: +50 user +50 system +300 idle +100 iowait -> 20% busy
+SECOND = """cpu  1300 0 600 8500 600 0 0 0 0 0
+cpu0 750 0 300 4200 250 0 0 0 0 0
+cpu1 550 0 300 4300 350 0 0 0 0 0
+intr 123999 0 0
+ctxt 987999
+btime 1700000000
+"""
+
+
+def make_sampler(content):
+    proc_root = tempfile.mkdtemp(prefix='hoof-hearted-proc-')
+    write_stat(proc_root, content)
+    return proc_root, ProcStatCPUSampler(proc_root)
+
+
+def write_stat(proc_root, content):
+    with open(os.path.join(proc_root, 'stat'), 'w') as f:
+        f.write(content)
+
+
+def test_total_per_core_and_per_state():
+    proc_root, sampler = make_sampler(FIRST)
+    write_stat(proc_root, SECOND)
+    result = sampler.sample()
+
+    assert result.usage_percent == 40.0
+    assert result.per_core_usage == [60.0, 20.0]
+    assert result.per_state_percent == {'user': 30.0, 'nice': 0.0, 'system': 10.0, 'idle': 50.0,
+                                        'iowait': 10.0, 'irq': 0.0, 'softirq': 0.0, 'steal': 0.0}
+
+
+def test_zero_elapsed_read_returns_previous_result():
+    proc_root, sampler = make_sampler(FIRST)
+    write_stat(proc_root, SECOND)
+    result = sampler.sample()
+
+    # Same counters again (two reads within one clock tick): no division by zero
+    assert sampler.sample() is result
+
+    fresh = ProcStatCPUSampler(proc_root)
+    assert fresh.sample() is None  # No previous result to fall back on yet
+
+
+def test_offline_core_does_not_shift_others():
+    proc_root, sampler = make_sampler(
+        "cpu  300 0 0 2700 0 0 0 0\n"
+        "cpu0 100 0 0 900 0 0 0 0\n"
+        "cpu1 100 0 0 900 0 0 0 0\n"
+        "cpu2 100 0 0 900 0 0 0 0\n")
+    # cpu1 went offline; cpu0 idle, cpu2 fully busy
+    write_stat(proc_root,
+               "cpu  500 0 0 2900 0 0 0 0\n"
+               "cpu0 100 0 0 1100 0 0 0 0\n"
+               "cpu2 300 0 0 900 0 0 0 0\n")
+    result = sampler.sample()
+    assert result.per_core_usage == [0.0, 0.0, 100.0]
+
+    # Back online: no delta for it on this tick, the others keep their slots
+    write_stat(proc_root,
+               "cpu  800 0 0 3200 0 0 0 0\n"
+               "cpu0 200 0 0 1200 0 0 0 0\n"
+               "cpu1 100 0 0 900 0 0 0 0\n"
+               "cpu2 500 0 0 900 0 0 0 0\n")
+    assert sampler.sample().per_core_usage == [50.0, 0.0, 100.0]
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - /proc/stat CPU Sampler Tests")
+    test_total_per_core_and_per_state()
+    test_zero_elapsed_read_returns_previous_result()
+    test_offline_core_does_not_shift_others()
+    print("✅ /proc/stat CPU sampler tests passed")
@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Block Device IO Test Script
+/proc/diskstats rates and /sys/class/block topology on a fixture tree
+"""
+
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+from monitoring.diskstats import DiskStatsSampler
+
+
+def write_diskstats(proc_root, sda1_reads, sda1_sectors_read, sda1_io_ms):
+    with open(os.path.join(proc_root, 'diskstats'), 'w') as f:
+        f.write(f"   8       0 sda {sda1_reads} 0 {sda1_sectors_read} 10 0 0 0 0 0 {sda1_io_ms} 10 0 0 0 0\n")
+        f.write(f"   8       1 sda1 {sda1_reads} 0 {sda1_sectors_read} {sda1_reads * 2} 0 0 0 0 0 {sda1_io_ms} 10 0 0 0 0\n")
+        f.write("  253       0 dm-0 5 0 40 1 0 0 0 0 0 1 1 0 0 0 0\n")
+        f.write("   7       0 loop0 0 0 0 0 0 0 0 0 0 0 0 0 0 0 0\n")
+
+
+def make_tree():
+    root = tempfile.mkdtemp(prefix='hoof-hearted-block-')
+    proc_root = os.path.join(root, 'proc')
+    sys_root = os.path.join(root, 'sys')
+    devices = os.path.join(sys_root, 'devices', 'pci0000:00', 'block', 'sda')
+    block = os.path.join(sys_root, 'class', 'block')
+    os.makedirs(proc_root)
+    os.makedirs(os.path.join(devices, 'sda1'))
+    os.makedirs(block)
+    os.makedirs(os.path.join(sys_root, 'devices', 'virtual', 'block', 'dm-0', 'dm'))
+    os.makedirs(os.path.join(sys_root, 'devices', 'virtual', 'block', 'dm-0', 'slaves', 'sda1'))
+    os.makedirs(os.path.join(sys_root, 'devices', 'virtual', 'block', 'loop0'))
+
+    open(os.path.join(devices, 'sda1', 'partition'), 'w').write("1\n")
+    open(os.path.join(sys_root, 'devices', 'virtual', 'block', 'dm-0', 'dm', 'name'), 'w').write("cryptdata\n")
+    os.symlink(devices, os.path.join(block, 'sda'))
+    os.symlink(os.path.join(devices, 'sda1'), os.path.join(block, 'sda1'))
+    for name in ('dm-0', 'loop0'):
+        os.symlink(os.path.join(sys_root, 'devices', 'virtual', 'block', name), os.path.join(block, name))
+    return proc_root, sys_root
+
+
+def test_topology_from_sys():
+    proc_root, sys_root = make_tree()
+    write_diskstats(proc_root, 100, 800, 50)
+    sampler = DiskStatsSampler(proc_root, sys_root)
+    devices = sampler.sample()
+
+    assert devices['8:1'].kind == 'partition' and devices['8:1'].parent == 'sda'
+    assert devices['253:0'].kind == 'dm' and devices['253:0'].display_name == 'cryptdata'
+    assert devices['253:0'].slaves == ['sda1']
+    assert devices['8:0'].kind == 'disk'
+    assert devices['8:1'].read_bytes_per_sec is None  # No baseline yet
+    assert 'loop0' not in [device.name for device in sampler.active_devices()]
+
+
+def test_rates_from_counter_deltas():
+    proc_root, sys_root = make_tree()
+    write_diskstats(proc_root, 100, 800, 50)
+    sampler = DiskStatsSampler(proc_root, sys_root)
+    sampler.sample()
+
+    # Pretend exactly one second passed since the baseline
+    counters, sampled_at = sampler._last_counters['sda1']
+    sampler._last_counters['sda1'] = (counters, sampled_at - 1.0)
+    write_diskstats(proc_root, 150, 1800, 550)
+    sda1 = sampler.sample()['8:1']
+
+    assert abs(sda1.read_iops - 50) < 1
+    assert abs(sda1.read_bytes_per_sec - 1000 * 512) < 10000
+    assert sda1.await_ms == 2.0  # 100 ms reading over 50 reads
+    assert 45 < sda1.utilization_percent <= 50.1
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - Block Device IO Tests")
+    test_topology_from_sys()
+    test_rates_from_counter_deltas()
+    print("✅ Block device IO tests passed")
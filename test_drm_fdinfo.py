@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - DRM fdinfo Test Script
+Per-process engine utilisation with incremental fd discovery
+"""
+
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+from monitoring.drm_fdinfo import FULL_RESCAN_EVERY, DRMFdinfoCollector, parse_fdinfo
+from monitoring.gpu_monitor import AMDMonitor
+
+PDEV = '0000:03:00.0'
+SELF = os.getpid()
+
+
+def amdgpu_fdinfo(client_id, gfx_ns, enc_ns=0, vram_kib=4194304):
+    return (f"pos:\t0\nflags:\t02100002\nmnt_id:\t24\nino:\t1234\n"
+            f"drm-driver:\tamdgpu\ndrm-pdev:\t{PDEV}\ndrm-client-id:\t{client_id}\n"
+            f"drm-memory-vram:\t{vram_kib} KiB\ndrm-memory-gtt:\t2048 KiB\ndrm-memory-cpu:\t0 KiB\n"
+            f"drm-engine-gfx:\t{gfx_ns} ns\ndrm-engine-enc:\t{enc_ns} ns\ndrm-engine-dec:\t0 ns\n")
+
+
+def add_fd(proc_root, pid, fd, target, fdinfo=None):
+    for name in ('fd', 'fdinfo'):
+        os.makedirs(os.path.join(proc_root, str(pid), name), exist_ok=True)
+    os.symlink(target, os.path.join(proc_root, str(pid), 'fd', str(fd)))
+    with open(os.path.join(proc_root, str(pid), 'fdinfo', str(fd)), 'w') as f:
+        f.write(fdinfo or "pos:\t0\nflags:\t02\nmnt_id:\t24\n")
+
+
+def make_proc_root():
+    proc_root = tempfile.mkdtemp(prefix='hoof-hearted-proc-')
+    os.makedirs(os.path.join(proc_root, 'self', 'fdinfo'))
+    # A game with the render node open, plus unrelated files
+    add_fd(proc_root, SELF, 0, '/dev/null')
+    add_fd(proc_root, SELF, 5, '/home/user/game.pak')
+    add_fd(proc_root, SELF, 9, '/dev/dri/renderD128', amdgpu_fdinfo(42, 0))
+    # Its forked helper inherited the same client - must not be counted twice
+    add_fd(proc_root, 999999, 3, '/dev/dri/renderD128', amdgpu_fdinfo(42, 0))
+    add_fd(proc_root, 999999, 4, 'socket:[5678]')
+    return proc_root
+
+
+def write_fdinfo(proc_root, pid, fd, content):
+    with open(os.path.join(proc_root, str(pid), 'fdinfo', str(fd)), 'w') as f:
+        f.write(content)
+
+
+def age_engine_counters(collector, seconds=1.0):
+    for key, (engines, timestamp) in list(collector._last_engines.items()):
+        collector._last_engines[key] = (engines, timestamp - int(seconds * 1_000_000_000))
+
+
+def test_parse_fdinfo():
+    client = parse_fdinfo(amdgpu_fdinfo(7, 1500, enc_ns=20).encode())
+    assert (client.driver, client.client_id, client.pdev) == ('amdgpu', '7', PDEV)
+    assert client.engines_ns == {'gfx': 1500, 'enc': 20, 'dec': 0}
+    assert client.vram_bytes() == 4 * 1024 * 1024 * 1024  # vram only, not gtt/cpu
+
+    xe = parse_fdinfo(b"drm-driver:\ti915\ndrm-pdev:\t0000:00:02.0\ndrm-client-id:\t3\n"
+                      b"drm-engine-render:\t100 ns\ndrm-engine-capacity-video:\t2\n"
+                      b"drm-total-system0:\t8 MiB\ndrm-resident-system0:\t6 MiB\n")
+    assert xe.engine_capacity == {'video': 2}
+    assert xe.vram_bytes() == 6 * 1024 * 1024  # Resident preferred over total
+    assert parse_fdinfo(b"pos:\t0\nflags:\t02\n") is None
+
+
+def test_engine_utilisation_from_deltas():
+    proc_root = make_proc_root()
+    collector = DRMFdinfoCollector(proc_root)
+    first = collector.collect()
+    assert [(usage.pid, usage.client_count, usage.engines) for usage in first] == [(SELF, 1, {})]
+
+    # Ten seconds of counters, so the real time between the two collects barely moves the result
+    age_engine_counters(collector, seconds=10.0)
+    write_fdinfo(proc_root, SELF, 9, amdgpu_fdinfo(42, 7_500_000_000, enc_ns=1_000_000_000))
+    write_fdinfo(proc_root, 999999, 3, amdgpu_fdinfo(42, 7_500_000_000, enc_ns=1_000_000_000))
+    usage = collector.collect()[0]
+    assert abs(usage.gpu_utilization - 75.0) < 1.0
+    assert abs(usage.encoder_utilization - 10.0) < 0.5
+    assert usage.memory_bytes == 4 * 1024 * 1024 * 1024
+
+
+def test_fd_discovery_is_incremental():
+    proc_root = make_proc_root()
+    collector = DRMFdinfoCollector(proc_root, discovery_interval=3600)
+    collector.collect()
+    assert collector.readlink_count == 5
+
+    # Ticks between discoveries only read fdinfo of the two DRM fds
+    for _ in range(3):
+        collector.collect()
+    assert (collector.readlink_count, collector.discovery_count, collector.fdinfo_reads) == (5, 1, 8)
+
+    # Next discovery: only the newly opened fd is resolved
+    add_fd(proc_root, SELF, 11, '/dev/dri/card1', amdgpu_fdinfo(43, 0))
+    collector._last_discovery = None
+    assert collector.collect()[0].client_count == 2
+    assert collector.readlink_count == 6
+
+    # Closed DRM fd: dropped without waiting for the next discovery
+    os.unlink(os.path.join(proc_root, str(SELF), 'fdinfo', '11'))
+    assert collector.collect()[0].client_count == 1
+    assert collector.get_stats()['drm_fds'] == 2
+
+    # Periodic full rescan catches fd numbers reused by a GPU client
+    collector.discovery_count = FULL_RESCAN_EVERY
+    collector._last_discovery = None
+    collector.collect()
+    assert collector.readlink_count == 6 + 6
+
+
+def test_amd_processes_from_fdinfo():
+    proc_root = make_proc_root()
+    sys_root = tempfile.mkdtemp(prefix='hoof-hearted-sys-')
+    device_dir = os.path.join(sys_root, 'devices', 'pci0000:00', PDEV)
+    os.makedirs(device_dir)
+    for name, value in {'vendor': '0x1002', 'gpu_busy_percent': 80,
+                        'mem_info_vram_used': 1 << 32, 'mem_info_vram_total': 1 << 34}.items():
+        with open(os.path.join(device_dir, name), 'w') as f:
+            f.write(f"{value}\n")
+    os.makedirs(os.path.join(sys_root, 'class', 'drm', 'card0'))
+    os.symlink(device_dir, os.path.join(sys_root, 'class', 'drm', 'card0', 'device'))
+
+    monitor = AMDMonitor(sys_root=sys_root, proc_root=proc_root)
+    monitor.get_gpu_metrics()
+    age_engine_counters(monitor._fdinfo)
+    write_fdinfo(proc_root, SELF, 9, amdgpu_fdinfo(42, 500_000_000))
+    gpu = monitor.get_gpu_metrics()[0]
+
+    assert [process.pid for process in gpu.processes] == [SELF]
+    process = gpu.processes[0]
+    assert process.gpu_memory_mb == 4096
+    assert abs(process.gpu_utilization - 50.0) < 1.0
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - DRM fdinfo Tests")
+    test_parse_fdinfo()
+    test_engine_utilisation_from_deltas()
+    test_fd_discovery_is_incremental()
+    test_amd_processes_from_fdinfo()
+    print("✅ DRM fdinfo tests passed")
@@ -0,0 +1,94 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - GPU Process Pool Test Script
+psutil handles reused across ticks, real cpu_percent, eviction on exit
+"""
+
+import os
+import subprocess
+import sys
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+import psutil
+
+from monitoring.gpu_monitor import ProcessClassifier
+from monitoring.gpu_process_pool import GPUProcessPool
+
+BUSY_LOOP = "import time\nend = time.time() + 30\nwhile time.time() < end: pass\n"
+
+
+class CountingClassifier:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self, name, command_line, executable_path):
+        self.calls += 1
+        return ProcessClassifier.classify_process(name, command_line, executable_path)
+
+
+def wait_for_exec(pid):
+    """cmdline is empty until the child has exec'd the interpreter"""
+    deadline = time.time() + 5
+    while not psutil.Process(pid).cmdline() and time.time() < deadline:
+        time.sleep(0.01)
+
+
+def test_handles_are_reused_and_cpu_is_real():
+    child = subprocess.Popen([sys.executable, '-c', BUSY_LOOP])
+    try:
+        wait_for_exec(child.pid)
+        classify = CountingClassifier()
+        pool = GPUProcessPool(classify)
+
+        pool.begin_tick()
+        entry, reading = pool.read(child.pid)
+        assert reading.first_seen and reading.cpu_percent is None
+        assert entry.identity.command_line.startswith(sys.executable)
+
+        for _ in range(3):
+            time.sleep(0.2)
+            pool.begin_tick()
+            _, reading = pool.read(child.pid)
+            # Same pid on a second GPU in the same tick: no second read
+            assert pool.read(child.pid)[1] is reading
+            pool.evict_unseen()
+
+        assert not reading.first_seen
+        assert reading.cpu_percent > 20.0  # A spinning interpreter, not the 0.0 of a fresh handle
+        assert (pool.open_count, classify.calls, len(pool)) == (1, 1, 1)
+    finally:
+        child.kill()
+        child.wait()
+
+
+def test_exited_processes_are_evicted():
+    child = subprocess.Popen([sys.executable, '-c', "import time; time.sleep(30)"])
+    pool = GPUProcessPool(ProcessClassifier.classify_process)
+    pool.begin_tick()
+    pool.read(child.pid)
+    child.kill()
+    child.wait()
+
+    pool.begin_tick()
+    try:
+        pool.read(child.pid)
+    except psutil.NoSuchProcess:
+        pass
+    else:
+        raise AssertionError("an exited process must not be read")
+    assert len(pool) == 0
+
+    # Processes that stop using the GPU are dropped at the end of the tick
+    pool.begin_tick()
+    pool.read(os.getpid())
+    pool.begin_tick()
+    assert pool.evict_unseen() == 1
+    assert len(pool) == 0
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - GPU Process Pool Tests")
+    test_handles_are_reused_and_cpu_is_real()
+    test_exited_processes_are_evicted()
+    print("✅ GPU process pool tests passed")
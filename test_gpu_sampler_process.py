@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Out-of-Process GPU Sampler Test Script
+A monitor that hangs in the driver must not hang the caller
+"""
+
+import functools
+import os
+import sys
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+import psutil
+
+from monitoring.gpu_monitor import GPUMetrics, GPUMonitor, GPUMonitoringService, GPUVendor
+from monitoring.gpu_sampler_process import STATE_RUNNING, STATE_STALE, ProcessGPUMonitor
+
+
+class HangingMonitor(GPUMonitor):
+    """Mock monitor that blocks like a wedged driver call while ``hang_flag`` exists"""
+
+    def __init__(self, hang_flag):
+        self.hang_flag = hang_flag
+
+    def is_available(self) -> bool:
+        return True
+
+    def get_gpu_count(self) -> int:
+        return 1
+
+    def get_driver_version(self):
+        return '550.54.14'
+
+    def get_gpu_metrics(self, gpu_id: int = None):
+        while os.path.exists(self.hang_flag):
+            time.sleep(3600)
+        return [GPUMetrics(gpu_id=0, name="Mock RTX", vendor=GPUVendor.NVIDIA, utilization_percent=42.0,
+                           memory_used_mb=1024, memory_total_mb=8192, memory_percent=12.5, temperature_c=55)]
+
+
+class FlakyMonitor(GPUMonitor):
+    """Mock monitor whose reads raise while ``fail_flag`` exists"""
+
+    def __init__(self, fail_flag):
+        self.fail_flag = fail_flag
+
+    def is_available(self) -> bool:
+        return True
+
+    def get_gpu_count(self) -> int:
+        if os.path.exists(self.fail_flag):
+            raise RuntimeError("NVML_ERROR_UNKNOWN")
+        return 1
+
+    def get_driver_version(self):
+        return '550.54.14'
+
+    def get_gpu_metrics(self, gpu_id: int = None):
+        return [GPUMetrics(gpu_id=0, name="Mock RTX", vendor=GPUVendor.NVIDIA, utilization_percent=42.0,
+                           memory_used_mb=1024, memory_total_mb=8192, memory_percent=12.5, temperature_c=55)]
+
+
+def crashing_monitor():
+    """Monitor factory for a child that dies on start-up, like a driver that crashes on init"""
+    raise RuntimeError("GPU has fallen off the bus")
+
+
+def wait_until(condition, timeout=20.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.02)
+    return condition()
+
+
+def is_dead(pid):
+    try:
+        return psutil.Process(pid).status() == psutil.STATUS_ZOMBIE
+    except psutil.NoSuchProcess:
+        return True
+
+
+def test_hung_sampler_is_killed_and_respawned():
+    hang_flag = os.path.join(tempfile.mkdtemp(prefix='hoof-hearted-gpu-'), 'hang')
+    monitor = ProcessGPUMonitor(functools.partial(HangingMonitor, hang_flag), interval=0.05, deadline=0.5)
+    monitor.start()
+    try:
+        assert monitor.wait_for_sample(20.0)
+        assert monitor.state == STATE_RUNNING
+        assert monitor.get_gpu_metrics()[0].utilization_percent == 42.0
+        hung_pid = monitor._process.pid
+
+        # The driver wedges: the watchdog kills the child and we answer from memory, marked stale
+        open(hang_flag, 'w').close()
+        assert wait_until(lambda: monitor.state == STATE_STALE)
+        started = time.monotonic()
+        gpus = monitor.get_gpu_metrics()
+        assert time.monotonic() - started < 0.1
+        assert [gpu.is_available for gpu in gpus] == [False]
+        assert monitor.is_available() and monitor.get_gpu_count() == 1
+        # Marked stale first, then killed - give the kill a moment
+        assert wait_until(lambda: is_dead(hung_pid))
+        assert monitor.kill_count >= 1
+
+        # Driver recovers: the respawned child delivers again
+        os.unlink(hang_flag)
+        assert wait_until(lambda: monitor.state == STATE_RUNNING)
+        assert monitor.get_gpu_metrics()[0].is_available
+        assert monitor.get_status()['restart_count'] >= 1
+    finally:
+        monitor.stop()
+
+
+def test_failed_read_reports_unavailable_without_restart():
+    fail_flag = os.path.join(tempfile.mkdtemp(prefix='hoof-hearted-gpu-'), 'fail')
+    monitor = ProcessGPUMonitor(functools.partial(FlakyMonitor, fail_flag), interval=0.05, deadline=0.5)
+    monitor.start()
+    try:
+        assert monitor.wait_for_sample(20.0) and monitor.is_available()
+
+        # One bad read: the child keeps running and reports the GPUs unavailable
+        open(fail_flag, 'w').close()
+        assert wait_until(lambda: not monitor.is_available())
+        assert monitor.state == STATE_RUNNING
+        assert monitor.get_gpu_count() == 1 and monitor.get_driver_version() == '550.54.14'
+
+        os.unlink(fail_flag)
+        assert wait_until(monitor.is_available)
+        assert monitor.spawn_count == 1 and monitor.kill_count == 0
+    finally:
+        monitor.stop()
+
+
+def test_crashing_sampler_restarts_with_backoff():
+    monitor = ProcessGPUMonitor(crashing_monitor, interval=0.05, deadline=0.5)
+    monitor.start()
+    try:
+        time.sleep(4.0)
+        # Restarted after 1s, then 2s - not a new interpreter every few milliseconds
+        assert 2 <= monitor.spawn_count <= 3
+        assert monitor.state == STATE_STALE
+        assert monitor._thread.is_alive()
+    finally:
+        monitor.stop()
+
+
+def test_service_reports_stale_sampler():
+    hang_flag = os.path.join(tempfile.mkdtemp(prefix='hoof-hearted-gpu-'), 'hang')
+    service = GPUMonitoringService(update_interval=0.05, out_of_process=True, sampler_deadline=0.5,
+                                   monitor_factory=functools.partial(HangingMonitor, hang_flag))
+    try:
+        summary = service.get_summary()
+        assert summary['monitoring_available'] and summary['sampler']['state'] == STATE_RUNNING
+
+        open(hang_flag, 'w').close()
+        assert wait_until(lambda: service.get_summary()['sampler']['state'] == STATE_STALE)
+        summary = service.get_summary()
+        assert not summary['monitoring_available']
+        assert summary['message'].startswith("GPU sampler stale")
+    finally:
+        os.unlink(hang_flag)
+        service.close()
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - Out-of-Process GPU Sampler Tests")
+    test_hung_sampler_is_killed_and_respawned()
+    test_failed_read_reports_unavailable_without_restart()
+    test_crashing_sampler_restarts_with_backoff()
+    test_service_reports_stale_sampler()
+    print("✅ Out-of-process GPU sampler tests passed")
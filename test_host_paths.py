@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Host Paths Test Script
+HOST_PROC / HOST_SYS send every collector to a host proc/sys tree on disk
+"""
+
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+import psutil
+
+from monitoring.host_paths import HostPaths
+from monitoring.system_monitor import SystemMonitor
+
+MEMINFO = """MemTotal:       65536000 kB
+MemFree:        30000000 kB
+MemAvailable:   50000000 kB
+Buffers:          100000 kB
+Cached:          8000000 kB
+SwapCached:            0 kB
+Active:          9000000 kB
+Inactive:        6000000 kB
+SwapTotal:       2048000 kB
+SwapFree:        2048000 kB
+Shmem:            200000 kB
+Slab:             500000 kB
+SReclaimable:     300000 kB
+"""
+
+NET_DEV = """Inter-|   Receive                                                |  Transmit
+ face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed
+    lo: 100 1 0 0 0 0 0 0 100 1 0 0 0 0 0 0
+enp5s0: 9000000 9000 0 0 0 0 0 0 4000000 4000 0 0 0 0 0 0
+veth3c1f: 5000 50 0 0 0 0 0 0 6000 60 0 0 0 0 0 0
+"""
+
+MOUNTINFO = """1 0 259:2 / / rw,relatime shared:1 - ext4 /dev/nvme0n1p2 rw
+2 1 0:5 / /proc rw shared:2 - proc proc rw
+"""
+
+
+def write(root, path, content):
+    path = os.path.join(root, path)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, 'w') as f:
+        f.write(content)
+
+
+def write_process(proc, pid, name, rss_pages, cmdline):
+    write(proc, f"{pid}/stat", f"{pid} ({name}) S 0 {pid} {pid} 0 -1 4194560 100 0 0 0 "
+                               f"500 100 0 0 20 0 1 0 100 10485760 {rss_pages} "
+                               "18446744073709551615 1 1 0 0 0 0 0 0 0 0 0 0 17 0 0 0 0 0 0\n")
+    write(proc, f"{pid}/statm", f"2560 {rss_pages} 50 10 0 200 0\n")
+    write(proc, f"{pid}/cmdline", '\0'.join(cmdline) + '\0')
+
+
+def make_host_tree():
+    """A host's /proc and /sys as the container sees them under /host"""
+    host = tempfile.mkdtemp(prefix='hoof-hearted-host-')
+    proc = os.path.join(host, 'proc')
+    sys_root = os.path.join(host, 'sys')
+
+    stat = "cpu  100 0 100 1000 0 0 0 0 0 0\ncpu0 100 0 100 1000 0 0 0 0 0 0\nbtime 1700000000\n"
+    write(proc, 'stat', stat)
+    write(proc, 'self/stat', stat)
+    write(proc, 'meminfo', MEMINFO)
+    write(proc, 'vmstat', "pswpin 0\npswpout 0\n")
+    write(proc, 'filesystems', "nodev\tproc\n\text4\n")
+    write(proc, 'diskstats', "259 2 nvme0n1p2 100 0 800 10 50 0 400 5 0 20 15 0 0 0 0\n")
+    write(proc, '1/net/dev', NET_DEV)
+    write(proc, '1/net/sockstat', "TCP: inuse 12 orphan 0 tw 3\nUDP: inuse 2\n")
+    write(proc, '1/mountinfo', MOUNTINFO)
+    write_process(proc, 1, 'systemd', 100000, ['/sbin/init'])
+    write_process(proc, 4242, 'ollama', 2000000, ['/usr/bin/ollama', 'serve'])
+
+    for name, operstate in (('enp5s0', 'up'), ('veth3c1f', 'up'), ('lo', 'unknown')):
+        write(sys_root, f"class/net/{name}/flags", "0x1003\n")
+        write(sys_root, f"class/net/{name}/operstate", f"{operstate}\n")
+        write(sys_root, f"class/net/{name}/mtu", "1500\n")
+    write(sys_root, "class/net/enp5s0/speed", "2500\n")
+    os.makedirs(os.path.join(sys_root, 'class', 'block'))
+
+    return HostPaths(proc_root=proc, sys_root=sys_root, rootfs=host)
+
+
+def test_paths_from_env():
+    saved = {name: os.environ.pop(name, None) for name in ('HOST_PROC', 'HOST_SYS', 'HOST_ROOT')}
+    try:
+        default = HostPaths.from_env()
+        assert not default.host_mode
+        assert default.net_root == '/proc/net'
+        assert default.mountinfo_path == '/proc/self/mountinfo'
+
+        os.environ['HOST_PROC'] = '/host/proc'
+        os.environ['HOST_SYS'] = '/host/sys'
+        host = HostPaths.from_env()
+        assert host.host_mode
+        # PID 1's entries: /host/proc/net would resolve to our own network namespace
+        assert host.net_root == '/host/proc/1/net'
+        assert host.sys_class_net == '/host/sys/class/net'
+        assert host.host_path('/mnt/data') == '/mnt/data'
+        # No host / to statvfs through: the host's mountpoints would resolve inside the container
+        assert host.mountinfo_path == '/proc/self/mountinfo'
+
+        os.environ['HOST_ROOT'] = '/host/root'
+        assert HostPaths.from_env().mountinfo_path == '/host/proc/1/mountinfo'
+    finally:
+        for name, value in saved.items():
+            os.environ.pop(name, None)
+            if value is not None:
+                os.environ[name] = value
+
+
+def test_every_collector_reads_the_host_tree():
+    paths = make_host_tree()
+    saved_procfs = psutil.PROCFS_PATH
+    try:
+        monitor = SystemMonitor(host_paths=paths)
+        assert psutil.PROCFS_PATH == paths.proc_root
+
+        network = monitor.get_network_metrics()
+        assert set(network.interfaces) == {'enp5s0', 'veth3c1f'}
+        assert network.interfaces['enp5s0'].speed_mbps == 2500
+        assert network.interfaces['enp5s0'].addresses == []  # Container addresses never leak in
+        assert network.active_connections == 12 + 3 + 2
+
+        memory = monitor.get_memory_metrics()
+        assert memory.total_mb == 64000
+
+        disks = monitor.get_disk_metrics()
+        assert [disk.mountpoint for disk in disks] == ['/']
+        assert disks[0].device == '/dev/nvme0n1p2'
+
+        cpu = monitor.get_cpu_metrics(include_temperature=False)
+        assert cpu.thread_count >= 1
+
+        names = [process.name for process in monitor.get_process_rankings(10)['memory']]
+        assert names == ['ollama', 'systemd']
+    finally:
+        psutil.PROCFS_PATH = saved_procfs
+
+
+def test_host_proc_without_rootfs_reports_own_mounts():
+    paths = make_host_tree()
+    paths = HostPaths(proc_root=paths.proc_root, sys_root=paths.sys_root)
+    saved_procfs = psutil.PROCFS_PATH
+    try:
+        monitor = SystemMonitor(host_paths=paths)
+        assert monitor._mount_registry.mountinfo_path == '/proc/self/mountinfo'
+        disks = monitor.get_disk_metrics()
+        # Not the fixture host's /dev/nvme0n1p2, whose capacity we couldn't read
+        assert all(disk.device != '/dev/nvme0n1p2' for disk in disks)
+        assert all(disk.total_mb > 0 for disk in disks)
+    finally:
+        psutil.PROCFS_PATH = saved_procfs
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - Host Paths Tests")
+    test_paths_from_env()
+    test_every_collector_reads_the_host_tree()
+    test_host_proc_without_rootfs_reports_own_mounts()
+    print("✅ Host paths tests passed")
@@ -0,0 +1,103 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Network Interface Collector Test Script
+Per-interface rates from /proc/net/dev and a change-driven attribute cache
+"""
+
+import os
+import sys
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+from monitoring.interface_collector import InterfaceCollector, parse_net_dev
+
+NET_DEV_HEADER = """Inter-|   Receive                                                |  Transmit
+ face |bytes    packets errs drop fifo frame compressed multicast|bytes    packets errs drop fifo colls carrier compressed
+"""
+
+
+def net_dev(counters):
+    lines = [f"{name:>6}: {recv} {recv // 100} 0 0 0 0 0 0 {sent} {sent // 100} 0 0 0 0 0 0"
+             for name, (recv, sent) in counters.items()]
+    return NET_DEV_HEADER + "\n".join(lines) + "\n"
+
+
+def make_roots(interfaces):
+    net_root = tempfile.mkdtemp(prefix='hoof-hearted-proc-net-')
+    sys_class_net = tempfile.mkdtemp(prefix='hoof-hearted-sys-net-')
+    for name, (operstate, mtu, speed) in interfaces.items():
+        add_interface(sys_class_net, name, operstate, mtu, speed)
+    return net_root, sys_class_net
+
+
+def add_interface(sys_class_net, name, operstate, mtu, speed):
+    os.makedirs(os.path.join(sys_class_net, name))
+    for attribute, value in (('flags', '0x1003'), ('operstate', operstate), ('mtu', mtu), ('speed', speed)):
+        if value is not None:
+            with open(os.path.join(sys_class_net, name, attribute), 'w') as f:
+                f.write(f"{value}\n")
+
+
+def write_net_dev(net_root, counters):
+    with open(os.path.join(net_root, 'dev'), 'w') as f:
+        f.write(net_dev(counters))
+
+
+def test_parse_net_dev():
+    counters = parse_net_dev(net_dev({'eth0': (5000, 3000), 'veth1a2b': (100, 200)}).encode())
+    assert counters['eth0'] == (5000, 50, 3000, 30)
+    assert counters['veth1a2b'] == (100, 1, 200, 2)
+
+
+def test_per_interface_rates():
+    net_root, sys_class_net = make_roots({'eth0': ('up', 1500, 1000), 'veth0': ('lowerlayerdown', 1500, None)})
+    collector = InterfaceCollector(net_root, sys_class_net)
+
+    write_net_dev(net_root, {'eth0': (10000, 5000), 'veth0': (0, 0)})
+    first = collector.collect()
+    assert first['eth0'].bytes_recv_per_sec is None  # No baseline yet
+
+    time.sleep(0.05)
+    write_net_dev(net_root, {'eth0': (20000, 5000), 'veth0': (0, 0)})
+    second = collector.collect()
+    assert second['eth0'].bytes_recv_per_sec > 0
+    assert second['eth0'].bytes_sent_per_sec == 0
+    assert second['eth0'].info.speed_mbps == 1000
+    assert second['eth0'].info.mtu == 1500
+    assert second['eth0'].info.is_up
+    assert second['veth0'].info.speed_mbps is None
+    assert not second['veth0'].info.is_up  # Admin up, no carrier
+
+    # A re-created interface starts from zero - no negative rate
+    write_net_dev(net_root, {'eth0': (20000, 5000), 'veth0': (0, 0)})
+    collector._last_counters['veth0'] = (999, 999, 0.0)
+    assert collector.collect()['veth0'].bytes_sent_per_sec is None
+
+
+def test_attributes_refresh_only_when_interfaces_change():
+    net_root, sys_class_net = make_roots({'eth0': ('up', 1500, 1000)})
+    collector = InterfaceCollector(net_root, sys_class_net, info_interval=3600)
+
+    write_net_dev(net_root, {'eth0': (1, 1)})
+    for _ in range(5):
+        collector.collect()
+    assert collector.info_refresh_count == 1
+
+    # A container starts - its veth shows up in /sys/class/net
+    add_interface(sys_class_net, 'veth9f', 'up', 1500, None)
+    write_net_dev(net_root, {'eth0': (1, 1), 'veth9f': (0, 0)})
+    samples = collector.collect()
+    assert collector.info_refresh_count == 2
+    assert samples['veth9f'].info.mtu == 1500
+
+    collector.collect()
+    assert collector.info_refresh_count == 2
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - Network Interface Collector Tests")
+    test_parse_net_dev()
+    test_per_interface_rates()
+    test_attributes_refresh_only_when_interfaces_change()
+    print("✅ Network interface collector tests passed")
@@ -0,0 +1,86 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Mount Registry Test Script
+mountinfo parsing, real-filesystem filtering and bind-mount dedupe on fixture files
+"""
+
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+from monitoring.mount_registry import MountRegistry
+
+FILESYSTEMS = """nodev\tsysfs
+nodev\tproc
+nodev\ttmpfs
+\text4
+\txfs
+nodev\tfuse
+nodev\tzfs
+"""
+
+# Unraid-style: array disk, a bind mount of it, shfs user share, a zfs pool,
+# a mountpoint with a space and the usual pseudo filesystems
+MOUNTINFO = """22 1 8:1 / / rw,relatime shared:1 - ext4 /dev/sda1 rw
+23 22 0:21 / /proc rw,nosuid - proc proc rw
+24 22 0:22 / /sys rw,nosuid - sysfs sysfs rw
+25 22 0:23 / /run rw - tmpfs tmpfs rw
+30 22 8:17 / /mnt/disk1 rw,noatime shared:5 - xfs /dev/sdb1 rw
+31 22 8:17 /appdata /mnt/cache/appdata rw,noatime shared:5 - xfs /dev/sdb1 rw
+32 22 0:45 / /mnt/user rw - fuse.shfs shfs rw
+33 22 0:50 / /mnt/tank rw - zfs tank rw
+34 22 8:33 / /mnt/My\\040Backups rw - ext4 /dev/sdc1 rw
+"""
+
+
+def make_registry(**kwargs):
+    root = tempfile.mkdtemp(prefix='hoof-hearted-mounts-')
+    mountinfo_path = os.path.join(root, 'mountinfo')
+    filesystems_path = os.path.join(root, 'filesystems')
+    with open(mountinfo_path, 'w') as f:
+        f.write(MOUNTINFO)
+    with open(filesystems_path, 'w') as f:
+        f.write(FILESYSTEMS)
+    return MountRegistry(mountinfo_path, filesystems_path, **kwargs), mountinfo_path
+
+
+def test_filters_real_filesystems_and_dedupes_bind_mounts():
+    registry, _ = make_registry()
+    mounts = registry.mounts()
+
+    assert [m.mountpoint for m in mounts] == ['/', '/mnt/disk1', '/mnt/tank', '/mnt/My Backups']
+    assert mounts[1].device == '/dev/sdb1' and mounts[1].device_id == '8:17'
+    assert mounts[2].fstype == 'zfs'
+
+
+def test_mount_table_is_only_reparsed_when_due():
+    registry, mountinfo_path = make_registry(rescan_interval=3600)
+    registry.mounts()
+    registry.mounts()
+    assert registry.parse_count == 1
+
+    with open(mountinfo_path, 'a') as f:
+        f.write("40 22 8:49 / /mnt/disk2 rw - xfs /dev/sdd1 rw\n")
+    registry.rescan_interval = 0
+    assert '/mnt/disk2' in [m.mountpoint for m in registry.mounts()]
+    assert registry.generation == 2
+
+
+def test_capacity_is_cached_between_refreshes():
+    registry, _ = make_registry(capacity_interval=3600)
+    root_mount = registry.mounts()[0]
+
+    first = registry.capacity(root_mount)
+    second = registry.capacity(root_mount)
+    assert first is second
+    assert registry.statvfs_count == 1
+    assert first.total >= first.used
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - Mount Registry Tests")
+    test_filters_real_filesystems_and_dedupes_bind_mounts()
+    test_mount_table_is_only_reparsed_when_due()
+    test_capacity_is_cached_between_refreshes()
+    print("✅ Mount registry tests passed")
@@ -0,0 +1,134 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - nvidia-smi Stream Test Script
+BasicMonitor served from persistent nvidia-smi children (fake nvidia-smi script)
+"""
+
+import os
+import stat
+import sys
+import tempfile
+import time
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+from monitoring import nvidia_smi_stream
+from monitoring.gpu_monitor import BasicMonitor, GPUVendor
+from monitoring.nvidia_smi_stream import NvidiaSmiStream, parse_gpu_line, parse_process_line
+
+# Prints like nvidia-smi --format=csv,noheader,nounits -lms N; logs every start to spawns.log.
+# With FAKE_SMI_CRASH set, the first GPU query exits after three samples.
+FAKE_NVIDIA_SMI = '''#!{python}
+import os, sys, time
+here = os.path.dirname(os.path.abspath(__file__))
+with open(os.path.join(here, 'spawns.log'), 'a') as f:
+    f.write(sys.argv[1].split('=')[0] + '\\n')
+with open(os.path.join(here, 'spawns.log')) as f:
+    gpu_spawns = sum(1 for line in f if line.startswith('--query-gpu'))
+interval = int(sys.argv[sys.argv.index('-lms') + 1]) / 1000
+tick = 0
+while True:
+    tick += 1
+    if sys.argv[1].startswith('--query-gpu'):
+        if os.environ.get('FAKE_SMI_CRASH') and gpu_spawns == 1 and tick > 3:
+            sys.exit(1)
+        print(f"0, GPU-aaaa, NVIDIA GeForce RTX 4090, 00000000:01:00.0, 550.54.14, {{tick % 100}}, 8192, 24564, 61, 45, 310.52, 450.00, 2520, 2520, 10501")
+        print("1, GPU-bbbb, Tesla P4, 00000000:02:00.0, 550.54.14, 0, 0, 7680, 34, [N/A], 23.10, 75.00, 405, 405, 405")
+    else:
+        print(f"GPU-aaaa, {{os.environ['FAKE_SMI_PID']}}, /usr/bin/python3, 1024")
+    sys.stdout.flush()
+    time.sleep(interval)
+'''
+
+
+def make_fake_nvidia_smi():
+    directory = tempfile.mkdtemp(prefix='hoof-hearted-smi-')
+    path = os.path.join(directory, 'nvidia-smi')
+    with open(path, 'w') as f:
+        f.write(FAKE_NVIDIA_SMI.format(python=sys.executable))
+    os.chmod(path, os.stat(path).st_mode | stat.S_IXUSR)
+    os.environ['FAKE_SMI_PID'] = str(os.getpid())
+    return path
+
+
+def spawns(path):
+    with open(os.path.join(os.path.dirname(path), 'spawns.log')) as f:
+        return f.read().split()
+
+
+def wait_until(condition, timeout=10.0):
+    deadline = time.time() + timeout
+    while not condition() and time.time() < deadline:
+        time.sleep(0.02)
+    return condition()
+
+
+def test_parse_lines():
+    gpu = parse_gpu_line("1, GPU-bbbb, Tesla P4, 00000000:02:00.0, 550.54.14, 0, 0, 7680, 34, [N/A], "
+                         "[Not Supported], 75.00, 405, 405, 405\n")
+    assert (gpu.index, gpu.name, gpu.memory_total_mb, gpu.fan_speed_percent, gpu.power_draw_watts) == \
+        (1, 'Tesla P4', 7680, None, None)
+    assert parse_gpu_line("NVIDIA-SMI has failed because it couldn't communicate with the NVIDIA driver.") is None
+
+    process = parse_process_line("GPU-aaaa, 4242, /opt/game/bin/game.x86_64, 2048\n")
+    assert (process.gpu_uuid, process.pid, process.gpu_memory_mb) == ('GPU-aaaa', 4242, 2048)
+
+
+def test_basic_monitor_serves_from_one_stream():
+    path = make_fake_nvidia_smi()
+    monitor = BasicMonitor(command=path, interval_ms=50)
+    try:
+        assert monitor.get_gpu_count() == 2
+        assert monitor.get_driver_version() == '550.54.14'
+        assert wait_until(lambda: monitor.get_gpu_metrics()[0].processes)
+
+        for _ in range(20):
+            gpus = monitor.get_gpu_metrics()
+            monitor.get_gpu_count()
+        rtx, tesla = gpus
+        assert (rtx.vendor, rtx.memory_used_mb, rtx.temperature_c, rtx.power_draw_watts) == \
+            (GPUVendor.NVIDIA, 8192, 61, 310.52)
+        assert (tesla.fan_speed_percent, tesla.clock_memory_mhz) == (None, 405)
+        assert [(process.pid, process.gpu_memory_mb) for process in rtx.processes] == [(os.getpid(), 1024)]
+        assert tesla.processes == []
+
+        # Two nvidia-smi starts for the whole session, however often it is asked
+        assert sorted(spawns(path)) == ['--query-compute-apps', '--query-gpu']
+    finally:
+        monitor.close()
+
+
+def test_dead_child_is_restarted():
+    path = make_fake_nvidia_smi()
+    os.environ['FAKE_SMI_CRASH'] = '1'
+    restart_delay = nvidia_smi_stream.RESTART_DELAY_MIN
+    nvidia_smi_stream.RESTART_DELAY_MIN = 0.05
+    stream = NvidiaSmiStream(command=path, interval_ms=50)
+    try:
+        stream.start()
+        assert stream.wait_for_sample(5.0)
+        assert wait_until(lambda: stream.get_stats()['restart_count'] == 1)
+
+        # Samples keep coming from the replacement child
+        count = stream.sample_count
+        assert wait_until(lambda: stream.sample_count > count + 2)
+        assert len(stream.gpus()) == 2
+        assert spawns(path).count('--query-gpu') == 2
+    finally:
+        stream.stop()
+        nvidia_smi_stream.RESTART_DELAY_MIN = restart_delay
+        del os.environ['FAKE_SMI_CRASH']
+
+
+def test_no_nvidia_smi():
+    monitor = BasicMonitor(command='/nonexistent/nvidia-smi')
+    assert monitor.get_gpu_count() == 0
+    assert monitor.get_gpu_metrics() == []
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - nvidia-smi Stream Tests")
+    test_parse_lines()
+    test_basic_monitor_serves_from_one_stream()
+    test_dead_child_is_restarted()
+    test_no_nvidia_smi()
+    print("✅ nvidia-smi stream tests passed")
@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - NVML Device Cache Test Script
+Static GPU attributes are read once; ticks only query volatile fields
+"""
+
+import os
+import sys
+import threading
+from collections import Counter
+from types import SimpleNamespace
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+from monitoring.gpu_monitor import NVIDIAMonitor
+
+MB = 1024 * 1024
+
+
+class FakeNVMLError(Exception):
+    def __init__(self, value):
+        super().__init__(f"NVML error {value}")
+        self.value = value
+
+
+class FakeNVML:
+    """Just enough of pynvml for NVIDIAMonitor, counting every call"""
+    NVMLError = FakeNVMLError
+    NVML_TEMPERATURE_GPU = 0
+    NVML_ERROR_UNINITIALIZED = 1
+    NVML_ERROR_INVALID_ARGUMENT = 2
+    NVML_ERROR_NOT_SUPPORTED = 3
+    NVML_ERROR_NOT_FOUND = 6
+    NVML_ERROR_FUNCTION_NOT_FOUND = 13
+    NVML_ERROR_GPU_IS_LOST = 15
+
+    def __init__(self, gpu_count):
+        self.gpu_count = gpu_count
+        self.lost = set()
+        self.calls = Counter()
+        self.processes = {}  # handle -> [(pid, used bytes)]
+        self.threads = set()
+        self._lock = threading.Lock()
+
+    def __getattr__(self, name):
+        if name.startswith('_'):
+            raise AttributeError(name)
+        implementation = getattr(self, '_' + name)
+
+        def call(*args):
+            with self._lock:
+                self.calls[name] += 1
+                self.threads.add(threading.current_thread().name)
+            if args and args[0] in self.lost:
+                raise FakeNVMLError(self.NVML_ERROR_GPU_IS_LOST)
+            return implementation(*args)
+        return call
+
+    def _nvmlInit(self):
+        pass
+
+    def _nvmlDeviceGetCount(self):
+        return self.gpu_count
+
+    def _nvmlDeviceGetHandleByIndex(self, index):
+        return f"handle-{index}"
+
+    def _nvmlDeviceGetName(self, handle):
+        return b"NVIDIA GeForce RTX 4090"  # Older bindings return bytes
+
+    def _nvmlDeviceGetUUID(self, handle):
+        return f"GPU-{handle}"
+
+    def _nvmlDeviceGetPciInfo(self, handle):
+        return SimpleNamespace(busId=f"00000000:0{handle[-1]}:00.0")
+
+    def _nvmlDeviceGetMemoryInfo(self, handle):
+        return SimpleNamespace(used=6000 * MB, total=24000 * MB)
+
+    def _nvmlDeviceGetPowerManagementLimitConstraints(self, handle):
+        return (100000, 450000)
+
+    def _nvmlSystemGetDriverVersion(self):
+        return "550.54.14"
+
+    def _nvmlDeviceGetUtilizationRates(self, handle):
+        return SimpleNamespace(gpu=87, memory=40)
+
+    def _nvmlDeviceGetTemperature(self, handle, sensor):
+        return 71
+
+    def _nvmlDeviceGetFanSpeed(self, handle):
+        return 65
+
+    def _nvmlDeviceGetPowerUsage(self, handle):
+        return 320500
+
+    def _nvmlDeviceGetComputeRunningProcesses(self, handle):
+        return [SimpleNamespace(pid=pid, usedGpuMemory=used) for pid, used in self.processes.get(handle, [])]
+
+
+def make_monitor(fake, **kwargs):
+    real = sys.modules.get('pynvml')
+    sys.modules['pynvml'] = fake
+    try:
+        return NVIDIAMonitor(**kwargs)
+    finally:
+        if real is not None:
+            sys.modules['pynvml'] = real
+        else:
+            del sys.modules['pynvml']
+
+
+STATIC_CALLS = ('nvmlDeviceGetCount', 'nvmlDeviceGetHandleByIndex', 'nvmlDeviceGetName',
+                'nvmlDeviceGetUUID', 'nvmlDeviceGetPciInfo',
+                'nvmlDeviceGetPowerManagementLimitConstraints', 'nvmlSystemGetDriverVersion')
+
+
+def test_static_attributes_read_once():
+    fake = FakeNVML(gpu_count=8)
+    monitor = make_monitor(fake)
+    static_before = {name: fake.calls[name] for name in STATIC_CALLS}
+
+    for _ in range(10):
+        metrics = monitor.get_gpu_metrics()
+
+    assert {name: fake.calls[name] for name in STATIC_CALLS} == static_before
+    assert fake.calls['nvmlDeviceGetUtilizationRates'] == 80
+    assert monitor.get_gpu_count() == 8 and monitor.get_driver_version() == "550.54.14"
+    gpu = metrics[3]
+    assert (gpu.gpu_id, gpu.name, gpu.memory_total_mb, gpu.power_limit_watts) == (3, "NVIDIA GeForce RTX 4090", 24000, 450.0)
+    assert (gpu.utilization_percent, gpu.temperature_c, gpu.power_draw_watts) == (87, 71, 320.5)
+    assert monitor._devices[3].uuid == "GPU-handle-3"
+    assert monitor._devices[3].pci_bus_id == "00000000:03:00.0"
+
+
+def test_topology_reloaded_on_change():
+    fake = FakeNVML(gpu_count=2)
+    monitor = make_monitor(fake)
+    assert monitor.topology_load_count == 1
+
+    # A GPU fell off the bus: that tick fails, the next one reloads the device table
+    fake.lost.add("handle-1")
+    assert monitor.get_gpu_metrics() == []
+    fake.lost.clear()
+    fake.gpu_count = 1
+    assert len(monitor.get_gpu_metrics()) == 1
+    assert monitor.topology_load_count == 2
+
+    # Hot-plug is noticed by the periodic count check
+    fake.gpu_count = 3
+    monitor._last_topology_check -= NVIDIAMonitor.TOPOLOGY_CHECK_INTERVAL
+    assert len(monitor.get_gpu_metrics()) == 3
+    assert monitor.topology_load_count == 3
+
+
+def test_concurrent_devices_enrich_each_pid_once():
+    fake = FakeNVML(gpu_count=4)
+    # A data-parallel job on GPUs 0-2 plus its launcher on GPU 3
+    for index in range(3):
+        fake.processes[f"handle-{index}"] = [(os.getpid(), (index + 1) * 1000 * MB)]
+    fake.processes["handle-3"] = [(os.getppid(), 500 * MB)]
+    monitor = make_monitor(fake)
+    pool = monitor._process_pool
+
+    for tick in range(1, 4):
+        metrics = monitor.get_gpu_metrics()
+        assert pool.read_count == 2 * tick  # One psutil read per pid, not per GPU
+
+    assert [[(process.pid, process.gpu_memory_mb) for process in gpu.processes] for gpu in metrics] == \
+        [[(os.getpid(), 1000)], [(os.getpid(), 2000)], [(os.getpid(), 3000)], [(os.getppid(), 500)]]
+    assert pool.open_count == 2
+    assert any(name.startswith('hoof-hearted-nvml') for name in fake.threads)
+
+    # Serial mode gives the same answer without worker threads
+    serial_fake = FakeNVML(gpu_count=4)
+    serial_fake.processes = fake.processes
+    serial = make_monitor(serial_fake, concurrent_devices=False)
+    assert [gpu.processes[0].gpu_memory_mb for gpu in serial.get_gpu_metrics()] == [1000, 2000, 3000, 500]
+    assert not any(name.startswith('hoof-hearted-nvml') for name in serial_fake.threads)
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - NVML Device Cache Tests")
+    test_static_attributes_read_once()
+    test_topology_reloaded_on_change()
+    test_concurrent_devices_enrich_each_pid_once()
+    print("✅ NVML device cache tests passed")
@@ -0,0 +1,209 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Batched NVML Sampling Test Script
+Field-values batch, per-group fallback, remembered unsupported fields
+and incremental per-process utilization
+"""
+
+import os
+import sys
+from collections import Counter
+from types import SimpleNamespace
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+from monitoring.nvml_sampler import NVMLFieldSampler, ProcessUtilizationSampler
+
+MB = 1024 * 1024
+
+
+class FakeNVMLError(Exception):
+    def __init__(self, value):
+        super().__init__(f"NVML error {value}")
+        self.value = value
+
+
+class FakeNVML:
+    """pynvml stand-in: a datacenter GPU without fan or memory sensor"""
+    NVMLError = FakeNVMLError
+    NVML_TEMPERATURE_GPU = 0
+    NVML_CLOCK_GRAPHICS, NVML_CLOCK_SM, NVML_CLOCK_MEM = 0, 1, 2
+    NVML_PCIE_UTIL_TX_BYTES, NVML_PCIE_UTIL_RX_BYTES = 0, 1
+    NVML_ERROR_UNINITIALIZED = 1
+    NVML_ERROR_INVALID_ARGUMENT = 2
+    NVML_ERROR_NOT_SUPPORTED = 3
+    NVML_ERROR_NOT_FOUND = 6
+    NVML_ERROR_FUNCTION_NOT_FOUND = 13
+    NVML_ERROR_GPU_IS_LOST = 15
+    NVML_FI_DEV_MEMORY_TEMP = 82
+    NVML_FI_DEV_POWER_INSTANT = 186
+
+    def __init__(self, field_values=True, process_utilization=True):
+        self.field_values = field_values
+        self.process_utilization = process_utilization
+        self.calls = Counter()
+        self.lost = False
+        self.process_samples = []
+        self.cursors = []
+
+    def _call(self, name):
+        self.calls[name] += 1
+        if self.lost:
+            raise FakeNVMLError(self.NVML_ERROR_GPU_IS_LOST)
+
+    def nvmlDeviceGetFieldValues(self, handle, field_ids):
+        self._call('nvmlDeviceGetFieldValues')
+        if not self.field_values:
+            raise FakeNVMLError(self.NVML_ERROR_FUNCTION_NOT_FOUND)
+        results = []
+        for field_id in field_ids:
+            if field_id == self.NVML_FI_DEV_POWER_INSTANT:
+                results.append(SimpleNamespace(nvmlReturn=0, valueType=1, value=SimpleNamespace(uiVal=250000)))
+            else:
+                results.append(SimpleNamespace(nvmlReturn=self.NVML_ERROR_NOT_SUPPORTED, valueType=1,
+                                               value=SimpleNamespace(uiVal=0)))
+        return results
+
+    def nvmlDeviceGetUtilizationRates(self, handle):
+        self._call('nvmlDeviceGetUtilizationRates')
+        return SimpleNamespace(gpu=95, memory=60)
+
+    def nvmlDeviceGetMemoryInfo(self, handle):
+        self._call('nvmlDeviceGetMemoryInfo')
+        return SimpleNamespace(used=30000 * MB, total=80000 * MB)
+
+    def nvmlDeviceGetTemperature(self, handle, sensor):
+        self._call('nvmlDeviceGetTemperature')
+        return 64
+
+    def nvmlDeviceGetFanSpeed(self, handle):
+        self._call('nvmlDeviceGetFanSpeed')
+        raise FakeNVMLError(self.NVML_ERROR_NOT_SUPPORTED)
+
+    def nvmlDeviceGetPowerUsage(self, handle):
+        self._call('nvmlDeviceGetPowerUsage')
+        return 251000
+
+    def nvmlDeviceGetClockInfo(self, handle, clock):
+        self._call('nvmlDeviceGetClockInfo')
+        return (1755, 1755, 1593)[clock]
+
+    def nvmlDeviceGetCurrentClocksThrottleReasons(self, handle):
+        self._call('nvmlDeviceGetCurrentClocksThrottleReasons')
+        return 0x4 | 0x20
+
+    def nvmlDeviceGetProcessUtilization(self, handle, last_seen):
+        self._call('nvmlDeviceGetProcessUtilization')
+        self.cursors.append(last_seen)
+        if not self.process_utilization:
+            raise FakeNVMLError(self.NVML_ERROR_NOT_SUPPORTED)
+        samples = [sample for sample in self.process_samples if sample.timeStamp > last_seen]
+        if not samples:
+            raise FakeNVMLError(self.NVML_ERROR_NOT_FOUND)
+        return samples
+
+    # No nvmlDeviceGetPcieThroughput: bindings older than the call
+
+
+def process_sample(pid, seconds, sm, mem=0, enc=0, dec=0):
+    return SimpleNamespace(pid=pid, timeStamp=int(seconds * 1_000_000), smUtil=sm, memUtil=mem, encUtil=enc, decUtil=dec)
+
+
+def test_batch_and_fallbacks():
+    nvml = FakeNVML()
+    sampler = NVMLFieldSampler(nvml)
+    values = sampler.sample(0, 'handle-0')
+
+    assert values['power_draw_watts'] == 250.0  # From the batch, not nvmlDeviceGetPowerUsage
+    assert 'memory_temperature_c' not in values
+    assert (values['utilization_percent'], values['temperature_c']) == (95, 64)
+    assert values['memory_used_bytes'] == 30000 * MB
+    assert (values['clock_graphics_mhz'], values['clock_memory_mhz']) == (1755, 1593)
+    assert values['throttle_reasons'] == ['sw_power_cap', 'sw_thermal']
+    assert 'fan_speed_percent' not in values and 'pcie_tx_kbps' not in values
+    assert sampler.unsupported(0) == ['fan', 'pcie']
+    assert nvml.calls['nvmlDeviceGetPowerUsage'] == 0
+
+
+def test_unsupported_fields_not_retried():
+    nvml = FakeNVML()
+    sampler = NVMLFieldSampler(nvml)
+    for _ in range(10):
+        sampler.sample(0, 'handle-0')
+
+    assert nvml.calls['nvmlDeviceGetFanSpeed'] == 1
+    assert nvml.calls['nvmlDeviceGetFieldValues'] == 10
+    # Support is per device - a second GPU is probed on its own
+    sampler.sample(1, 'handle-1')
+    assert nvml.calls['nvmlDeviceGetFanSpeed'] == 2
+    sampler.reset()
+    sampler.sample(0, 'handle-0')
+    assert nvml.calls['nvmlDeviceGetFanSpeed'] == 3
+
+
+def test_without_field_values_api():
+    nvml = FakeNVML(field_values=False)
+    sampler = NVMLFieldSampler(nvml)
+    for _ in range(5):
+        values = sampler.sample(0, 'handle-0')
+
+    assert nvml.calls['nvmlDeviceGetFieldValues'] == 1
+    assert nvml.calls['nvmlDeviceGetPowerUsage'] == 5
+    assert values['power_draw_watts'] == 251.0
+    assert 'field_values' in sampler.unsupported(0)
+
+
+def test_lost_gpu_propagates():
+    nvml = FakeNVML()
+    sampler = NVMLFieldSampler(nvml)
+    nvml.lost = True
+    try:
+        sampler.sample(0, 'handle-0')
+    except FakeNVMLError as e:
+        assert e.value == FakeNVML.NVML_ERROR_GPU_IS_LOST
+    else:
+        raise AssertionError("a lost GPU must reach NVIDIAMonitor's topology handling")
+
+
+def test_process_utilization_is_incremental():
+    nvml = FakeNVML()
+    sampler = ProcessUtilizationSampler(nvml)
+    nvml.process_samples = [process_sample(100, 1.0, 80, mem=30), process_sample(200, 1.0, 5, enc=40),
+                            process_sample(100, 1.5, 90, mem=50)]
+    sampler.update(0, 'handle-0')
+    trainer = sampler.utilization(0, 100)
+    assert (trainer.sm_percent, trainer.memory_percent, trainer.sample_count) == (85.0, 40.0, 2)
+    assert sampler.utilization(0, 200).encoder_percent == 40.0
+
+    # Next tick passes the newest timestamp and only gets what is new
+    nvml.process_samples.append(process_sample(100, 2.0, 100))
+    sampler.update(0, 'handle-0')
+    assert nvml.cursors == [0, 1_500_000]
+    assert sampler.sample_count == 4
+    assert sampler.utilization(0, 100).sample_count == 3
+
+    # No new samples (NOT_FOUND) is not an error; the encoder process ages out of the window
+    sampler.update(0, 'handle-0')
+    nvml.process_samples.append(process_sample(100, 7.5, 50))
+    sampler.update(0, 'handle-0')
+    assert sampler.utilization(0, 200) is None
+    assert sampler.utilization(0, 100).sm_percent == 50.0
+    assert sampler.utilization(1, 100) is None
+
+
+def test_process_utilization_unsupported():
+    nvml = FakeNVML(process_utilization=False)
+    sampler = ProcessUtilizationSampler(nvml)
+    for _ in range(3):
+        sampler.update(0, 'handle-0')
+    assert nvml.calls['nvmlDeviceGetProcessUtilization'] == 1
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - Batched NVML Sampling Tests")
+    test_batch_and_fallbacks()
+    test_unsupported_fields_not_retried()
+    test_without_field_values_api()
+    test_lost_gpu_propagates()
+    test_process_utilization_is_incremental()
+    test_process_utilization_unsupported()
+    print("✅ Batched NVML sampling tests passed")
@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Process Classifier Test Script
+The compiled single-pass engine must pick the same category and pattern
+as trying each pattern with re.search in priority order
+"""
+
+import os
+import re
+import sys
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+from monitoring.gpu_monitor import ProcessClassifier
+from monitoring.process_classifier import ClassificationEngine
+from monitoring.system_monitor import SystemProcessClassifier
+
+# Names and command lines that match more than one category or pattern
+OVERLAPPING = [
+    ("python", "python -m jupyter notebook --ip 0.0.0.0", "/usr/bin/python"),
+    ("jupyter-lab", "jupyter-lab --allow-root /srv/python/train", "/opt/conda/bin/jupyter-lab"),
+    ("python3", "python3 train.py --model resnet50 --gpu 0", "/usr/bin/python3"),
+    ("Plex Transcoder", "/usr/lib/plexmediaserver/Plex Transcoder -codec:0 h264 -f ffmpeg", ""),
+    ("ffmpeg", "/config/plex/Library/ffmpeg -i movie.mkv -c:v hevc_nvenc out.mkv", "/usr/lib/jellyfin-ffmpeg/ffmpeg"),
+    ("docker", "docker run --gpus all pytorch/pytorch python train.py", "/usr/bin/docker"),
+    ("containerd-shim", "/usr/bin/containerd-shim-runc-v2 -namespace moby -id 3f2a xmrig", ""),
+    ("steam", "steam -silent steamwebhelper game.exe", "/home/user/.steam/steam.exe"),
+    ("blender", "blender -b scene.blend -E CYCLES -- --cycles-device CUDA", "/opt/blender/blender"),
+    ("obs", "obs --startstreaming --minimize-to-tray", "/usr/bin/obs"),
+    ("rsync", "rsync -avz /mnt/user/backup /mnt/disk1", "/usr/bin/rsync"),
+    ("make", "make -j32 build kernel", "/usr/bin/make"),
+    ("postgres", "postgres: docker 172.18.0.3(51234) idle", "/usr/lib/postgresql/15/bin/postgres"),
+    ("systemd", "/sbin/init splash", "/usr/lib/systemd/systemd"),
+    ("nginx", "nginx: worker process", "/usr/sbin/nginx"),
+]
+
+
+def legacy_search(categories, text):
+    """The original ordered loop: first pattern, by category then list order, that re.search finds"""
+    for category_index, patterns in enumerate(categories):
+        for pattern_index, pattern in enumerate(patterns):
+            if re.search(pattern, text, re.IGNORECASE):
+                return (category_index, pattern_index)
+    return None
+
+
+def test_engine_matches_legacy_priority_order():
+    for classifier in (ProcessClassifier, SystemProcessClassifier):
+        engine = classifier.get_engine()
+        for process in OVERLAPPING:
+            text = ClassificationEngine.normalise(*process)
+            assert engine.search(text) == legacy_search(engine.categories, text), (classifier.__name__, process)
+
+
+def test_priority_between_categories():
+    classify = ProcessClassifier.classify_process
+    assert classify(*OVERLAPPING[0])['process_type'] == 'ml'          # python + jupyter
+    assert classify(*OVERLAPPING[3])['process_type'] == 'video'       # ffmpeg inside a Plex path
+    assert classify(*OVERLAPPING[5])['process_type'] == 'ml'          # docker-wrapped training job
+    assert classify(*OVERLAPPING[6])['process_type'] == 'mining'      # miners outrank everything
+
+    system = SystemProcessClassifier.classify_process
+    assert system(*OVERLAPPING[5])['process_type'] == 'ml'            # GPU categories before 'development'
+    assert system(*OVERLAPPING[12])['process_type'] == 'development'  # 'docker' before 'postgres'
+
+
+def test_memo_hit_returns_same_result():
+    engine = ClassificationEngine(ProcessClassifier.category_patterns(), memo_size=16)
+    text = ClassificationEngine.normalise(*OVERLAPPING[4])
+    first = engine.search(text)
+    hits = engine.cache_info().hits
+    assert engine.search(text) == first == legacy_search(engine.categories, text)
+    assert engine.cache_info().hits == hits + 1
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - Process Classifier Tests")
+    test_engine_matches_legacy_priority_order()
+    test_priority_between_categories()
+    test_memo_hit_returns_same_result()
+    print("✅ Process classifier tests passed")
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Process Scanner Test Script
+Direct /proc scanning and the (pid, start time) identity cache on a fake /proc tree
+"""
+
+import os
+import sys
+import tempfile
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+from monitoring.process_cache import ProcessIdentity, ProcessIdentityCache
+from monitoring.process_scanner import ProcProcessScanner, TopKSelector
+
+
+def write_process(root, pid, name, cpu_ticks, start_ticks, rss_pages, cmdline):
+    pid_dir = os.path.join(root, str(pid))
+    os.makedirs(pid_dir, exist_ok=True)
+    with open(os.path.join(pid_dir, 'stat'), 'w') as f:
+        f.write(f"{pid} ({name}) R 1 {pid} {pid} 0 -1 4194560 100 0 0 0 "
+                f"{cpu_ticks} 0 0 0 20 0 1 0 {start_ticks} 10485760 {rss_pages} "
+                "18446744073709551615 1 1 0 0 0 0 0 0 0 0 0 0 17 0 0 0 0 0 0\n")
+    with open(os.path.join(pid_dir, 'statm'), 'w') as f:
+        f.write(f"2560 {rss_pages} 50 10 0 200 0\n")
+    with open(os.path.join(pid_dir, 'cmdline'), 'wb') as f:
+        f.write('\0'.join(cmdline).encode() + b'\0')
+
+
+def make_proc_root():
+    root = tempfile.mkdtemp(prefix='hoof-hearted-proc-')
+    os.makedirs(os.path.join(root, 'self'))
+    for path in ('stat', os.path.join('self', 'stat')):
+        with open(os.path.join(root, path), 'w') as f:
+            f.write("cpu  1 0 1 10 0 0 0 0 0 0\nbtime 1700000000\n")
+    with open(os.path.join(root, 'meminfo'), 'w') as f:
+        f.write("MemTotal:        1024000 kB\n")
+    return root
+
+
+def test_scan_parses_stat_and_statm():
+    root = make_proc_root()
+    write_process(root, 42, "weird) name", 100, 5000, 256, ["/usr/bin/weird", "--flag"])
+
+    scanner = ProcProcessScanner(proc_root=root)
+    samples = scanner.scan()
+
+    assert len(samples) == 1
+    sample = samples[0]
+    assert sample.pid == 42
+    assert sample.name == "weird) name"
+    assert sample.status == 'running'
+    assert sample.memory_rss_bytes == 256 * os.sysconf('SC_PAGE_SIZE')
+    assert sample.create_time == 1700000000 + 5000 / os.sysconf('SC_CLK_TCK')
+    assert scanner.read_cmdline(42) == ["/usr/bin/weird", "--flag"]
+
+
+def test_cpu_percent_from_jiffy_deltas():
+    root = make_proc_root()
+    write_process(root, 7, "busy", 100, 5000, 10, ["busy"])
+    scanner = ProcProcessScanner(proc_root=root)
+
+    assert scanner.scan()[0].cpu_percent == 0.0  # No baseline yet
+
+    write_process(root, 7, "busy", 100 + os.sysconf('SC_CLK_TCK'), 5000, 10, ["busy"])
+    assert scanner.scan()[0].cpu_percent > 0.0
+
+    # Same pid, new start time: a different process, so no delta is carried over
+    write_process(root, 7, "busy", 999999, 6000, 10, ["busy"])
+    assert scanner.scan()[0].cpu_percent == 0.0
+
+
+def test_identity_cache_evicts_exited_and_reused_pids():
+    cache = ProcessIdentityCache()
+    loads = []
+
+    def loader(pid, name):
+        def load():
+            loads.append(pid)
+            return ProcessIdentity(pid, name, name, "", None, {'process_type': 'unknown'})
+        return load
+
+    cache.get_or_load((1, 100), loader(1, "init"))
+    cache.get_or_load((2, 200), loader(2, "old"))
+    cache.get_or_load((1, 100), loader(1, "init"))
+    assert loads == [1, 2]
+
+    # pid 2 was reused by a new process, pid 3 is brand new
+    assert cache.retain({(1, 100), (2, 300), (3, 400)}) == 1
+    assert cache.get_or_load((2, 300), loader(2, "new")).name == "new"
+    assert len(cache) == 2
+
+
+def test_top_k_selector_keeps_each_ranking_bounded():
+    selector = TopKSelector(3, {
+        'cpu': lambda item: item[0],
+        'memory': lambda item: item[1]
+    }, admit=lambda ranking, item: ranking != 'memory' or item[1] > 0)
+
+    items = [(cpu, (cpu * 7) % 11) for cpu in range(100)]
+    for item in items:
+        selector.offer(item)
+
+    assert selector.winners('cpu') == sorted(items, reverse=True)[:3]
+    assert [item[1] for item in selector.winners('memory')] == [10, 10, 10]
+    assert len(selector.all_winners()) <= 6
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - Process Scanner Tests")
+    test_scan_parses_stat_and_statm()
+    test_cpu_percent_from_jiffy_deltas()
+    test_identity_cache_evicts_exited_and_reused_pids()
+    test_top_k_selector_keeps_each_ranking_bounded()
+    print("✅ Process scanner tests passed")
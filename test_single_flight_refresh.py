@@ -0,0 +1,173 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Single-Flight Refresh Stress Test
+50 concurrent callers hit an expired cache - exactly one collection may run
+"""
+
+import os
+import sys
+import time
+import threading
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+from monitoring.system_monitor import SystemMonitor, CPUMetrics, MemoryMetrics, NetworkMetrics
+from monitoring.gpu_monitor import GPUMonitoringService, GPUMetrics, GPUVendor
+
+CALLERS = 50
+
+
+def run_concurrently(target, callers: int = CALLERS):
+    """Release all callers at once and collect their results"""
+    barrier = threading.Barrier(callers)
+    results = [None] * callers
+
+    def worker(index):
+        barrier.wait()
+        results[index] = target()
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(callers)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+class QueueCountingLock:
+    """Lock that counts the callers that have queued on it"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counter_lock = threading.Lock()
+        self.queued = 0
+
+    def __enter__(self):
+        with self._counter_lock:
+            self.queued += 1
+        self._lock.acquire()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._lock.release()
+
+
+class SlowSystemMonitor(SystemMonitor):
+    """SystemMonitor whose collectors are slow stubs that count their invocations"""
+    # The gated CPU collector must not hit its deadline while the test holds it
+    COLLECTOR_TIMEOUTS = dict(SystemMonitor.COLLECTOR_TIMEOUTS, cpu=10.0)
+
+    def __init__(self):
+        super().__init__(update_interval=60.0)
+        self.cpu_calls = 0
+        self.cpu_started = threading.Event()
+        self.cpu_gate = threading.Event()
+        self.cpu_gate.set()
+
+    def get_cpu_metrics(self, include_temperature: bool = True):
+        self.cpu_calls += 1
+        self.cpu_started.set()
+        self.cpu_gate.wait(5.0)
+        time.sleep(0.05)
+        return CPUMetrics(10.0, [10.0], None, None, None, None, 1, 1)
+
+    def _get_cpu_temperature(self):
+        return None
+
+    def get_memory_metrics(self):
+        return MemoryMetrics(1024, 512, 512, 50.0, 512, 0, 0, 0.0, 0)
+
+    def get_storage_metrics(self):
+        return {'disks': [], 'block_devices': []}
+
+    def get_network_metrics(self):
+        return NetworkMetrics({}, 0, 0, 0)
+
+    def get_process_rankings(self, limit: int = 10):
+        return {'cpu': [], 'memory': [], 'io': [], 'containers': []}
+
+    def get_cgroup_metrics(self):
+        return []
+
+
+class CountingGPUMonitor:
+    """Fake GPU monitor that counts collections"""
+
+    def __init__(self):
+        self.calls = 0
+
+    def is_available(self):
+        return True
+
+    def get_gpu_count(self):
+        return 1
+
+    def get_gpu_metrics(self, gpu_id=None):
+        self.calls += 1
+        time.sleep(0.05)
+        return [GPUMetrics(0, "Fake GPU", GPUVendor.NVIDIA, 42.0, 1024, 8192, 12.5)]
+
+    def get_driver_version(self):
+        return "fake"
+
+
+def test_system_metrics_single_flight():
+    monitor = SlowSystemMonitor()
+
+    results = run_concurrently(monitor.get_system_metrics)
+
+    assert monitor.cpu_calls == 1
+    assert monitor.collection_count == 1
+    assert all(result is results[0] for result in results)
+
+
+def test_system_metrics_forced_callers_coalesce():
+    monitor = SlowSystemMonitor()
+    monitor.get_system_metrics()
+
+    monitor._refresh_lock = QueueCountingLock()
+
+    # Hold a forced refresh inside its CPU collector
+    monitor.cpu_started.clear()
+    monitor.cpu_gate.clear()
+    in_flight = []
+    refresher = threading.Thread(target=lambda: in_flight.append(monitor.get_system_metrics(force_update=True)))
+    refresher.start()
+    assert monitor.cpu_started.wait(5.0)
+
+    # Release the forced callers together and let them all queue behind it
+    results = []
+    callers = threading.Thread(
+        target=lambda: results.extend(run_concurrently(lambda: monitor.get_system_metrics(force_update=True))))
+    callers.start()
+    deadline = time.time() + 5.0
+    while monitor._refresh_lock.queued < 1 + CALLERS and time.time() < deadline:
+        time.sleep(0.01)
+    assert monitor._refresh_lock.queued == 1 + CALLERS
+
+    monitor.cpu_gate.set()
+    refresher.join()
+    callers.join()
+
+    # Forced callers that queued behind the in-flight refresh reuse its result
+    assert monitor.collection_count == 2
+    assert monitor.cpu_calls == 2
+    assert all(result is in_flight[0] for result in results)
+
+
+def test_gpu_metrics_single_flight():
+    service = GPUMonitoringService(update_interval=60.0)
+    service.monitor = CountingGPUMonitor()
+
+    results = run_concurrently(service.get_gpu_metrics)
+
+    assert service.monitor.calls == 1
+    assert service.collection_count == 1
+    assert all(result is results[0] for result in results)
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - Single-Flight Refresh Stress Test")
+    test_system_metrics_single_flight()
+    test_system_metrics_forced_callers_coalesce()
+    test_gpu_metrics_single_flight()
+    print(f"✅ {CALLERS} concurrent callers triggered exactly one collection")
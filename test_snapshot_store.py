@@ -0,0 +1,105 @@
+#!/usr/bin/env python3
+"""
+🐎 Hoof Hearted - Metrics Sampler Test Script
+A failing GPU collection must not stop system snapshots from being published
+"""
+
+import os
+import sys
+from types import SimpleNamespace
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), 'src', 'backend'))
+
+from monitoring.gpu_monitor import GPUMetrics, GPUMonitor, GPUMonitoringService, GPUVendor
+from monitoring.snapshot_store import MetricsSampler, SnapshotStore
+
+
+class StubSystemMonitor:
+    """Just enough of SystemMonitor for MetricsSampler"""
+    COLLECTORS = ('cpu', 'memory')
+
+    def __init__(self):
+        self.refreshes = 0
+
+    def refresh_collectors(self, names):
+        self.refreshes += 1
+        return SimpleNamespace(containers=[], refreshes=self.refreshes)
+
+    def get_collector_value(self, name):
+        return None
+
+    def tag_gpu_processes(self, gpu_metrics):
+        pass
+
+    def get_summary(self, metrics=None):
+        return {'monitoring_available': True, 'refreshes': metrics.refreshes}
+
+
+def gpu(temperature_c=None):
+    return GPUMetrics(gpu_id=0, name="Radeon RX 7900 XTX", vendor=GPUVendor.AMD, utilization_percent=30.0,
+                      memory_used_mb=2048, memory_total_mb=24576, memory_percent=8.3, temperature_c=temperature_c)
+
+
+class StubGPUMonitor(GPUMonitor):
+    def __init__(self, metrics):
+        self.metrics = metrics
+
+    def is_available(self):
+        return True
+
+    def get_gpu_count(self):
+        return len(self.metrics)
+
+    def get_gpu_metrics(self, gpu_id: int = None):
+        return self.metrics
+
+    def get_driver_version(self):
+        return None
+
+
+class FlakyGPUService:
+    """GPU service whose summary starts failing after the first tick"""
+
+    def __init__(self):
+        self.fail = False
+
+    def is_available(self):
+        return True
+
+    def get_gpu_metrics(self, force_update=False):
+        return [gpu(temperature_c=60)]
+
+    def get_summary(self, metrics=None):
+        if self.fail:
+            raise RuntimeError("driver went away")
+        return {'monitoring_available': True, 'gpu_count': len(metrics)}
+
+
+def test_gpu_without_temperature_still_publishes():
+    service = GPUMonitoringService(monitor_factory=lambda: StubGPUMonitor([gpu(temperature_c=None)]))
+    sampler = MetricsSampler(StubSystemMonitor(), service, SnapshotStore())
+
+    snapshot = sampler.sample_once()
+    assert sampler.store.latest() is snapshot
+    assert snapshot.gpu_summary['max_temperature'] is None
+    assert snapshot.gpu_summary['gpu_count'] == 1
+
+
+def test_failing_gpu_service_keeps_last_gpu_values():
+    service = FlakyGPUService()
+    sampler = MetricsSampler(StubSystemMonitor(), service, SnapshotStore())
+    first = sampler.sample_once()
+    assert first.gpu_summary == {'monitoring_available': True, 'gpu_count': 1}
+
+    service.fail = True
+    second = sampler.sample_once()
+    assert second.version == first.version + 1
+    assert second.system_summary['refreshes'] == 2  # System part is fresh
+    assert second.gpu_summary == first.gpu_summary and second.gpus == first.gpus
+    assert sampler.gpu_error_count == 1 and sampler.error_count == 0
+
+
+if __name__ == "__main__":
+    print("🐎 Hoof Hearted - Metrics Sampler Tests")
+    test_gpu_without_temperature_still_publishes()
+    test_failing_gpu_service_keeps_last_gpu_values()
+    print("✅ Metrics sampler tests passed")